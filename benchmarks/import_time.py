@@ -0,0 +1,58 @@
+"""
+Time importing fantasyopt modules in a fresh interpreter
+
+Usage: python -m benchmarks.import_time [modules...]
+"""
+import json
+import subprocess
+import sys
+
+DEFAULT_MODULES = ['fantasyopt', 'fantasyopt.loader.yahoo',
+                   'fantasyopt.service', 'fantasyopt.pool',
+                   'fantasyopt.loader.yahoo.nfl', 'fantasyopt.optimizer.dfs',
+                   'fantasyopt.jobs']
+# dependencies whose import dominates startup
+HEAVY_MODULES = ['numpy', 'pandas', 'pulp']
+
+
+def import_time(module, repeat=5):
+    """
+    Measure the cumulative import time of a module with python -X importtime
+
+    :param module: name of the module to import
+    :param repeat: number of fresh interpreters to measure
+    :return: tuple of (best import time in seconds, list of HEAVY_MODULES
+        imported along with module)
+    :raises RuntimeError: if module fails to import or the report has no
+        line for it, with the interpreter's stderr
+    """
+    code = 'import json, sys, {}; print(json.dumps([m for m in {!r} ' \
+           'if m in sys.modules]))'.format(module, HEAVY_MODULES)
+    best = None
+    for i in range(repeat):
+        process = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', code],
+            capture_output=True, text=True)
+        # the last line of the report is the top-level import of module
+        cumulative = None
+        for line in process.stderr.splitlines():
+            fields = line.split('|')
+            if len(fields) == 3 and fields[2].strip() == module:
+                cumulative = int(fields[1]) / 1e6
+        if process.returncode != 0 or cumulative is None:
+            raise RuntimeError('No import time reported for ' + module +
+                               ':\n' + process.stderr)
+        best = cumulative if best is None else min(best, cumulative)
+    return best, json.loads(process.stdout)
+
+
+def main(modules):
+    print('{:<32} {:>10}  {}'.format('module', 'time (s)', 'heavy imports'))
+    for module in modules:
+        seconds, heavy = import_time(module)
+        print('{:<32} {:>10.4f}  {}'.format(module, seconds,
+                                            ', '.join(heavy) or '-'))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:] or DEFAULT_MODULES)
@@ -0,0 +1,64 @@
+"""
+Time loading a synthetic Yahoo NFL csv with row-wise and vectorized
+transforms, and from a DataFrameCache
+
+Usage: python -m benchmarks.loader [rows]
+"""
+import os
+import sys
+import tempfile
+import timeit
+
+from fantasyopt import SITE_DEFAULTS, Player, Site
+from fantasyopt.loader.base import PlayerLoader
+from fantasyopt.loader.cache import DataFrameCache
+from fantasyopt.loader.yahoo.nfl import NflLoader
+from benchmarks.pools import write_csv
+
+DEFAULT_ROWS = 50000
+
+
+def load_row_wise(file_name):
+    """
+    Load file_name the way NflLoader did before column-level transforms,
+    calling a Python function once per row
+
+    :param file_name: /path/to/file.csv
+    :return: DataFrame of players
+    """
+    def make_name(row):
+        return row['First Name'] + ' ' + row['Last Name']
+
+    return PlayerLoader.import_csv(
+        file_name, index_column='Id',
+        data_type={'FPPG': float, 'Salary': int},
+        column_renames={'Injury Status': Player.INJURY_STATUS},
+        row_ignore_conditions=
+        SITE_DEFAULTS[Site.YAHOO].NFL_PLAYER_IGNORE_CONDITIONS,
+        functions_to_apply=[(Player.NAME, make_name)])
+
+
+def main(rows):
+    with tempfile.TemporaryDirectory() as directory:
+        file_name = os.path.join(directory, 'players.csv')
+        write_csv(file_name, rows)
+
+        row_wise = min(timeit.repeat(lambda: load_row_wise(file_name),
+                                     number=1, repeat=3))
+        vectorized = min(timeit.repeat(
+            lambda: NflLoader.load_players(file_name), number=1, repeat=3))
+
+        cache = DataFrameCache(os.path.join(directory, 'cache'))
+        NflLoader.load_players(file_name, cache=cache)
+        cached = min(timeit.repeat(
+            lambda: NflLoader.load_players(file_name, cache=cache), number=1,
+            repeat=3))
+
+    print('{:>8} {:>14} {:>16} {:>12}'.format('rows', 'row-wise (s)',
+                                             'vectorized (s)', 'cached (s)'))
+    print('{:>8} {:>14.4f} {:>16.4f} {:>12.4f}'.format(rows, row_wise,
+                                                     vectorized, cached))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROWS)
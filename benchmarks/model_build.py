@@ -0,0 +1,42 @@
+"""
+Time DfsOptimizer construction against player pool size
+
+Usage: python -m benchmarks.model_build [sizes...]
+"""
+import sys
+import timeit
+
+from fantasyopt import SITE_DEFAULTS, Site
+from fantasyopt.optimizer.dfs import DfsOptimizer
+from benchmarks.pools import make_nba_players, make_nfl_players
+
+DEFAULT_SIZES = [100, 500, 1000, 5000, 10000, 20000]
+
+
+def time_build(players, positions, budget, flex_positions, utility,
+               repeat=3):
+    """
+    Time construction of a DfsOptimizer
+
+    :return: best wall time of 'repeat' constructions, in seconds
+    """
+    return min(timeit.repeat(
+        lambda: DfsOptimizer(players, positions, budget, flex_positions,
+                             utility), number=1, repeat=repeat))
+
+
+def main(sizes):
+    yahoo = SITE_DEFAULTS[Site.YAHOO]
+    print('{:>8} {:>10} {:>10}'.format('players', 'nfl (s)', 'nba (s)'))
+    for size in sizes:
+        nfl = time_build(make_nfl_players(size), yahoo.NFL_POSITIONS,
+                         yahoo.NFL_BUDGET, yahoo.NFL_FLEX_POSITIONS,
+                         yahoo.NFL_UTILITY_POSITIONS)
+        nba = time_build(make_nba_players(size), yahoo.NBA_POSITIONS,
+                         yahoo.NBA_BUDGET, yahoo.NBA_FLEX_POSITIONS,
+                         yahoo.NBA_UTILITY_POSITIONS)
+        print('{:>8} {:>10.4f} {:>10.4f}'.format(size, nfl, nba))
+
+
+if __name__ == '__main__':
+    main([int(s) for s in sys.argv[1:]] or DEFAULT_SIZES)
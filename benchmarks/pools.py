@@ -0,0 +1,108 @@
+import numpy as np
+
+from fantasyopt import SITE_DEFAULTS, League, Player, Site
+
+NFL_TEAMS = ['ARI', 'ATL', 'BAL', 'BUF', 'CAR', 'CHI', 'CIN', 'CLE', 'DAL',
+             'DEN', 'DET', 'GB', 'HOU', 'IND', 'JAX', 'KC', 'LAC', 'LAR',
+             'MIA', 'MIN', 'NE', 'NO', 'NYG', 'NYJ', 'OAK', 'PHI', 'PIT',
+             'SEA', 'SF', 'TB', 'TEN', 'WAS']
+NBA_TEAMS = ['ATL', 'BKN', 'BOS', 'CHA', 'CHI', 'CLE', 'DAL', 'DEN', 'DET',
+             'GS', 'HOU', 'IND', 'LAC', 'LAL', 'MEM', 'MIA', 'MIL', 'MIN',
+             'NO', 'NY', 'OKC', 'ORL', 'PHI', 'PHO', 'POR', 'SA', 'SAC',
+             'TOR', 'UTA', 'WAS']
+# injury statuses drawn for csv rows, mostly healthy
+INJURY_STATUSES = {
+    League.NFL: [' ', ' ', ' ', ' ', 'Q', 'D', 'O', 'IR'],
+    League.NBA: [' ', ' ', ' ', ' ', 'GTD', 'INJ', 'O', 'OFS']
+}
+
+
+def make_players(size, positions, teams, seed=0):
+    """
+    Generate a synthetic, Yahoo-shaped player dict
+
+    :param size: number of players
+    :param positions: list of positions to draw from
+    :param teams: list of teams; consecutive pairs play each other
+    :param seed: seed for the random number generator
+    :return: dict of player id -> dict of Player attributes, as returned by
+        PlayerLoader.get_player_dict
+    """
+    rng = np.random.RandomState(seed)
+    position = rng.choice(positions, size)
+    team = rng.randint(0, len(teams), size)
+    salary = rng.randint(10, 50, size)
+    projection = np.round(salary * rng.uniform(0.3, 0.7, size), 1)
+
+    players = {}
+    for i in range(size):
+        opponent = team[i] ^ 1 if (team[i] ^ 1) < len(teams) else team[i]
+        players['p.' + str(i)] = {
+            Player.NAME: 'Player ' + str(i),
+            Player.POINTS_PROJECTION: float(projection[i]),
+            Player.POSITION: str(position[i]),
+            Player.SALARY: int(salary[i]),
+            Player.TEAM: teams[team[i]],
+            Player.OPPONENT: teams[opponent],
+            Player.INJURY_STATUS: ' ',
+            Player.GAME_TIME: str(1 + team[i] // 8) + ':00PM EST'
+        }
+    return players
+
+
+def make_nfl_players(size, seed=0):
+    """
+    Generate a synthetic Yahoo NFL player dict
+
+    :param size: number of players
+    :param seed: seed for the random number generator
+    :return: dict of player id -> dict of Player attributes
+    """
+    return make_players(size, list(SITE_DEFAULTS[Site.YAHOO].NFL_POSITIONS),
+                        NFL_TEAMS, seed)
+
+
+def make_nba_players(size, seed=0):
+    """
+    Generate a synthetic Yahoo NBA player dict
+
+    :param size: number of players
+    :param seed: seed for the random number generator
+    :return: dict of player id -> dict of Player attributes
+    """
+    return make_players(size, list(SITE_DEFAULTS[Site.YAHOO].NBA_POSITIONS),
+                        NBA_TEAMS, seed)
+
+
+def write_csv(file_name, rows, league=League.NFL, seed=0):
+    """
+    Write a synthetic csv in the format of the Yahoo player export
+
+    :param file_name: /path/to/file.csv
+    :param rows: number of players
+    :param league: League.NFL or League.NBA
+    :param seed: seed for the random number generator
+    :return: None
+    """
+    teams = NFL_TEAMS if league == League.NFL else NBA_TEAMS
+    rng = np.random.RandomState(seed)
+    positions = list(getattr(SITE_DEFAULTS[Site.YAHOO],
+                             league.value + '_POSITIONS'))
+    position = rng.choice(positions, rows)
+    team = rng.randint(0, len(teams), rows)
+    salary = rng.randint(10, 50, rows)
+    projection = np.round(salary * rng.uniform(0.3, 0.7, rows), 1)
+    injury = rng.choice(INJURY_STATUSES[league], rows)
+    prefix = league.value.lower()
+
+    with open(file_name, 'w') as outfile:
+        outfile.write('Id,First Name,Last Name,Position,Team,Opponent,Game,'
+                      'Time,Salary,FPPG,Injury Status,Starting\n')
+        for i in range(rows):
+            home = teams[team[i]]
+            away = teams[team[i] ^ 1]
+            outfile.write('{}.p.{},First{},Last{},{},{},{},{}@{},1:00PM EST,'
+                          '{},{},"{}",No\n'.format(prefix, i, i, i,
+                                                   position[i], home, away,
+                                                   away, home, salary[i],
+                                                   projection[i], injury[i]))
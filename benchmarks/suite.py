@@ -0,0 +1,237 @@
+"""
+Measure DfsOptimizer and the Yahoo loaders on synthetic NFL and NBA pools and
+report the wall time and peak memory of each step as JSON
+
+Usage: python -m benchmarks.suite [--sizes N ...] [--leagues nfl nba]
+                                  [--solvers cbc highs cp-sat sparse]
+                                  [--repeat N]
+                                  [--output results.json]
+                                  [--baseline old.json] [--tolerance 0.25]
+
+With --baseline, steps that are slower than in the baseline results by more
+than the tolerance are listed and the exit status is 1.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from fantasyopt import League
+from fantasyopt.optimizer.dfs import DfsOptimizer
+from fantasyopt.optimizer.solvers import get_solver
+from fantasyopt.optimizer.sparse import SparseDfsOptimizer
+from fantasyopt.player import Player
+from fantasyopt.slate import LOADERS, roster
+from fantasyopt.sites import Site
+from benchmarks.pools import make_nba_players, make_nfl_players, write_csv
+
+DEFAULT_SIZES = [100, 1000, 5000, 20000]
+DEFAULT_LEAGUES = ['nfl', 'nba']
+DEFAULT_SOLVERS = ['cbc']
+DEFAULT_TOLERANCE = 0.25
+# solver name selecting SparseDfsOptimizer and its default MilpSolver
+SPARSE = 'sparse'
+# steps faster than this are not compared against a baseline, since their
+# times are mostly noise
+MIN_COMPARED_SECONDS = 0.005
+
+MAKE_PLAYERS = {League.NFL: make_nfl_players, League.NBA: make_nba_players}
+
+
+def measure(setup, step, repeat):
+    """
+    Measure a step. Each run calls setup, untimed, and passes its result to
+    step. Peak memory is measured in one more run under tracemalloc, so that
+    tracing does not slow the timed runs. It counts memory allocated by
+    Python and numpy in this process, not by solver processes such as CBC.
+
+    :param setup: function returning the argument of step
+    :param step: function to measure
+    :param repeat: number of timed runs
+    :return: dict with the best 'seconds' of the runs and 'peak_bytes'
+        allocated during a run
+    """
+    best = None
+    for i in range(repeat):
+        argument = setup()
+        start = time.perf_counter()
+        step(argument)
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+
+    argument = setup()
+    tracemalloc.start()
+    try:
+        step(argument)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {'seconds': best, 'peak_bytes': peak}
+
+
+def constraint_steps(players):
+    """
+    Get one call of each DfsOptimizer constraint method on a pool
+
+    :param players: dict of player id -> dict of Player attributes
+    :return: dict of step name -> function taking a DfsOptimizer
+    """
+    ids = sorted(players)
+    some = ids[:10]
+    team = players[ids[0]][Player.TEAM]
+    opponent = players[ids[1]][Player.OPPONENT]
+    required = players[ids[0]]
+    projections = {i: players[i][Player.POINTS_PROJECTION] + 1 for i in ids}
+    salaries = {i: players[i][Player.SALARY] + 1 for i in ids}
+
+    return {
+        'ignore_players': lambda o: o.ignore_players(
+            [(players[i][Player.NAME], players[i][Player.POSITION],
+              players[i][Player.TEAM]) for i in some]),
+        'ignore_teams': lambda o: o.ignore_teams([team]),
+        'avoid_opponents': lambda o: o.avoid_opponents([opponent]),
+        'set_max_players_from_same_team':
+            lambda o: o.set_max_players_from_same_team(4),
+        'require_players': lambda o: o.require_players(
+            [(required[Player.NAME], required[Player.POSITION],
+              required[Player.TEAM])]),
+        'add_unique_lineup_constraint':
+            lambda o: o.add_unique_lineup_constraint(some, 1),
+        'update_projections': lambda o: o.update_projections(projections),
+        'update_salaries': lambda o: o.update_salaries(salaries)
+    }
+
+
+def run(sizes, leagues, solvers, repeat=3):
+    """
+    Measure every step for each league, pool size and solver
+
+    :param sizes: list of numbers of players
+    :param leagues: list of League
+    :param solvers: list of solver names in fantasyopt.optimizer.solvers
+        SOLVERS, or SPARSE
+    :param repeat: number of timed runs of each step
+    :return: list of dicts with the league, size, solver (None for steps that
+        do not solve), step, seconds and peak_bytes
+    """
+    results = []
+
+    def record(league, size, solver, step, measurement):
+        result = {'league': league.value, 'size': size, 'solver': solver,
+                  'step': step}
+        result.update(measurement)
+        results.append(result)
+        print('{:<4} {:>6} {:<18} {:<32} {:>10.4f}s {:>12,}B'.format(
+            league.value, size, solver or '-', step, result['seconds'],
+            result['peak_bytes']), file=sys.stderr)
+
+    for league in leagues:
+        positions, budget, flex_positions, utility_requirement = \
+            roster(Site.YAHOO, league)
+        loader = LOADERS[(Site.YAHOO, league)]
+
+        for size in sizes:
+            with tempfile.TemporaryDirectory() as directory:
+                file_name = os.path.join(directory, 'players.csv')
+                write_csv(file_name, size, league)
+                record(league, size, None, 'load_players', measure(
+                    lambda: None, lambda _: loader.load_players(file_name),
+                    repeat))
+                loaded = loader.load_players(file_name)
+                record(league, size, None, 'get_player_pool', measure(
+                    lambda: None, lambda _: loaded.get_player_pool(),
+                    repeat))
+
+            players = MAKE_PLAYERS[league](size)
+
+            def build(solver=None):
+                if solver == SPARSE:
+                    return SparseDfsOptimizer(players, positions, budget,
+                                              flex_positions,
+                                              utility_requirement)
+                return DfsOptimizer(players, positions, budget,
+                                    flex_positions, utility_requirement,
+                                    solver)
+
+            record(league, size, None, 'construct',
+                   measure(lambda: None, lambda _: build(), repeat))
+            for step, call in constraint_steps(players).items():
+                record(league, size, None, step,
+                       measure(build, call, repeat))
+
+            for solver in solvers:
+                # name the solver actually used, since get_solver falls back
+                # to CBC if the named solver is not installed
+                name = SparseDfsOptimizer.__name__ if solver == SPARSE \
+                    else type(get_solver(solver)).__name__
+                record(league, size, name, 'optimize', measure(
+                    lambda: build(solver), lambda o: o.optimize(), repeat))
+
+    return results
+
+
+def compare(baseline, results, tolerance=DEFAULT_TOLERANCE):
+    """
+    Find steps that are slower than in a baseline
+
+    :param baseline: results of run from an earlier version
+    :param results: results of run
+    :param tolerance: fraction by which a step may be slower than its
+        baseline
+    :return: list of tuples (result, baseline seconds) of the slower steps
+    """
+    def key(result):
+        return (result['league'], result['size'], result['solver'],
+                result['step'])
+
+    previous = {key(result): result['seconds'] for result in baseline}
+    regressions = []
+    for result in results:
+        seconds = previous.get(key(result))
+        if seconds is not None and result['seconds'] > MIN_COMPARED_SECONDS \
+                and result['seconds'] > seconds * (1 + tolerance):
+            regressions.append((result, seconds))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark fantasyopt')
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        default=DEFAULT_SIZES)
+    parser.add_argument('--leagues', nargs='+', default=DEFAULT_LEAGUES)
+    parser.add_argument('--solvers', nargs='+', default=DEFAULT_SOLVERS)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help='file to write the JSON report to '
+                                         'instead of stdout')
+    parser.add_argument('--baseline', help='JSON report to compare against')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes, [League(l.upper()) for l in args.leagues],
+                  args.solvers, args.repeat)
+    report = {'python': platform.python_version(),
+              'platform': platform.platform(), 'results': results}
+    if args.output is not None:
+        with open(args.output, 'w') as outfile:
+            json.dump(report, outfile, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+    if args.baseline is not None:
+        with open(args.baseline) as infile:
+            regressions = compare(json.load(infile)['results'], results,
+                                  args.tolerance)
+        for result, seconds in regressions:
+            print('slower: {league} {size} {solver} {step}: {seconds:.4f}s'
+                  .format(**result) + ' vs {:.4f}s'.format(seconds),
+                  file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,9 +1,33 @@
 __all__ = ['SITE_DEFAULTS', 'League', 'LEAGUE_TEAMS', 'Player', 'Site']
 
-from fantasyopt.leagues import *
-from fantasyopt.player import *
-from fantasyopt.sites import *
+import importlib
 
-SITE_DEFAULTS = {
-    Site.YAHOO: Yahoo
+# modules defining the names in __all__, imported on first access so that
+# importing fantasyopt (or a submodule) does not import all of them
+_LAZY_ATTRIBUTES = {
+    'League': 'fantasyopt.leagues',
+    'LEAGUE_TEAMS': 'fantasyopt.leagues',
+    'Player': 'fantasyopt.player',
+    'Site': 'fantasyopt.sites',
+    'Yahoo': 'fantasyopt.sites'
 }
+
+
+def __getattr__(name):
+    if name == 'SITE_DEFAULTS':
+        sites = importlib.import_module('fantasyopt.sites')
+        value = {
+            sites.Site.YAHOO: sites.Yahoo
+        }
+    elif name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    else:
+        raise AttributeError('module \'' + __name__ + '\' has no attribute \'' +
+                             name + '\'')
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
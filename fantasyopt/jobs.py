@@ -0,0 +1,99 @@
+import json
+
+from fantasyopt.optimizer.batch import optimize_many
+from fantasyopt.slate import SlateSpec, load_slate, result_to_json, roster, \
+    site_and_league
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+
+class Job:
+    """
+    Keys of a job file read by read_job
+    """
+    # dict of slate name -> dict with fantasyopt.slate.SlateSpec keys
+    SLATES = 'slates'
+    # list of lineups to solve, each a dict with SLATE, an optional NAME and
+    # fantasyopt.optimizer.batch.LineupSpec keys
+    LINEUPS = 'lineups'
+    # name of the slate of a lineup
+    SLATE = 'slate'
+    # name of a lineup; defaults to its position in LINEUPS
+    NAME = 'name'
+
+
+def read_job(file_name) -> dict:
+    """
+    Read a job file. Files ending in .yaml or .yml are read as YAML, and all
+    others as JSON.
+
+    :param file_name: /path/to/job.json
+    :return: dict with Job keys
+    :raises ImportError: if the file is YAML and PyYAML is not installed
+    """
+    with open(file_name) as infile:
+        if file_name.endswith(('.yaml', '.yml')):
+            if yaml is None:
+                raise ImportError('PyYAML is required to read YAML job files')
+            return yaml.safe_load(infile)
+        return json.load(infile)
+
+
+def run_job(job, workers=None, cache=None) -> list:
+    """
+    Solve every lineup of a job. Each slate is loaded once, and its lineups
+    are solved with fantasyopt.optimizer.batch.optimize_many.
+
+    :param job: dict with Job keys
+    :param workers: number of worker processes passed to optimize_many
+    :param cache: fantasyopt.loader.cache.DataFrameCache used to load players,
+        or None
+    :return: list of JSON-serializable results, in the order of the job's
+        lineups, each with the slate and name of its lineup
+    :raises ValueError: if a lineup names a slate that is not in the job
+    """
+    slates = job.get(Job.SLATES, {})
+    lineups = job.get(Job.LINEUPS, [])
+
+    by_slate = {}
+    for i, lineup in enumerate(lineups):
+        slate = lineup.get(Job.SLATE)
+        if slate not in slates:
+            raise ValueError('lineup ' + str(lineup.get(Job.NAME, i)) +
+                             ' names unknown slate ' + str(slate))
+        by_slate.setdefault(slate, []).append(i)
+
+    results = [None] * len(lineups)
+    for slate, indices in by_slate.items():
+        definition = slates[slate]
+        players = load_slate(definition, cache).get_player_pool()
+        positions, budget, flex_positions, utility_requirement = \
+            roster(*site_and_league(definition))
+
+        specs = [{key: value for key, value in lineups[i].items()
+                  if key not in (Job.SLATE, Job.NAME)} for i in indices]
+        solved = optimize_many(specs, players, positions, budget,
+                               flex_positions, utility_requirement,
+                               definition.get(SlateSpec.SOLVER), workers)
+
+        for i, result in zip(indices, solved):
+            results[i] = {Job.SLATE: slate,
+                          Job.NAME: lineups[i].get(Job.NAME, i)}
+            results[i].update(result_to_json(players, result))
+
+    return results
+
+
+def write_results(file_name, results):
+    """
+    Write the results of run_job to one JSON file
+
+    :param file_name: /path/to/output.json
+    :param results: results of run_job
+    :return: None
+    """
+    with open(file_name, 'w') as outfile:
+        json.dump(results, outfile, indent=2, sort_keys=True)
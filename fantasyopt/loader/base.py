@@ -1,18 +1,29 @@
 import os
 from abc import ABC, abstractmethod
 
+import numpy as np
 import pandas as pd
+from pandas.api.types import union_categoricals
+
+from fantasyopt.pool import PlayerPool
+from fantasyopt.profiling import NULL_PROFILER
 
 
 class PlayerLoader(ABC):
-    def __init__(self, df):
+    # rows read at a time by iter_csv
+    DEFAULT_CHUNK_SIZE = 10000
+
+    def __init__(self, df, profiler=None):
         """
         Initialize PlayerLoaderInstance
 
         :param df: DataFrame of data
         :type df: pd.DataFrame
+        :param profiler: fantasyopt.profiling.Profiler recording the time of
+            conversions of df, or None
         """
         self.df = df
+        self.profiler = NULL_PROFILER if profiler is None else profiler
 
     @classmethod
     @abstractmethod
@@ -22,39 +33,165 @@ class PlayerLoader(ABC):
     @staticmethod
     def import_csv(file_name, index_column=None, data_type=None,
                    column_renames=None, row_ignore_conditions=None,
-                   functions_to_apply=None) -> pd.DataFrame:
+                   functions_to_apply=None, use_columns=None,
+                   column_functions=None, cache=None,
+                   profiler=None) -> pd.DataFrame:
         """
         Load player data from csv find at 'file_name'
 
         :param file_name: /path/to/file.csv
         :param index_column: column to use as 'index_col' when loading csv as
             pandas DataFrame
-        :param data_type: type requirements for columns
+        :param data_type: type requirements for columns. Columns with few
+            distinct values (e.g. team or position) can be given the
+            'category' type
         :param column_renames: dict of name -> new_name for renaming columns
         :param row_ignore_conditions: list of tuples (column, value)
             specifying that rows with value in column should be dropped
         :param functions_to_apply: list of tuples (column, function) specifying
-            functions to apply on DataFrame with axis=1
+            functions to apply on DataFrame with axis=1. Each function is
+            called once per row, so column_functions should be preferred
+        :param use_columns: columns to read, passed to pandas.read_csv as
+            'usecols'; either a list of column names or a function returning
+            True for column names to read
+        :param column_functions: list of tuples (column, function) specifying
+            functions called once with the whole DataFrame, returning the
+            values of column (e.g. lambda df: df['a'] + ' ' + df['b'])
+        :param cache: fantasyopt.loader.cache.DataFrameCache holding
+            DataFrames already loaded from the same csv contents with the same
+            arguments, or None to always parse the csv
+        :param profiler: fantasyopt.profiling.Profiler recording the time of
+            reading, cleaning and caching, or None
         :return: DataFrame of players
         :raises ValueError: if file_name does not have .csv extension
         :raise RuntimeError: if file_name does not exist
         """
 
+        PlayerLoader._check_file(file_name)
+        profiler = NULL_PROFILER if profiler is None else profiler
+        component = PlayerLoader.__name__
+
+        if cache is not None:
+            with profiler.phase(component, 'cache_lookup') as details:
+                key = cache.key(file_name, index_column, data_type,
+                                column_renames, row_ignore_conditions,
+                                functions_to_apply, use_columns,
+                                column_functions)
+                df = cache.get(key)
+                details['hit'] = df is not None
+            if df is not None:
+                return df
+
+        with profiler.phase(component, 'read') as details:
+            with open(file_name) as infile:
+                df = pd.read_csv(infile, index_col=index_column,
+                                 dtype=data_type, usecols=use_columns)
+            details['rows'] = len(df)
+        with profiler.phase(component, 'clean') as details:
+            df = PlayerLoader._clean(df, column_renames, row_ignore_conditions,
+                                     functions_to_apply, column_functions)
+            details['rows'] = len(df)
+
+        if cache is not None:
+            with profiler.phase(component, 'cache_store'):
+                cache.put(key, df)
+        return df
+
+    @staticmethod
+    def iter_csv(file_name, slate_column, chunk_size=DEFAULT_CHUNK_SIZE,
+                 index_column=None, data_type=None, column_renames=None,
+                 row_ignore_conditions=None, functions_to_apply=None,
+                 use_columns=None, column_functions=None):
+        """
+        Load player data from csv find at 'file_name' holding many slates,
+        reading chunk_size rows at a time and yielding the players of one
+        slate at a time. The rows of each slate must be contiguous in the
+        file, so memory use is bounded by chunk_size and the largest slate
+        rather than by the size of the file.
+
+        Each chunk is cleaned as in import_csv, and the remaining arguments are
+        as for import_csv.
+
+        :param file_name: /path/to/file.csv
+        :param slate_column: column identifying the slate of each row (e.g. a
+            game date or slate id), after column_renames are applied
+        :param chunk_size: number of rows read at a time
+        :return: generator of tuples (slate, DataFrame of players), in the
+            order slates appear in the file
+        :raises ValueError: if file_name does not have .csv extension, or the
+            rows of a slate are not contiguous
+        :raise RuntimeError: if file_name does not exist
+        """
+        PlayerLoader._check_file(file_name)
+
+        emitted = set()
+        # frames of the slate read last, which may continue in the next chunk
+        pending = []
+        pending_slate = None
+        with open(file_name) as infile:
+            for chunk in pd.read_csv(infile, index_col=index_column,
+                                     dtype=data_type, usecols=use_columns,
+                                     chunksize=chunk_size):
+                chunk = PlayerLoader._clean(chunk, column_renames,
+                                            row_ignore_conditions,
+                                            functions_to_apply,
+                                            column_functions)
+                for slate, rows in chunk.groupby(slate_column, sort=False,
+                                                 observed=True):
+                    if pending and slate != pending_slate:
+                        yield pending_slate, PlayerLoader._concat(pending)
+                        emitted.add(pending_slate)
+                        pending = []
+                    if slate in emitted:
+                        raise ValueError('rows of slate ' + str(slate) +
+                                         ' are not contiguous in file ' +
+                                         file_name)
+                    pending_slate = slate
+                    pending.append(rows)
+
+        if pending:
+            yield pending_slate, PlayerLoader._concat(pending)
+
+    @staticmethod
+    def _check_file(file_name):
+        """
+        Check that file_name is an existing csv file
+
+        :param file_name: /path/to/file.csv
+        :return: None
+        :raises ValueError: if file_name does not have .csv extension
+        :raise RuntimeError: if file_name does not exist
+        """
         if file_name.split('.')[-1] != 'csv':
             raise ValueError('file ' + file_name + ' does not have .csv '
                                                    'extension')
         elif os.path.isfile(file_name) is False:
             raise RuntimeError('file ' + file_name + ' does not exist')
 
-        with open(file_name) as infile:
-            df = pd.read_csv(infile, index_col=index_column, dtype=data_type)
+    @staticmethod
+    def _clean(df, column_renames=None, row_ignore_conditions=None,
+               functions_to_apply=None, column_functions=None) -> pd.DataFrame:
+        """
+        Rename columns, drop ignored rows, add computed columns and drop rows
+        with missing values, as described in import_csv
 
+        :param df: DataFrame read from csv
+        :type df: pd.DataFrame
+        :return: cleaned DataFrame
+        """
         if column_renames is not None:
             df.rename(index=str, columns=column_renames, inplace=True)
 
-        if row_ignore_conditions is not None:
+        if row_ignore_conditions:
+            # one mask for every condition so the DataFrame is only copied once
+            ignore = np.zeros(len(df), dtype=bool)
             for col, val in row_ignore_conditions:
-                df = df[df[col] != val]
+                ignore |= (df[col] == val).values
+            df = df.take(np.flatnonzero(~ignore))
+
+        if column_functions is not None:
+            for col, func in column_functions:
+                df[col] = func(df)
 
         if functions_to_apply is not None:
             for col, func in functions_to_apply:
@@ -63,10 +200,40 @@ class PlayerLoader(ABC):
 
         return df
 
+    @staticmethod
+    def _concat(frames) -> pd.DataFrame:
+        """
+        Concatenate DataFrames read from different chunks. Categorical columns
+        stay categorical, with the union of the categories of every frame
+
+        :param frames: list of DataFrames with the same columns
+        :return: concatenated DataFrame
+        """
+        if len(frames) == 1:
+            return frames[0]
+
+        df = pd.concat(frames)
+        for col in frames[0].columns:
+            if isinstance(frames[0][col].dtype, pd.CategoricalDtype):
+                df[col] = union_categoricals([f[col] for f in frames])
+        return df
+
     def get_player_dict(self) -> dict:
         """
         Get dictionary of players in DataFrame self.df, where the indices are
         keys and the values are dictionaries of column name -> value
         :return: dict of players
         """
-        return self.df.to_dict('index')
+        with self.profiler.phase(PlayerLoader.__name__, 'to_dict',
+                                 players=len(self.df)):
+            return self.df.to_dict('index')
+
+    def get_player_pool(self) -> PlayerPool:
+        """
+        Get PlayerPool of players in DataFrame self.df, where the indices are
+        player ids
+        :return: PlayerPool of players
+        """
+        with self.profiler.phase(PlayerLoader.__name__, 'to_pool',
+                                 players=len(self.df)):
+            return PlayerPool.from_dataframe(self.df)
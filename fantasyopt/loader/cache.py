@@ -0,0 +1,240 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+
+class DataFrameCache:
+    # environment variable overriding the default cache directory
+    DIRECTORY_VARIABLE = 'FANTASYOPT_CACHE_DIR'
+    DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+    META_FILE = 'meta.json'
+
+    def __init__(self, directory=None, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Cache of cleaned player DataFrames, keyed by a hash of the csv contents
+        and the options used to load it. Each entry is a directory of NumPy
+        .npy files, one per column, which are memory-mapped when read. When
+        the cache holds more than max_bytes, the least recently used entries
+        are removed.
+
+        :param directory: directory holding the cache. If None, the
+            FANTASYOPT_CACHE_DIR environment variable or
+            ~/.cache/fantasyopt is used
+        :param max_bytes: most bytes the cache may hold
+        """
+        if directory is None:
+            directory = os.environ.get(
+                DataFrameCache.DIRECTORY_VARIABLE,
+                os.path.join(os.path.expanduser('~'), '.cache', 'fantasyopt'))
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def key(file_name, *options) -> str:
+        """
+        Get the cache key of a csv file loaded with the given options
+
+        :param file_name: /path/to/file.csv
+        :param options: options that change the loaded DataFrame. Functions
+            are identified by their name, bytecode and closure, and sets by
+            their sorted elements
+        :return: hex digest identifying the file contents and options
+        """
+        digest = hashlib.sha256()
+        with open(file_name, 'rb') as infile:
+            for chunk in iter(lambda: infile.read(1 << 20), b''):
+                digest.update(chunk)
+        for option in options:
+            digest.update(DataFrameCache._option_bytes(option))
+        return digest.hexdigest()
+
+    @staticmethod
+    def _option_bytes(option) -> bytes:
+        """
+        Get a stable byte representation of a loading option
+
+        :param option: option passed to DataFrameCache.key
+        :return: bytes identifying option
+        """
+        if callable(option) and hasattr(option, '__code__'):
+            code = option.__code__
+            closure = [cell.cell_contents for cell in option.__closure__ or []]
+            return option.__qualname__.encode() + code.co_code + \
+                repr(code.co_consts).encode() + \
+                DataFrameCache._option_bytes(closure)
+        if isinstance(option, (list, tuple)):
+            return b'[' + b','.join(DataFrameCache._option_bytes(o)
+                                    for o in option) + b']'
+        if isinstance(option, (set, frozenset)):
+            return b'{' + b','.join(sorted(DataFrameCache._option_bytes(o)
+                                           for o in option)) + b'}'
+        if isinstance(option, dict):
+            return b'{' + b','.join(sorted(
+                DataFrameCache._option_bytes(k) + b':' +
+                DataFrameCache._option_bytes(v)
+                for k, v in option.items())) + b'}'
+        if isinstance(option, type):
+            return option.__name__.encode()
+        return repr(option).encode()
+
+    def get(self, key):
+        """
+        Read a cached DataFrame
+
+        :param key: key from DataFrameCache.key
+        :return: DataFrame, or None if key is not cached
+        :rtype: pd.DataFrame
+        """
+        entry = os.path.join(self.directory, key)
+        try:
+            with open(os.path.join(entry, DataFrameCache.META_FILE)) as infile:
+                meta = json.load(infile)
+            os.utime(os.path.join(entry, DataFrameCache.META_FILE))
+
+            index = self._read_column(entry, 'index', meta['index'])
+            columns = {column['name']: self._read_column(entry, str(i), column)
+                       for i, column in enumerate(meta['columns'])}
+        except (OSError, ValueError, KeyError):
+            return None
+
+        return pd.DataFrame(columns, index=pd.Index(index,
+                                                    name=meta['index']['name']))
+
+    @staticmethod
+    def _read_column(entry, name, column):
+        """
+        Read one column of a cache entry
+
+        :param entry: directory of the cache entry
+        :param name: file name of the column, without extension
+        :param column: metadata of the column written by _write_column
+        :return: array or pd.Categorical of values
+        """
+        values = np.load(os.path.join(entry, name + '.npy'), mmap_mode='r')
+        if column['kind'] == 'categorical':
+            categories = np.load(os.path.join(entry, name + '.categories.npy'))
+            return pd.Categorical.from_codes(np.asarray(values),
+                                             categories.astype(object))
+        if column['kind'] == 'string':
+            return values.astype(object)
+        return values
+
+    def put(self, key, df) -> bool:
+        """
+        Cache a DataFrame, then evict least recently used entries until the
+        cache holds at most max_bytes
+
+        :param key: key from DataFrameCache.key
+        :param df: DataFrame to cache
+        :type df: pd.DataFrame
+        :return: True if df was cached, False if it has columns that cannot be
+            stored (e.g. objects other than strings)
+        """
+        staging = tempfile.mkdtemp(dir=self.directory, prefix='.staging-')
+        try:
+            meta = {'index': self._write_column(staging, 'index', df.index),
+                    'columns': [self._write_column(staging, str(i), df[column])
+                                for i, column in enumerate(df.columns)]}
+            meta['index']['name'] = df.index.name
+            for column, name in zip(meta['columns'], df.columns):
+                column['name'] = name
+            with open(os.path.join(staging, DataFrameCache.META_FILE),
+                      'w') as outfile:
+                json.dump(meta, outfile)
+        except ValueError:
+            shutil.rmtree(staging)
+            return False
+
+        entry = os.path.join(self.directory, key)
+        if os.path.isdir(entry):
+            shutil.rmtree(entry)
+        os.replace(staging, entry)
+
+        self.evict()
+        return True
+
+    @staticmethod
+    def _write_column(entry, name, values) -> dict:
+        """
+        Write one column of a cache entry
+
+        :param entry: directory of the cache entry
+        :param name: file name of the column, without extension
+        :param values: pd.Series or pd.Index of values
+        :return: metadata of the column
+        :raises ValueError: if the column holds objects other than strings
+        """
+        path = os.path.join(entry, name)
+        values = pd.Series(values)
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            np.save(path + '.npy', values.cat.codes.values)
+            np.save(path + '.categories.npy',
+                    DataFrameCache._string_array(values.cat.categories))
+            return {'kind': 'categorical'}
+        if values.dtype == object:
+            np.save(path + '.npy', DataFrameCache._string_array(values))
+            return {'kind': 'string'}
+        np.save(path + '.npy', np.asarray(values), allow_pickle=False)
+        return {'kind': 'array'}
+
+    @staticmethod
+    def _string_array(values) -> np.ndarray:
+        """
+        Convert values to a fixed width unicode array
+
+        :param values: sequence of strings
+        :return: NumPy unicode array
+        :raises ValueError: if any value is not a string
+        """
+        values = list(values)
+        if not all(isinstance(v, str) for v in values):
+            raise ValueError('only string columns can be cached')
+        return np.array(values, dtype=str) if values else \
+            np.array([], dtype='<U1')
+
+    def size(self) -> int:
+        """
+        Get the number of bytes held by the cache
+
+        :return: total size of all entries, in bytes
+        """
+        return sum(size for entry, used, size in self._entries())
+
+    def _entries(self):
+        """
+        List the cache entries
+
+        :return: list of tuples (entry directory, time of last use, size in
+            bytes)
+        """
+        entries = []
+        for name in os.listdir(self.directory):
+            entry = os.path.join(self.directory, name)
+            meta = os.path.join(entry, DataFrameCache.META_FILE)
+            if name.startswith('.') or not os.path.isfile(meta):
+                continue
+            size = sum(os.path.getsize(os.path.join(entry, f))
+                       for f in os.listdir(entry))
+            entries.append((entry, os.path.getmtime(meta), size))
+        return entries
+
+    def evict(self):
+        """
+        Remove least recently used entries until the cache holds at most
+        max_bytes
+
+        :return: None
+        """
+        entries = sorted(self._entries(), key=lambda e: e[1])
+        total = sum(size for entry, used, size in entries)
+        for entry, used, size in entries:
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
@@ -1,4 +1,11 @@
 __all__ = ['nba', 'nfl']
 
-import fantasyopt.loader.yahoo.nba
-import fantasyopt.loader.yahoo.nfl
+import importlib
+
+
+def __getattr__(name):
+    # the loaders import pandas, so they are only imported when first used
+    if name in __all__:
+        return importlib.import_module(__name__ + '.' + name)
+    raise AttributeError('module \'' + __name__ + '\' has no attribute \'' +
+                         name + '\'')
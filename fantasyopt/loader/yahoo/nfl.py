@@ -6,27 +6,70 @@ from fantasyopt.loader.base import PlayerLoader
 
 
 class NflLoader(PlayerLoader):
-    def __init__(self, df):
+    # columns of the Yahoo NFL csv that are read
+    COLUMNS = {'Id', 'First Name', 'Last Name', 'Position', 'Team', 'Opponent',
+               'Game', 'Time', 'Salary', 'FPPG', 'Injury Status', 'Starting'}
+
+    def __init__(self, df, profiler=None):
         """
         Initialize NflLoader instance
 
         :param df: DataFrame of data
         :type df: pd.DataFrame
+        :param profiler: fantasyopt.profiling.Profiler, or None
         """
-        super().__init__(df)
+        super().__init__(df, profiler)
 
     @classmethod
-    def load_players(cls, file_name, ignore_conditions=None):
+    def load_players(cls, file_name, ignore_conditions=None, cache=None,
+                     profiler=None):
         """
         Load player data from csv find at 'file_name'
 
         :param file_name: /path/to/file.csv
         :param ignore_conditions: conditions for which to ignore players
+        :param cache: fantasyopt.loader.cache.DataFrameCache to read the
+            cleaned players from and store them in, or None
+        :param profiler: fantasyopt.profiling.Profiler recording the time of
+            each loading phase, or None
         :return: NflLoader instance
         """
+        return cls(PlayerLoader.import_csv(
+            file_name, cache=cache, profiler=profiler,
+            **cls._import_options(ignore_conditions)), profiler)
+
+    @classmethod
+    def load_slates(cls, file_name, slate_column, ignore_conditions=None,
+                    chunk_size=PlayerLoader.DEFAULT_CHUNK_SIZE):
+        """
+        Load player data from csv find at 'file_name' holding many slates,
+        one chunk at a time. The rows of each slate must be contiguous.
+
+        :param file_name: /path/to/file.csv
+        :param slate_column: column identifying the slate of each row (e.g. a
+            game date or slate id), after renaming (e.g. Player.GAME_TIME)
+        :param ignore_conditions: conditions for which to ignore players
+        :param chunk_size: number of rows read at a time
+        :return: generator of tuples (slate, NflLoader instance)
+        """
+        for slate, df in PlayerLoader.iter_csv(
+                file_name, slate_column, chunk_size,
+                **cls._import_options(ignore_conditions, [slate_column])):
+            yield slate, cls(df)
+
+    @classmethod
+    def _import_options(cls, ignore_conditions=None, extra_columns=None):
+        """
+        Get the arguments to PlayerLoader.import_csv for the Yahoo NFL csv
+
+        :param ignore_conditions: conditions for which to ignore players
+        :param extra_columns: columns to read besides NflLoader.COLUMNS
+        :return: dict of keyword arguments
+        """
         if ignore_conditions is None:
             ignore_conditions = \
                 SITE_DEFAULTS[Site.YAHOO].NFL_PLAYER_IGNORE_CONDITIONS
+        columns = cls.COLUMNS.union(extra_columns or [])
 
         column_renames = {
             'Position': Player.POSITION,
@@ -38,16 +81,21 @@ class NflLoader(PlayerLoader):
             'Team': Player.TEAM
         }
 
-        def make_name(row):
-            return row['First Name'] + ' ' + row['Last Name']
+        def make_name(df):
+            return df['First Name'] + ' ' + df['Last Name']
 
-        apply_functions = [(Player.NAME, make_name)]
-
-        return cls(PlayerLoader.import_csv(file_name, index_column='Id',
-                                           data_type={
-                                               'FPPG': np.float,
-                                               'Salary': np.int
-                                           }, column_renames=column_renames,
-                                           row_ignore_conditions=
-                                           ignore_conditions,
-                                           functions_to_apply=apply_functions))
+        return {
+            'index_column': 'Id',
+            'data_type': {
+                'FPPG': np.float,
+                'Salary': np.int,
+                'Position': 'category',
+                'Team': 'category',
+                'Opponent': 'category',
+                'Injury Status': 'category'
+            },
+            'column_renames': column_renames,
+            'row_ignore_conditions': ignore_conditions,
+            'use_columns': lambda c: c in columns,
+            'column_functions': [(Player.NAME, make_name)]
+        }
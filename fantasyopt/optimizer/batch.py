@@ -0,0 +1,143 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from fantasyopt.optimizer.dfs import DfsOptimizer
+from fantasyopt.optimizer.exceptions import OptimizerException
+
+
+class LineupSpec:
+    """
+    Keys of a spec passed to optimize_many. Every key is optional.
+    """
+    # dict of player id -> points projection overriding Player.POINTS_PROJECTION
+    PROJECTIONS = 'projections'
+    # arguments to DfsOptimizer.require_players
+    REQUIRE_PLAYERS = 'require_players'
+    # arguments to DfsOptimizer.ignore_players
+    IGNORE_PLAYERS = 'ignore_players'
+    # arguments to DfsOptimizer.ignore_teams
+    IGNORE_TEAMS = 'ignore_teams'
+    # arguments to DfsOptimizer.avoid_opponents
+    AVOID_OPPONENTS = 'avoid_opponents'
+    # argument to DfsOptimizer.set_max_players_from_same_team
+    MAX_PLAYERS_FROM_SAME_TEAM = 'max_players_from_same_team'
+    # time_limit argument to DfsOptimizer.optimize
+    TIME_LIMIT = 'time_limit'
+    # mip_gap argument to DfsOptimizer.optimize
+    MIP_GAP = 'mip_gap'
+    # list of player ids passed to DfsOptimizer.optimize as initial_lineup
+    INITIAL_LINEUP = 'initial_lineup'
+
+
+# optimizer built once in each worker process by _init_worker
+_optimizer = None
+
+
+def optimize_many(specs, players, positions, budget, flex_positions=None,
+                  utility_requirement=0, solver=None, workers=None) -> list:
+    """
+    Solve one lineup per spec. The player pool and roster configuration are
+    sent once to each worker process, which builds a DfsOptimizer and reuses
+    it for every spec it is given. Projections and constraints changed for a
+    spec are restored before the next one is solved.
+
+    :param specs: list of dicts with LineupSpec keys
+    :param players: dictionary of dictionaries representing players
+    :param positions: dictionary of position -> requirement
+    :param budget: budget for player selection
+    :param flex_positions: dict of
+        flex position name -> (set of valid positions, number required)
+    :param utility_requirement: number of utility players required
+    :param solver: solver passed to DfsOptimizer
+    :param workers: number of worker processes. If None, the number of CPUs
+        is used; if 1, specs are solved in this process
+    :return: list of results of DfsOptimizer.optimize, in the order of specs.
+        If a spec has no feasible lineup, its result has the solve status and
+        no players
+    :raises RuntimeError: if a spec names a player or team that is not found
+    :raises ValueError: if a spec has a projection or initial lineup player
+        for an unknown player id
+    """
+    args = (players, positions, budget, flex_positions, utility_requirement,
+            solver)
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers == 1 or len(specs) <= 1:
+        _init_worker(*args)
+        try:
+            return [_solve(spec) for spec in specs]
+        finally:
+            _init_worker(None)
+
+    chunksize = max(1, len(specs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=args) as executor:
+        return list(executor.map(_solve, specs, chunksize=chunksize))
+
+
+def _init_worker(players, *args):
+    """
+    Build the optimizer used by _solve
+
+    :param players: players passed to DfsOptimizer, or None to discard the
+        optimizer
+    :param args: remaining arguments to DfsOptimizer
+    :return: None
+    """
+    global _optimizer
+    _optimizer = None if players is None else DfsOptimizer(players, *args)
+
+
+def _solve(spec) -> dict:
+    """
+    Solve the lineup for one spec with the optimizer built by _init_worker
+
+    :param spec: dict with LineupSpec keys
+    :return: result of DfsOptimizer.optimize
+    """
+    return solve_spec(_optimizer, spec)
+
+
+def solve_spec(optimizer, spec) -> dict:
+    """
+    Solve the lineup for one spec, then restore the optimizer's projections
+    and constraints
+
+    :param optimizer: DfsOptimizer
+    :param spec: dict with LineupSpec keys
+    :return: result of DfsOptimizer.optimize. If the spec has no feasible
+        lineup, the result has the solve status and no players
+    :raises RuntimeError: if the spec names a player or team that is not found
+    :raises ValueError: if the spec has a projection or initial lineup player
+        for an unknown player id
+    """
+    projections = spec.get(LineupSpec.PROJECTIONS, {})
+    # the spec may replace constraints of the same name, and the projections
+    # in effect may differ from the player dicts, so both are restored from
+    # copies
+    constraints = dict(optimizer.model.constraints)
+    previous = optimizer._projections.copy()
+    try:
+        optimizer.update_projections(projections)
+        optimizer.require_players(spec.get(LineupSpec.REQUIRE_PLAYERS, []))
+        optimizer.ignore_players(spec.get(LineupSpec.IGNORE_PLAYERS, []))
+        optimizer.ignore_teams(spec.get(LineupSpec.IGNORE_TEAMS, []))
+        optimizer.avoid_opponents(spec.get(LineupSpec.AVOID_OPPONENTS, []))
+        if LineupSpec.MAX_PLAYERS_FROM_SAME_TEAM in spec:
+            optimizer.set_max_players_from_same_team(
+                spec[LineupSpec.MAX_PLAYERS_FROM_SAME_TEAM])
+
+        try:
+            return optimizer.optimize(spec.get(LineupSpec.TIME_LIMIT),
+                                      spec.get(LineupSpec.MIP_GAP),
+                                      spec.get(LineupSpec.INITIAL_LINEUP))
+        except OptimizerException:
+            return {DfsOptimizer.IP_STATUS: optimizer.model.status,
+                    DfsOptimizer.LINEUP_SALARY: None,
+                    DfsOptimizer.LINEUP_PLAYERS: set(),
+                    DfsOptimizer.LINEUP_POINTS: None}
+    finally:
+        optimizer.update_projections(previous)
+        optimizer.model.constraints.clear()
+        optimizer.model.constraints.update(constraints)
@@ -0,0 +1,146 @@
+import hashlib
+import json
+import os
+from collections import OrderedDict
+
+
+class SolutionCache:
+    DEFAULT_MAX_SIZE = 128
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE, directory=None):
+        """
+        Cache of DfsOptimizer.optimize results keyed by model fingerprint. The
+        most recently used max_size results are kept in memory; if directory
+        is given, every result is also written there as JSON so that other
+        processes, and later runs, can read it.
+
+        :param max_size: most results held in memory
+        :param directory: directory of the on-disk store, or None to only
+            cache in memory
+        """
+        self.max_size = max_size
+        self.directory = directory
+        self._results = OrderedDict()
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def fingerprint(model, *extra) -> str:
+        """
+        Compute a canonical fingerprint of an IP model. The fingerprint does
+        not depend on constraint names or on the order in which constraints
+        and terms were added, so two models built from the same players,
+        roster and constraints have the same fingerprint.
+
+        :param model: pulp.LpProblem
+        :param extra: other values identifying the solve (e.g. the solver)
+        :return: hex digest
+        """
+        def terms(expression):
+            return sorted((v.name, float(c)) for v, c in expression.items())
+
+        variables = sorted((v.name, v.lowBound, v.upBound, v.cat)
+                           for v in model.variables())
+        constraints = sorted(
+            json.dumps([c.sense, float(c.constant), terms(c)])
+            for c in model.constraints.values())
+
+        digest = hashlib.sha256()
+        digest.update(json.dumps([model.sense, terms(model.objective),
+                                  variables, [repr(e) for e in extra]])
+                      .encode())
+        for constraint in constraints:
+            digest.update(constraint.encode())
+        return digest.hexdigest()
+
+    def get(self, fingerprint):
+        """
+        Look up a result
+
+        :param fingerprint: fingerprint from SolutionCache.fingerprint
+        :return: copy of the cached result, or None if there is none
+        """
+        if fingerprint in self._results:
+            self._results.move_to_end(fingerprint)
+            return SolutionCache._copy(self._results[fingerprint])
+
+        if self.directory is None:
+            return None
+        try:
+            with open(self._path(fingerprint)) as infile:
+                stored = json.load(infile)
+        except (OSError, ValueError):
+            return None
+
+        result = stored['result']
+        for key in stored['sets']:
+            result[key] = set(result[key])
+        self._remember(fingerprint, result)
+        return SolutionCache._copy(result)
+
+    def put(self, fingerprint, result):
+        """
+        Store a result
+
+        :param fingerprint: fingerprint from SolutionCache.fingerprint
+        :param result: result of DfsOptimizer.optimize
+        :return: None
+        """
+        result = SolutionCache._copy(result)
+        self._remember(fingerprint, result)
+
+        if self.directory is not None:
+            sets = [key for key, value in result.items()
+                    if isinstance(value, set)]
+            stored = {'result': {key: sorted(value) if key in sets else value
+                                 for key, value in result.items()},
+                      'sets': sets}
+            # write then rename so readers never see a partial file
+            path = self._path(fingerprint)
+            staging = path + '.' + str(os.getpid()) + '.tmp'
+            with open(staging, 'w') as outfile:
+                json.dump(stored, outfile)
+            os.replace(staging, path)
+
+    def clear(self):
+        """
+        Remove every result held in memory. The on-disk store is kept.
+
+        :return: None
+        """
+        self._results.clear()
+
+    def __len__(self):
+        return len(self._results)
+
+    def _remember(self, fingerprint, result):
+        """
+        Hold a result in memory, evicting the least recently used result if
+        more than max_size are held
+
+        :param fingerprint: fingerprint of the result
+        :param result: result of DfsOptimizer.optimize
+        :return: None
+        """
+        self._results[fingerprint] = result
+        self._results.move_to_end(fingerprint)
+        while len(self._results) > self.max_size:
+            self._results.popitem(last=False)
+
+    def _path(self, fingerprint):
+        """
+        :param fingerprint: fingerprint of a result
+        :return: path of the result in the on-disk store
+        """
+        return os.path.join(self.directory, fingerprint + '.json')
+
+    @staticmethod
+    def _copy(result):
+        """
+        Copy a result so callers cannot change cached player sets
+
+        :param result: result of DfsOptimizer.optimize
+        :return: copy of result
+        """
+        return {key: set(value) if isinstance(value, set) else value
+                for key, value in result.items()}
@@ -1,9 +1,39 @@
+import datetime
+import functools
 import json
+import math
+import re
+import time
 
+import numpy as np
 import pulp
 
+from fantasyopt.optimizer.cache import SolutionCache
 from fantasyopt.optimizer.exceptions import OptimizerException
+from fantasyopt.optimizer.lineup import Lineup
+from fantasyopt.optimizer.portfolio import Portfolio
+from fantasyopt.optimizer.solvers import STATUS_FEASIBLE, get_solver
 from fantasyopt.player import Player
+from fantasyopt.pool import PlayerPool
+from fantasyopt.profiling import NULL_PROFILER
+
+
+def _profiled(method):
+    """
+    Record each call of a DfsOptimizer method as a phase named after it, with
+    the number of constraints in the model afterwards
+
+    :param method: DfsOptimizer method
+    :return: wrapped method
+    """
+    @functools.wraps(method)
+    def profiled(self, *args, **kwargs):
+        with self.profiler.phase(DfsOptimizer.__name__,
+                                 method.__name__) as details:
+            result = method(self, *args, **kwargs)
+            details['constraints'] = len(self.model.constraints)
+        return result
+    return profiled
 
 
 class DfsOptimizer:
@@ -12,18 +42,33 @@ class DfsOptimizer:
     LINEUP_SALARY = 'lineup_cost'
     LINEUP_POINTS = 'lineup_points'
     LINEUP_PLAYERS = 'lineup_players'
+    LINEUP_BOUND = 'lineup_bound'
+    LINEUP_GAP = 'lineup_gap'
 
     IGNORE_PLAYER_PREFIX = 'ignore_'
     TEAM_MAX_PREFIX = 'team_max_'
     REQUIRE_PLAYER_PREFIX = 'require_'
     AVOID_OPPONENT_PREFIX = 'avoid_opponent_'
+    UNIQUE_LINEUP_PREFIX = 'unique_lineup_'
+    LATE_SWAP_PREFIX = 'late_swap_'
+    EXPOSURE_PREFIX = 'exposure_'
+
+    # abbreviations of the weekdays in game times, in datetime.weekday order
+    WEEKDAYS = ['mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun']
+
+    # a player is in the lineup if its variable is above this value, so that
+    # values a solver returns within its integrality tolerance of 0 or 1 are
+    # read correctly
+    SELECTION_THRESHOLD = 0.5
 
     def __init__(self, players, positions, budget, flex_positions=None,
-                 utility_requirement=0):
+                 utility_requirement=0, solver=None, solution_cache=None,
+                 profiler=None):
         """
         Construct IP model for player selection optimization
 
-        :param players:  dictionary of dictionaries representing players
+        :param players: fantasyopt.pool.PlayerPool, or dictionary of
+            dictionaries representing players
         :param positions: dictionary of position -> requirement
         :param budget: budget for player selection
         :param flex_positions: dict of
@@ -32,36 +77,78 @@ class DfsOptimizer:
         :param utility_requirement: number of utility players required. This
             parameter should only be used for roster positions that accept
             players from any position (e.g. Util in Yahoo NBA DFS)
+        :param solver: fantasyopt.optimizer.solvers.Solver instance or solver
+            name (e.g. 'cbc', 'highs', 'cp-sat') used by optimize. CBC is
+            used if None or if the named solver is not installed
+        :param solution_cache: fantasyopt.optimizer.cache.SolutionCache of
+            previous optimize results. If given, optimize returns the cached
+            result for an identical model instead of solving it
+        :param profiler: fantasyopt.profiling.Profiler recording the time of
+            model construction, constraint additions and each solve, or None
 
         :raises ValueError: if any player does not have all required attributes
+            or solver is unknown
         """
 
-        for player, attributes in players.items():
-            for attr in [Player.NAME, Player.POINTS_PROJECTION,
-                         Player.OPPONENT, Player.GAME_TIME, Player.SALARY,
-                         Player.INJURY_STATUS, Player.TEAM, Player.POSITION]:
-                if attr not in attributes.keys():
-                    raise ValueError('player \'' + player + '\' is missing '
-                                                            'required '
-                                                            'attribute \'' +
-                                     str(attr) + '\'')
-
         self.players = players
+        self.solver = get_solver(solver)
+        self.solution_cache = solution_cache
+        self.profiler = NULL_PROFILER if profiler is None else profiler
+
+        with self.profiler.phase(DfsOptimizer.__name__, 'convert',
+                                 players=len(players)):
+            if isinstance(players, PlayerPool):
+                pool = players
+            else:
+                pool = PlayerPool.from_dict(players)
+
+        with self.profiler.phase(DfsOptimizer.__name__, 'build') as details:
+            self._build(pool, positions, budget, flex_positions,
+                        utility_requirement)
+            details['variables'] = len(self._player_ids)
+            details['constraints'] = len(self.model.constraints)
+
+    def _build(self, pool, positions, budget, flex_positions,
+               utility_requirement):
+        """
+        Build the IP model
+
+        :param pool: PlayerPool of the players
+        :param positions: dictionary of position -> requirement
+        :param budget: budget for player selection
+        :param flex_positions: dict of
+            flex position name -> (set of valid positions, number required)
+        :param utility_requirement: number of utility players required
+        :return: None
+        """
+        self._player_ids = pool.ids
+        self._player_index = {p: i for i, p in enumerate(self._player_ids)}
+
+        # salaries, projections and positions are kept as arrays so that a
+        # lineup is read from the solution without evaluating the model
+        self._salaries = pool.column(Player.SALARY).astype(float)
+        self._projections = pool.column(Player.POINTS_PROJECTION).astype(float)
+        self._positions = pool.column(Player.POSITION)
+        # kept to group players by game time on the first late swap
+        self._pool = pool
+
+        # players are grouped by name, position, team and opponent once so
+        # each constraint is built from its group rather than a scan of players
+        self._groups = {attr: pool.groups(attr)
+                        for attr in [Player.NAME, Player.POSITION,
+                                     Player.TEAM, Player.OPPONENT]}
+
+        self._unique_lineup_count = 0
+        self.model = self._new_model()
 
-        # pass '%' so there is no leading underscore in the variable name
-        player_variables = pulp.LpVariable.dict('%s', players.keys(),
-                                                lowBound=0, upBound=1,
-                                                cat='Integer')
         position_constraints = {}
-        non_flex_count = self.add_position_constraints(player_variables,
-                                                       position_constraints,
+        non_flex_count = self.add_position_constraints(position_constraints,
                                                        positions,
                                                        flex_positions,
                                                        utility_requirement)
 
         if flex_positions is not None:
-            self.add_flex_constraints(player_variables,
-                                      position_constraints, flex_positions,
+            self.add_flex_constraints(position_constraints, flex_positions,
                                       non_flex_count,
                                       utility_requirement)
 
@@ -73,36 +160,58 @@ class DfsOptimizer:
                 for flex, (pos, count) in flex_positions.items():
                     non_utility_count += count
 
-            self.add_utility_constraint(player_variables, position_constraints,
+            self.add_utility_constraint(position_constraints,
                                         utility_requirement, non_utility_count)
 
-        budget_expression = \
-            pulp.LpAffineExpression([(player_variables[player],
-                                      attributes[Player.SALARY])
-                                     for player, attributes in players.items()])
-        budget_constraint = pulp.LpConstraint(
-            budget_expression, pulp.LpConstraintLE,
-            DfsOptimizer.LINEUP_SALARY, budget)
-
-        self.model = pulp.LpProblem('DFS Optimizer', pulp.LpMaximize)
-        self.model += sum([
-            attributes[Player.POINTS_PROJECTION] * player_variables[player]
-            for player, attributes in players.items()
-        ])
-
         self.model.constraints = position_constraints
         self.model.constraints.update({
-            self.LINEUP_SALARY: budget_constraint
+            self.LINEUP_SALARY: self._budget_constraint(budget)
         })
 
-    def add_position_constraints(self, player_variables,
-                                 position_constraints, positions,
-                                 flex_positions,
-                                 utility_requirement):
+    def _new_model(self):
+        """
+        Create the player variables and the model with its objective
+
+        :return: pulp.LpProblem with no constraints
+        """
+        # pass '%' so there is no leading underscore in the variable name
+        player_variables = pulp.LpVariable.dict('%s', self._player_ids,
+                                                lowBound=0, upBound=1,
+                                                cat='Integer')
+        self._variables = [player_variables[p] for p in self._player_ids]
+
+        model = pulp.LpProblem('DFS Optimizer', pulp.LpMaximize)
+        model += pulp.LpAffineExpression(
+            zip(self._variables, self._projections.tolist()))
+        return model
+
+    def _budget_constraint(self, budget):
+        """
+        Build the constraint on the total salary of the lineup
+
+        :param budget: budget for player selection
+        :return: pulp constraint
+        """
+        budget_expression = pulp.LpAffineExpression(
+            zip(self._variables, self._salaries.tolist()))
+        return pulp.LpConstraint(budget_expression, pulp.LpConstraintLE,
+                                 DfsOptimizer.LINEUP_SALARY, budget)
+
+    def _group(self, attribute, value):
+        """
+        Get indices of the players whose attribute is equal to value
+
+        :param attribute: attribute grouped at construction (e.g. Player.TEAM)
+        :param value: value of the attribute
+        :return: array of player indices, empty if no player matches
+        """
+        return self._groups[attribute].get(value, np.array([], dtype=int))
+
+    def add_position_constraints(self, position_constraints, positions,
+                                 flex_positions, utility_requirement):
         """
         Add position constraints
 
-        :param player_variables: dict of player id -> pulp variable
         :param position_constraints: dict of constraint name -> pulp constraint
         :param positions: dictionary of position -> requirement
         :param flex_positions: dict of
@@ -127,29 +236,21 @@ class DfsOptimizer:
                     position_to_flex_map[p] = flex
 
         for position, requirement in positions.items():
-            affine_expression = \
-                pulp.LpAffineExpression([(player_variables[player], 1)
-                                         for player, attributes in
-                                         self.players.items() if
-                                         attributes[Player.POSITION] ==
-                                         position])
-
             sense = pulp.LpConstraintEQ
             if position in position_to_flex_map or utility_requirement > 0:
                 sense = pulp.LpConstraintGE
 
-            position_constraints[position] = pulp.LpConstraint(
-                affine_expression, sense, position, requirement)
+            position_constraints[position] = self._constraint(
+                position, self._group(Player.POSITION, position), sense,
+                requirement)
 
         return non_flex_count
 
-    def add_flex_constraints(self, player_variables, position_constraints,
-                             flex_positions, non_flex_count,
-                             utility_requirement):
+    def add_flex_constraints(self, position_constraints, flex_positions,
+                             non_flex_count, utility_requirement):
         """
         Add flex constraints
 
-        :param player_variables: dict of player id -> pulp variable
         :param position_constraints: dict of constraint name -> pulp constraint
         :param flex_positions: dict of
             flex position name -> (set of valid positions, number required)
@@ -162,76 +263,345 @@ class DfsOptimizer:
         :return: None
         """
         for flex, (allowed, requirement) in flex_positions.items():
-            affine_expression = \
-                pulp.LpAffineExpression([(player_variables[player], 1)
-                                         for player, attributes in
-                                         self.players.items() if
-                                         attributes[Player.POSITION] in
-                                         allowed])
+            indices = np.concatenate(
+                [self._group(Player.POSITION, position)
+                 for position in sorted(allowed)])
 
             sense = pulp.LpConstraintEQ
             if utility_requirement > 0:
                 sense = pulp.LpConstraintGE
 
-            position_constraints[flex] = pulp.LpConstraint(
-                affine_expression, sense, flex,
-                requirement + non_flex_count[flex])
+            position_constraints[flex] = self._constraint(
+                flex, indices, sense, requirement + non_flex_count[flex])
 
-    def add_utility_constraint(self, player_variables, position_constraints,
+    def add_utility_constraint(self, position_constraints,
                                utility_requirement, non_utility_count):
         """
         Add utility position requirement. A utility position is one that accepts
         a player from any position.
 
-        :param player_variables: dict of player id -> pulp variable
         :param position_constraints: dict of constraint name -> pulp constraint
         :param utility_requirement: number of utility players required
         :param non_utility_count: number of players required to be non-utility
         :return: None
         """
-        affine_expression = \
-            pulp.LpAffineExpression([(player_variables[player], 1)
-                                     for player, attributes in
-                                     self.players.items()])
         position_constraints[DfsOptimizer.UTILITY_CONSTRAINT] = \
-            pulp.LpConstraint(affine_expression, pulp.LpConstraintEQ,
-                              DfsOptimizer.UTILITY_CONSTRAINT,
-                              utility_requirement + non_utility_count)
+            self._constraint(DfsOptimizer.UTILITY_CONSTRAINT,
+                             np.arange(len(self._player_ids)),
+                             pulp.LpConstraintEQ,
+                             utility_requirement + non_utility_count)
+
+    @_profiled
+    def update_projections(self, projections):
+        """
+        Replace the points projections in the objective without rebuilding
+        the model. The player dictionaries in self.players are not modified.
+
+        :param projections: dict of player id -> points projection for the
+            players to update, or sequence of points projections for every
+            player, in the iteration order of self.players
+        :return: None
+        :raises ValueError: if a player id is not found or the number of
+            projections does not match the number of players
+        """
+        self._update_coefficients(self.model.objective, self._projections,
+                                  projections)
+
+    @_profiled
+    def update_salaries(self, salaries):
+        """
+        Replace the salaries in the budget constraint without rebuilding the
+        model. The player dictionaries in self.players are not modified.
+
+        :param salaries: dict of player id -> salary for the players to update,
+            or sequence of salaries for every player, in the iteration order
+            of self.players
+        :return: None
+        :raises ValueError: if a player id is not found or the number of
+            salaries does not match the number of players
+        """
+        self._update_coefficients(
+            self.model.constraints[DfsOptimizer.LINEUP_SALARY], self._salaries,
+            salaries)
+
+    def _update_coefficients(self, expression, array, values):
+        """
+        Replace the coefficients of player variables in expression, and the
+        matching values in array, in place
+
+        :param expression: pulp expression or constraint over player variables
+        :param array: array of the coefficients in the order of the players
+        :param values: dict of player id -> coefficient, or sequence of
+            coefficients for every player in the iteration order of
+            self.players
+        :return: None
+        :raises ValueError: if a player id is not found or the number of
+            values does not match the number of players
+        """
+        if isinstance(values, dict):
+            indices = []
+            for player in values:
+                if player not in self._player_index:
+                    raise ValueError('No player with id ' + str(player) +
+                                     ' found')
+                indices.append(self._player_index[player])
+            indices = np.array(indices, dtype=int)
+            values = np.array(list(values.values()), dtype=float)
+        else:
+            values = np.asarray(values, dtype=float)
+            if len(values) != len(self._player_ids):
+                raise ValueError('Expected ' + str(len(self._player_ids)) +
+                                 ' values, got ' + str(len(values)))
+            indices = np.arange(len(values))
+
+        array[indices] = values
+        self._set_coefficients(expression, indices, values)
+
+    def _set_coefficients(self, expression, indices, values):
+        """
+        Replace the coefficients of player variables in expression in place
 
-    def optimize(self) -> dict:
+        :param expression: pulp expression or constraint over player variables
+        :param indices: array of player indices
+        :param values: array of the new coefficients of those players
+        :return: None
+        """
+        for i, value in zip(indices.tolist(), values.tolist()):
+            expression[self._variables[i]] = value
+
+    def optimize(self, time_limit=None, mip_gap=None, initial_lineup=None,
+                 partial_start=False) -> dict:
         """
         Optimize IP to find best lineup for given model
 
+        If time_limit or mip_gap is given, the solve is anytime: it stops at
+        time_limit, or once the lineup is within mip_gap of the best bound,
+        and returns the best lineup found so far. Its status is
+        fantasyopt.optimizer.solvers.STATUS_FEASIBLE if it stopped at
+        time_limit before proving the lineup optimal. If the solver reported
+        a bound, the result also has DfsOptimizer.LINEUP_BOUND, the best bound
+        on the points of any lineup proven by the solver, and
+        DfsOptimizer.LINEUP_GAP, the relative gap between the lineup's points
+        and that bound.
+
+        If initial_lineup is given, it is passed to the solver as a starting
+        solution (a MIP start) to prune its search, e.g. the previous optimum
+        when the model has changed only slightly. CBC, HiGHS and CP-SAT use
+        it; SparseDfsOptimizer's MilpSolver ignores it. A lineup that is not
+        feasible in the model does not change the result, but CP-SAT may
+        still use it as a hint and other solvers discard it. With
+        partial_start, initial_lineup may be part of a lineup, and HiGHS and
+        CP-SAT complete it under the model's constraints; CBC only accepts
+        complete starts, so it ignores a partial one.
+
+        :param time_limit: seconds after which the solver stops, or None
+        :param mip_gap: relative gap at which the solver stops, or None to
+            prove optimality
+        :param initial_lineup: iterable of the player ids of a lineup to start
+            from (e.g. a Lineup or DfsOptimizer.LINEUP_PLAYERS of a result),
+            or None
+        :param partial_start: if true, players not in initial_lineup are left
+            for the solver to choose rather than starting out of the lineup
         :return: dictionary of the form {
             DfsOptimizer.IP_STATUS_STR: solve status,
             DfsOptimizer.LINEUP_SALARY_STR: cost of lineup,
             DfsOptimizer.LINEUP_PLAYERS_STR: set of players to put in lineup,
             DfsOptimizer.LINEUP_POINTS_STR: total points scored projection
         }
+        :raises ValueError: if a player id in initial_lineup is not found
+        :raises OptimizerException: if the model was not solved to optimality,
+            or for an anytime solve, if no lineup was found
+        """
+        return self.optimize_lineup(time_limit, mip_gap, initial_lineup,
+                                    partial_start).to_result()
+
+    def optimize_lineup(self, time_limit=None, mip_gap=None,
+                        initial_lineup=None, partial_start=False) -> Lineup:
+        """
+        Optimize IP to find best lineup for given model, as optimize, and
+        return it as a Lineup with its players grouped by position. Only
+        lineups proven optimal are cached.
+
+        :param time_limit: seconds after which the solver stops, or None
+        :param mip_gap: relative gap at which the solver stops, or None
+        :param initial_lineup: player ids of a lineup to start from, or None
+        :param partial_start: if true, initial_lineup may be part of a lineup
+        :return: Lineup, with its bound and gap for an anytime solve
+        :raises ValueError: if a player id in initial_lineup is not found
+        :raises OptimizerException: if the model was not solved to optimality,
+            or for an anytime solve, if no lineup was found
         """
-        self.model.solve()
+        anytime = time_limit is not None or mip_gap is not None
+        start = None if initial_lineup is None \
+            else self._indices(initial_lineup)
+        if self.solution_cache is not None:
+            with self.profiler.phase(DfsOptimizer.__name__,
+                                     'cache_lookup') as details:
+                fingerprint = self.fingerprint()
+                result = self.solution_cache.get(fingerprint)
+                details['hit'] = result is not None
+            if result is not None:
+                self.model.status = result[DfsOptimizer.IP_STATUS]
+                indices = np.array(sorted(
+                    self._player_index[p]
+                    for p in result[DfsOptimizer.LINEUP_PLAYERS]), dtype=int)
+                lineup = self._lineup(indices)
+                if anytime:
+                    lineup.bound, lineup.gap = lineup.points, 0.0
+                return lineup
+
+        with self.profiler.phase(DfsOptimizer.__name__, 'solve',
+                                 solver=type(self.solver).__name__,
+                                 variables=len(self._player_ids),
+                                 constraints=len(self.model.constraints),
+                                 warm_start=start is not None) as details:
+            # options are only passed when used, so that Solvers written
+            # before them, which take only the model, still work
+            options = {}
+            if anytime:
+                options.update(time_limit=time_limit, mip_gap=mip_gap)
+            if start is not None:
+                self._set_start(start, partial_start)
+                options['warm_start'] = True
+            self.solver.solve(self.model, **options)
+            details['status'] = pulp.LpStatus.get(self.model.status,
+                                                  self.model.status)
+
+        with self.profiler.phase(DfsOptimizer.__name__, 'extract'):
+            lineup = self._extract(anytime)
+            if anytime:
+                lineup.bound, lineup.gap = self._gap(lineup.points,
+                                                     mip_gap is None)
+
+        if self.solution_cache is not None and mip_gap is None and \
+                lineup.status == pulp.LpStatusOptimal:
+            self.solution_cache.put(fingerprint, lineup.to_result())
+        return lineup
 
-        result = {DfsOptimizer.IP_STATUS: self.model.status,
-                  DfsOptimizer.LINEUP_SALARY: None,
-                  DfsOptimizer.LINEUP_PLAYERS: set(),
-                  DfsOptimizer.LINEUP_POINTS: None}
-        if self.model.status != pulp.LpStatusOptimal:
+    def _extract(self, anytime=False) -> Lineup:
+        """
+        Read the lineup from the solved model. The solution is read into an
+        array once, and the salary and points of the lineup are summed from
+        the players' arrays rather than by evaluating the model.
+
+        :param anytime: if true, also accept a lineup that is feasible but
+            not proven optimal
+        :return: Lineup
+        :raises OptimizerException: if the model was not solved to optimality
+            (or to feasibility, if anytime)
+        """
+        statuses = (pulp.LpStatusOptimal, STATUS_FEASIBLE) if anytime \
+            else (pulp.LpStatusOptimal,)
+        if self.model.status not in statuses:
             raise OptimizerException('Model exited with status ' +
                                      str(self.model.status))
 
-        result[DfsOptimizer.LINEUP_SALARY] = \
-            pulp.value(
-                self.model.constraints[DfsOptimizer.LINEUP_SALARY]) - \
-            self.model.constraints[DfsOptimizer.LINEUP_SALARY].constant
+        return self._lineup(np.flatnonzero(
+            self._solution() > DfsOptimizer.SELECTION_THRESHOLD))
 
-        result[DfsOptimizer.LINEUP_POINTS] = \
-            pulp.value(self.model.objective)
+    def _gap(self, points, exact) -> tuple:
+        """
+        Get the bound the solver proved in its last solve and the relative
+        gap of a lineup to it
+
+        :param points: points of the lineup found
+        :param exact: if true, an optimal status means the lineup is proven
+            optimal rather than within a gap target
+        :return: tuple of (bound, gap), or (None, None) if the solver did not
+            report a bound
+        """
+        bound = self.solver.bound
+        if exact and self.model.status == pulp.LpStatusOptimal:
+            bound = points
+        if bound is None:
+            return None, None
+        # a bound below the lineup's points is solver tolerance (or rounding,
+        # for CP-SAT's scaled objective)
+        bound = max(float(bound), points)
+        return bound, (bound - points) / max(abs(points), 1e-9)
+
+    def _set_start(self, indices, partial=False):
+        """
+        Set the starting solution passed to the solver by warm_start
+
+        :param indices: array of the indices of the players in the lineup
+        :param partial: if true, leave the value of every other player unset
+            rather than 0
+        :return: None
+        """
+        values = np.full(len(self._variables), None if partial else 0)
+        values[indices] = 1
+        for var, value in zip(self._variables, values.tolist()):
+            var.varValue = value
 
-        for var_name, var in self.model.variablesDict().items():
-            if var.varValue == 1:
-                result[DfsOptimizer.LINEUP_PLAYERS].add(var.name)
+    def _next_start(self, lineup, min_unique_players, excluded=()):
+        """
+        Get a partial start for the lineup following lineup in a sequence of
+        unique lineups: lineup without the min_unique_players players with
+        the lowest projections, which the solver replaces
+
+        :param lineup: Lineup found last
+        :param min_unique_players: minimum number of players that must differ
+        :param excluded: indices of players that cannot be in the next lineup
+        :return: list of the player ids to start from
+        """
+        indices = np.setdiff1d(self._indices(lineup), excluded)
+        kept = np.argsort(-self._projections[indices], kind='stable')[
+            :len(lineup) - min_unique_players]
+        return [self._player_ids[i] for i in indices[kept].tolist()]
 
-        return result
+    def _indices(self, player_ids) -> np.ndarray:
+        """
+        Get the indices of players
+
+        :param player_ids: iterable of player ids
+        :return: array of the players' indices, in the order of player_ids
+        :raises ValueError: if a player id is not found
+        """
+        indices = []
+        for player in player_ids:
+            if player not in self._player_index:
+                raise ValueError('No player with id ' + str(player) + ' found')
+            indices.append(self._player_index[player])
+        return np.array(indices, dtype=int)
+
+    def _solution(self) -> np.ndarray:
+        """
+        Read the value of every player variable from the solved model
+
+        :return: array of values, in the order of the players
+        """
+        return np.fromiter((var.varValue or 0 for var in self._variables),
+                           dtype=float, count=len(self._variables))
+
+    def _lineup(self, indices) -> Lineup:
+        """
+        Build the Lineup of the selected players
+
+        :param indices: sorted array of the indices of the selected players
+        :return: Lineup with the model's status
+        """
+        player_ids = tuple(self._player_ids[i] for i in indices.tolist())
+        positions = {}
+        for p, position in zip(player_ids,
+                               self._positions[indices].tolist()):
+            positions.setdefault(position, []).append(p)
+
+        return Lineup(self.model.status, player_ids,
+                      float(self._salaries[indices].sum()),
+                      float(self._projections[indices].sum()),
+                      {position: tuple(players)
+                       for position, players in positions.items()})
+
+    def fingerprint(self) -> str:
+        """
+        Compute a canonical fingerprint of the model, covering the players'
+        projections and salaries, the roster, the budget, every added
+        constraint and the solver
+
+        :return: hex digest, equal for identical models
+        """
+        return SolutionCache.fingerprint(self.model, type(self.solver).__name__)
 
     def generate_lineup(self, display_lineup=True):
         """
@@ -241,11 +611,243 @@ class DfsOptimizer:
         :param display_lineup: if true, print lineup in JSON to console
         :return: dict that is the lineup, organized by position
         """
-        result = self.optimize()
+        return self.format_lineup(self.optimize(), display_lineup)
+
+    def generate_lineups(self, n, min_unique_players=1, display_lineup=False):
+        """
+        Generate up to n lineups in decreasing order of projected points. After
+        each lineup is found, a constraint is added to the model so that every
+        following lineup differs from it by at least min_unique_players
+        players, and the same model is solved again. The constraints remain in
+        the model (as DfsOptimizer.UNIQUE_LINEUP_PREFIX + a counter), so a later
+        call continues from the lineups already generated. Each solve after
+        the first starts from the previous lineup without its
+        min_unique_players lowest projected players, as a partial start (see
+        optimize).
+
+        Fewer than n lineups are generated if the model becomes infeasible
+        before n lineups are found.
+
+        :param n: maximum number of lineups to generate
+        :param min_unique_players: minimum number of players in which each
+            lineup differs from every previously generated lineup
+        :param display_lineup: if true, print each lineup in JSON to console
+        :return: generator of dicts that are the lineups, organized by position
+        :raises ValueError: if min_unique_players is less than 1
+        :raises OptimizerException: if no lineup at all can be generated
+        """
+        if min_unique_players < 1:
+            raise ValueError('min_unique_players must be at least 1')
+
+        start = None
+        for i in range(n):
+            try:
+                result = self.optimize(initial_lineup=start,
+                                       partial_start=True)
+            except OptimizerException:
+                if i == 0:
+                    raise
+                return
+
+            players = result[DfsOptimizer.LINEUP_PLAYERS]
+            self.add_unique_lineup_constraint(players, min_unique_players)
+            start = self._next_start(players, min_unique_players)
+            yield self.format_lineup(result, display_lineup)
+
+    def generate_portfolio(self, n, max_exposure=1.0, min_exposure=None,
+                           min_unique_players=1, time_limit=None) -> Portfolio:
+        """
+        Generate up to n lineups whose player exposures, the fraction of the
+        lineups each player is in, stay within limits. Lineups are solved one
+        at a time on this model, as in generate_lineups, and the limits are
+        enforced by tightening constraints between solves: a player that has
+        reached its maximum count is excluded from every following lineup, and
+        a player that needs every remaining lineup to reach its minimum count
+        is required in it.
+
+        Maximum counts are rounded down and minimum counts up, as fractions
+        of n. Fewer than n lineups are generated if the model becomes
+        infeasible or time_limit is reached, so minimum exposures may not be
+        met; the exposures achieved are reported by the Portfolio. Every
+        constraint added is removed before returning. Each solve starts from
+        the previous lineup, as in generate_lineups.
+
+        With a time_limit, each solve is given the time remaining, and the
+        first i lineups may only include a player as often as its maximum
+        exposure of i lineups, rounded down but at least once, so that a
+        portfolio cut short keeps to the maximums once it is long enough. If
+        fewer than n lineups are solved, the portfolio ends at the last
+        lineup after which every exposure was within its maximum, which may
+        leave it empty.
+
+        :param n: number of lineups to generate
+        :param max_exposure: maximum exposure of every player, or dict of
+            player id -> maximum exposure; players not in the dict have no
+            maximum
+        :param min_exposure: dict of player id -> minimum exposure, or None
+        :param min_unique_players: minimum number of players in which each
+            lineup differs from every previously generated lineup
+        :param time_limit: seconds after which no further lineup is solved,
+            or None
+        :return: Portfolio
+        :raises ValueError: if an exposure is not in [0, 1], a minimum is
+            above its maximum, a player id is not found, or
+            min_unique_players is less than 1
+        """
+        if min_unique_players < 1:
+            raise ValueError('min_unique_players must be at least 1')
+
+        size = len(self._player_ids)
+        max_counts = np.full(size, n)
+        min_counts = np.zeros(size, dtype=int)
+        # maximum exposure of each player, for lineups cut short by time_limit
+        max_fractions = np.ones(size)
+        if isinstance(max_exposure, dict):
+            limits = [(max_counts, max_exposure, math.floor)]
+        else:
+            max_counts[:] = self._exposure_count(max_exposure, n, math.floor)
+            max_fractions[:] = max_exposure
+            limits = []
+        limits.append((min_counts, min_exposure or {}, math.ceil))
+
+        for counts, exposures, rounding in limits:
+            for player, exposure in exposures.items():
+                if player not in self._player_index:
+                    raise ValueError('No player with id ' + str(player) +
+                                     ' found')
+                counts[self._player_index[player]] = \
+                    self._exposure_count(exposure, n, rounding)
+                if counts is max_counts:
+                    max_fractions[self._player_index[player]] = exposure
+        if np.any(min_counts > max_counts):
+            raise ValueError('Minimum exposure is above maximum exposure')
+
+        start = time.perf_counter()
+        constraints = set(self.model.constraints)
+        lineups = []
+        counts = np.zeros(size, dtype=int)
+        # length of the longest portfolio with every exposure within its
+        # maximum
+        within_limits = 0
+        try:
+            for i in range(n):
+                remaining = None
+                caps = max_counts
+                if time_limit is not None:
+                    remaining = time_limit - (time.perf_counter() - start)
+                    if remaining <= 0:
+                        break
+                    caps = np.floor(np.round(max_fractions * (i + 1), 9))
+                    caps = np.minimum(max_counts, np.where(
+                        max_fractions > 0, np.maximum(caps, 1), 0))
+
+                excluded = np.flatnonzero(counts >= caps)
+                required = np.flatnonzero(min_counts - counts >= n - i)
+                for suffix, indices, rhs in [('max', excluded, 0),
+                                             ('min', required, len(required))]:
+                    name = DfsOptimizer.EXPOSURE_PREFIX + suffix
+                    self.model.constraints.pop(name, None)
+                    if len(indices) > 0:
+                        self.model.constraints[name] = self._constraint(
+                            name, indices, pulp.LpConstraintEQ, rhs)
+
+                initial = None if not lineups else self._next_start(
+                    lineups[-1], min_unique_players, excluded)
+                try:
+                    lineup = self.optimize_lineup(time_limit=remaining,
+                                                  initial_lineup=initial,
+                                                  partial_start=True)
+                except OptimizerException:
+                    break
+
+                lineups.append(lineup)
+                counts[[self._player_index[p] for p in lineup]] += 1
+                if np.all(counts <= np.floor(
+                        np.round(max_fractions * (i + 1), 9))):
+                    within_limits = i + 1
+                self.add_unique_lineup_constraint(lineup.player_ids,
+                                                  min_unique_players)
+        finally:
+            for name in list(self.model.constraints):
+                if name not in constraints:
+                    del self.model.constraints[name]
+
+        if time_limit is not None and len(lineups) < n:
+            lineups = lineups[:within_limits]
+            counts[:] = 0
+            for lineup in lineups:
+                counts[[self._player_index[p] for p in lineup]] += 1
+
+        return Portfolio(lineups, {self._player_ids[i]: int(counts[i])
+                                   for i in np.flatnonzero(counts)})
+
+    @staticmethod
+    def _exposure_count(exposure, n, rounding) -> int:
+        """
+        Convert an exposure to a number of lineups
+
+        :param exposure: fraction of lineups, in [0, 1]
+        :param n: number of lineups
+        :param rounding: math.floor or math.ceil
+        :return: number of lineups
+        :raises ValueError: if exposure is not in [0, 1]
+        """
+        if not 0 <= exposure <= 1:
+            raise ValueError('Exposure must be in [0, 1], got ' +
+                             str(exposure))
+        # round away floating point error before rounding, so that 0.4 of
+        # 150 lineups is 60
+        return int(rounding(round(exposure * n, 9)))
+
+    @_profiled
+    def add_unique_lineup_constraint(self, lineup_players, min_unique_players):
+        """
+        Constrain the solver so that any following lineup shares at most
+        len(lineup_players) - min_unique_players players with lineup_players.
+
+        :param lineup_players: set of player ids in the lineup, as in
+            DfsOptimizer.LINEUP_PLAYERS of the result of optimize
+        :param min_unique_players: minimum number of players that must differ
+        :return: None
+        """
+        constraint_name = DfsOptimizer.UNIQUE_LINEUP_PREFIX + \
+            str(self._unique_lineup_count)
+        self._unique_lineup_count += 1
+
+        indices = np.array([self._player_index[p] for p in lineup_players],
+                           dtype=int)
+        self.model.constraints[constraint_name] = self._constraint(
+            constraint_name, indices, pulp.LpConstraintLE,
+            len(lineup_players) - min_unique_players)
+
+    def format_lineup(self, result, display_lineup=True):
+        """
+        Organize the players of an optimize result by position
+
+        :param result: result of optimize
+        :param display_lineup: if true, print lineup in JSON to console
+        :return: dict that is the lineup, organized by position
+        """
+        lineup = DfsOptimizer.organize_lineup(self.players, result)
+
+        if display_lineup is True:
+            print(json.dumps(lineup, sort_keys=True, indent=4))
+
+        return lineup
+
+    @staticmethod
+    def organize_lineup(players, result):
+        """
+        Organize the players of an optimize result by position
+
+        :param players: players the result was solved from
+        :param result: result of optimize
+        :return: dict that is the lineup, organized by position
+        """
         lineup = {}
 
         for p in result[DfsOptimizer.LINEUP_PLAYERS]:
-            player = self.players[p]
+            player = players[p]
             pos = player[Player.POSITION]
 
             if pos not in lineup:
@@ -262,9 +864,6 @@ class DfsOptimizer:
                 Player.TEAM: player[Player.TEAM]
             })
 
-        if display_lineup is True:
-            print(json.dumps(lineup, sort_keys=True, indent=4))
-
         return lineup
 
     def ignore_player(self, player_name, player_position=None,
@@ -281,39 +880,24 @@ class DfsOptimizer:
         :return: None
         :raises RuntimeError: if no player with the given conditions is found
         """
-        constraint_name = DfsOptimizer.IGNORE_PLAYER_PREFIX + player_name
-        player_variables = []
-        for var_id, var in self.model.variablesDict().items():
-            if self.players[var.name][Player.NAME] == player_name:
-                player_variables.append((var, 1))
-
-        if player_position is not None:
-            constraint_name += player_position
-            temp = []
-            for var, coefficient in player_variables:
-                if self.players[var.name][Player.POSITION] == player_position:
-                    temp.append((var, coefficient))
-            player_variables = temp
-
-        if player_team is not None:
-            constraint_name += player_team
-            temp = []
-            for var, coefficient in player_variables:
-                if self.players[var.name][Player.TEAM] == player_team:
-                    temp.append((var, coefficient))
-            player_variables = temp
+        self.ignore_players([(player_name, player_position, player_team)])
 
-        if len(player_variables) == 0:
-            error_msg = 'No player named ' + player_name
-            if player_position is not None:
-                error_msg += ' (' + player_position + ')'
-            if player_team is not None:
-                error_msg += ' on ' + player_team
-            raise RuntimeError(error_msg + ' found')
+    @_profiled
+    def ignore_players(self, players):
+        """
+        Ignore many players at once, as if ignore_player were called for each.
+        No constraint is added if any player is not found.
 
-        affine_expression = pulp.LpAffineExpression(player_variables)
-        self.model.constraints[constraint_name] = pulp.LpConstraint(
-            affine_expression, pulp.LpConstraintEQ, constraint_name, 0)
+        :param players: list of player names, or of tuples of
+            (name, position, team) as passed to ignore_player, where position
+            and team may be None
+        :return: None
+        :raises RuntimeError: if no player with the given conditions is found
+        """
+        constraints = dict(
+            self._player_constraint(DfsOptimizer.IGNORE_PLAYER_PREFIX, player,
+                                    0) for player in players)
+        self.model.constraints.update(constraints)
 
     def ignore_team(self, team_name):
         """
@@ -324,18 +908,28 @@ class DfsOptimizer:
         :return: None
         :raises RuntimeError: if no team with the given name is found
         """
-        constraint_name = DfsOptimizer.IGNORE_PLAYER_PREFIX + team_name
-        player_variables = []
-        for var_id, var in self.model.variablesDict().items():
-            if self.players[var.name][Player.TEAM] == team_name:
-                player_variables.append((var, 1))
+        self.ignore_teams([team_name])
 
-        if len(player_variables) == 0:
-            raise RuntimeError('No players on ' + team_name + ' found')
+    @_profiled
+    def ignore_teams(self, team_names):
+        """
+        Ignore many teams at once, as if ignore_team were called for each. No
+        constraint is added if any team is not found.
 
-        affine_expression = pulp.LpAffineExpression(player_variables)
-        self.model.constraints[constraint_name] = pulp.LpConstraint(
-            affine_expression, pulp.LpConstraintEQ, constraint_name, 0)
+        :param team_names: list of names of teams to ignore
+        :return: None
+        :raises RuntimeError: if no team with one of the given names is found
+        """
+        constraints = {}
+        for team_name in team_names:
+            indices = self._group(Player.TEAM, team_name)
+            if len(indices) == 0:
+                raise RuntimeError('No players on ' + team_name + ' found')
+
+            constraint_name = DfsOptimizer.IGNORE_PLAYER_PREFIX + team_name
+            constraints[constraint_name] = self._constraint(
+                constraint_name, indices, pulp.LpConstraintEQ, 0)
+        self.model.constraints.update(constraints)
 
     def avoid_opponent(self, team_name):
         """
@@ -346,20 +940,31 @@ class DfsOptimizer:
         :return: None
         :raises RuntimeError: if no team with the given name is found
         """
-        constraint_name = DfsOptimizer.AVOID_OPPONENT_PREFIX + team_name
-        player_variables = []
-        for var_id, var in self.model.variablesDict().items():
-            if self.players[var.name][Player.OPPONENT] == team_name:
-                player_variables.append((var, 1))
-
-        if len(player_variables) == 0:
-            raise RuntimeError('No players playing against ' + team_name +
-                               ' found')
+        self.avoid_opponents([team_name])
 
-        affine_expression = pulp.LpAffineExpression(player_variables)
-        self.model.constraints[constraint_name] = pulp.LpConstraint(
-            affine_expression, pulp.LpConstraintEQ, constraint_name, 0)
+    @_profiled
+    def avoid_opponents(self, team_names):
+        """
+        Avoid many opponents at once, as if avoid_opponent were called for
+        each. No constraint is added if any opponent is not found.
 
+        :param team_names: list of names of opponents to avoid
+        :return: None
+        :raises RuntimeError: if no team with one of the given names is found
+        """
+        constraints = {}
+        for team_name in team_names:
+            indices = self._group(Player.OPPONENT, team_name)
+            if len(indices) == 0:
+                raise RuntimeError('No players playing against ' + team_name +
+                                   ' found')
+
+            constraint_name = DfsOptimizer.AVOID_OPPONENT_PREFIX + team_name
+            constraints[constraint_name] = self._constraint(
+                constraint_name, indices, pulp.LpConstraintEQ, 0)
+        self.model.constraints.update(constraints)
+
+    @_profiled
     def set_max_players_from_same_team(self, maximum):
         """
         Constrain the solver so that at most 'maximum' players from the same
@@ -368,18 +973,11 @@ class DfsOptimizer:
         :param maximum: max number of players from team team_name allowed
         :return: None
         """
-        team_expressions = {}
-        for var_id, var in self.model.variablesDict().items():
-            team = self.players[var.name][Player.TEAM]
-            if team not in team_expressions:
-                team_expressions[team] = pulp.LpAffineExpression(name=team, constant=0)
-            team_expressions[team] = team_expressions[team] + var
-
         team_constraints = {}
-        for team in team_expressions:
-            team_constraints[DfsOptimizer.TEAM_MAX_PREFIX + team] = \
-                pulp.LpConstraint(team_expressions[team], pulp.LpConstraintLE,
-                                  DfsOptimizer.TEAM_MAX_PREFIX + team, maximum)
+        for team, indices in self._groups[Player.TEAM].items():
+            constraint_name = DfsOptimizer.TEAM_MAX_PREFIX + team
+            team_constraints[constraint_name] = self._constraint(
+                constraint_name, indices, pulp.LpConstraintLE, maximum)
         self.model.constraints.update(team_constraints)
 
     def require_player(self, player_name, player_position=None,
@@ -397,30 +995,183 @@ class DfsOptimizer:
         :return: None
         :raises RuntimeError: if no player with the given conditions is found
         """
+        self.require_players([(player_name, player_position, player_team)])
+
+    @_profiled
+    def require_players(self, players):
+        """
+        Require many players at once, as if require_player were called for
+        each. No constraint is added if any player is not found.
+
+        :param players: list of player names, or of tuples of
+            (name, position, team) as passed to require_player, where position
+            and team may be None
+        :return: None
+        :raises RuntimeError: if no player with the given conditions is found
+        """
+        constraints = dict(
+            self._player_constraint(DfsOptimizer.REQUIRE_PLAYER_PREFIX, player,
+                                    1) for player in players)
+        self.model.constraints.update(constraints)
+
+    @_profiled
+    def late_swap(self, lineup_players, now, slate_start=None) -> dict:
+        """
+        Re-optimize a lineup after some games have started. A player is
+        locked if its Player.GAME_TIME is at or before now. Locked players in
+        lineup_players are kept in the lineup, every other locked player is
+        excluded, and the remaining slots are filled by solving the model
+        again. The lock constraints are removed after solving, so the
+        optimizer can be reused for other lineups; constraints already in the
+        model still apply. The current lineup is passed to the solver as the
+        starting solution.
+
+        :param lineup_players: ids of the players in the current lineup
+        :param now: current time, in a form parse_game_time can compare with
+            the players' game times
+        :param slate_start: date of the first game of the slate, needed if
+            game times are times of day (see parse_game_time)
+        :return: result as returned by optimize
+        :raises ValueError: if a player id is not found or a game time cannot
+            be compared with now
+        :raises OptimizerException: if no lineup keeps the locked players
+        """
+        lineup = self._indices(lineup_players)
+        locked = self._locked(now, slate_start)
+        kept = lineup[locked[lineup]]
+        excluded = np.setdiff1d(np.flatnonzero(locked), kept)
+
+        constraints = {}
+        for suffix, indices, rhs in [('kept', kept, len(kept)),
+                                     ('excluded', excluded, 0)]:
+            if len(indices) > 0:
+                name = DfsOptimizer.LATE_SWAP_PREFIX + suffix
+                constraints[name] = self._constraint(
+                    name, indices, pulp.LpConstraintEQ, rhs)
+
+        self.model.constraints.update(constraints)
+        try:
+            # the current lineup keeps the locked players, so it is a
+            # feasible start unless salaries or constraints have changed
+            return self.optimize(initial_lineup=[
+                self._player_ids[i] for i in lineup.tolist()])
+        finally:
+            for name in constraints:
+                del self.model.constraints[name]
+
+    def _locked(self, now, slate_start=None):
+        """
+        Find the players whose game has started
+
+        :param now: current time, as passed to late_swap
+        :param slate_start: date of the first game of the slate, as passed to
+            late_swap
+        :return: boolean array, true for players whose game time is at or
+            before now
+        :raises ValueError: if a game time cannot be compared with now
+        """
+        if Player.GAME_TIME not in self._groups:
+            self._groups[Player.GAME_TIME] = \
+                self._pool.groups(Player.GAME_TIME)
+
+        locked = np.zeros(len(self._player_ids), dtype=bool)
+        for game_time, indices in self._groups[Player.GAME_TIME].items():
+            try:
+                started = DfsOptimizer.parse_game_time(
+                    game_time, now, slate_start) <= now
+            except TypeError:
+                raise ValueError('Cannot compare game time ' +
+                                 repr(game_time) + ' with ' + repr(now))
+            if started:
+                locked[indices] = True
+        return locked
+
+    @staticmethod
+    def parse_game_time(game_time, now, slate_start=None):
+        """
+        Convert a game time to a value comparable with now. Game times may be
+        datetimes, numbers or numeric strings (compared with a numeric now),
+        ISO 8601 strings, or times of day as in the Yahoo csv (e.g.
+        '1:00PM EST' or 'Thu 8:20PM EST'), which are in the timezone of now.
+
+        A time of day has no date, so it is placed relative to slate_start
+        rather than guessed from now: on the first date on or after
+        slate_start with its weekday if it has one (so a slate may span up to
+        a week), and on slate_start itself if it does not (so a time without a
+        weekday is only correct for a single-day slate).
+
+        :param game_time: Player.GAME_TIME of a player
+        :param now: current time; a datetime, or a number
+        :param slate_start: date (or datetime) of the first game of the slate,
+            or None if no game time is a time of day
+        :return: datetime or number
+        :raises ValueError: if game_time cannot be parsed, or is a time of
+            day and slate_start is None
+        """
+        if isinstance(game_time, (datetime.datetime, int, float)):
+            return game_time
+        if isinstance(game_time, np.generic):
+            return game_time.item()
+
+        game_time = str(game_time).strip()
+        try:
+            return float(game_time)
+        except ValueError:
+            pass
+        try:
+            return datetime.datetime.fromisoformat(game_time)
+        except ValueError:
+            pass
+
+        match = re.search(r'(\d{1,2}):(\d{2})\s*([AaPp])[Mm]', game_time)
+        if match is None or not isinstance(now, datetime.datetime):
+            raise ValueError('Cannot parse game time ' + repr(game_time))
+        if slate_start is None:
+            raise ValueError('Game time ' + repr(game_time) + ' has no date; '
+                             'pass slate_start or use full datetimes')
+        if isinstance(slate_start, datetime.datetime):
+            slate_start = slate_start.date()
+
+        date = slate_start
+        weekday = re.search(r'\b(mon|tue|wed|thu|fri|sat|sun)[a-z]*\b',
+                            game_time, re.IGNORECASE)
+        if weekday is not None:
+            days = DfsOptimizer.WEEKDAYS.index(weekday.group(1).lower())
+            date += datetime.timedelta(days=(days - date.weekday()) % 7)
+
+        hour = int(match.group(1)) % 12 + \
+            (12 if match.group(3).upper() == 'P' else 0)
+        return datetime.datetime.combine(
+            date, datetime.time(hour, int(match.group(2))), now.tzinfo)
+
+    def _player_constraint(self, prefix, player, rhs):
+        """
+        Build the constraint for ignore_player or require_player
+
+        :param prefix: prefix of the constraint name
+        :param player: player name, or tuple of (name, position, team)
+        :param rhs: number of matching players that must be chosen
+        :return: tuple of (constraint name, pulp constraint)
+        :raises RuntimeError: if no player with the given conditions is found
+        """
+        if isinstance(player, str):
+            player = (player, None, None)
+        player_name, player_position, player_team = player
 
-        constraint_name = DfsOptimizer.REQUIRE_PLAYER_PREFIX + player_name
-        player_variables = []
-        for var_id, var in self.model.variablesDict().items():
-            if self.players[var.name][Player.NAME] == player_name:
-                player_variables.append((var, 1))
+        constraint_name = prefix + player_name
+        indices = self._group(Player.NAME, player_name)
 
         if player_position is not None:
             constraint_name += player_position
-            temp = []
-            for var, coefficient in player_variables:
-                if self.players[var.name][Player.POSITION] == player_position:
-                    temp.append((var, coefficient))
-            player_variables = temp
+            indices = np.intersect1d(
+                indices, self._group(Player.POSITION, player_position))
 
         if player_team is not None:
             constraint_name += player_team
-            temp = []
-            for var, coefficient in player_variables:
-                if self.players[var.name][Player.TEAM] == player_team:
-                    temp.append((var, coefficient))
-            player_variables = temp
+            indices = np.intersect1d(indices,
+                                     self._group(Player.TEAM, player_team))
 
-        if len(player_variables) == 0:
+        if len(indices) == 0:
             error_msg = 'No player named ' + player_name
             if player_position is not None:
                 error_msg += ' (' + player_position + ')'
@@ -428,6 +1179,20 @@ class DfsOptimizer:
                 error_msg += ' on ' + player_team
             raise RuntimeError(error_msg + ' found')
 
-        affine_expression = pulp.LpAffineExpression(player_variables)
-        self.model.constraints[constraint_name] = pulp.LpConstraint(
-            affine_expression, pulp.LpConstraintEQ, constraint_name, 1)
+        return constraint_name, self._constraint(
+            constraint_name, indices, pulp.LpConstraintEQ, rhs)
+
+    def _constraint(self, constraint_name, indices, sense, rhs):
+        """
+        Build a constraint on the number of chosen players among indices
+
+        :param constraint_name: name of the constraint
+        :param indices: indices of players in the constraint
+        :param sense: pulp constraint sense
+        :param rhs: right hand side of the constraint
+        :return: pulp constraint
+        """
+        affine_expression = pulp.LpAffineExpression(
+            [(self._variables[i], 1) for i in indices])
+        return pulp.LpConstraint(affine_expression, sense, constraint_name,
+                                 rhs)
@@ -0,0 +1,252 @@
+import itertools
+
+import numpy as np
+import pulp
+
+from fantasyopt.optimizer.dfs import DfsOptimizer
+from fantasyopt.optimizer.exceptions import OptimizerException
+from fantasyopt.optimizer.pruning import position_capacity, \
+    undominated_players
+from fantasyopt.player import Player
+
+
+class KnapsackOptimizer:
+    def __init__(self, players, positions, budget, flex_positions=None,
+                 utility_requirement=0):
+        """
+        Lineup optimizer for salary cap rosters made of position slots, flex
+        slots and utility slots (e.g. fantasyopt.sites.Yahoo), solved without
+        an IP solver. The number of players taken from each position is
+        enumerated; for each combination, a dynamic program over integer
+        salaries picks the best players from each position. Combinations that
+        cannot beat the best lineup found so far, or that cannot fit within the
+        budget, are skipped.
+
+        Takes the same arguments as DfsOptimizer, and optimize returns a
+        result in the same format as DfsOptimizer.optimize.
+
+        :param players:  dictionary of dictionaries representing players
+        :param positions: dictionary of position -> requirement
+        :param budget: budget for player selection
+        :param flex_positions: dict of
+            flex position name -> (set of valid positions, number required)
+            One position should not be present in two flex positions
+        :param utility_requirement: number of utility players required. This
+            parameter should only be used for roster positions that accept
+            players from any position (e.g. Util in Yahoo NBA DFS)
+
+        :raises ValueError: if any player does not have all required attributes
+            or any salary or the budget is not a non-negative integer
+        """
+        for player, attributes in players.items():
+            for attr in [Player.NAME, Player.POINTS_PROJECTION,
+                         Player.SALARY, Player.POSITION]:
+                if attr not in attributes.keys():
+                    raise ValueError('player \'' + player + '\' is missing '
+                                                            'required '
+                                                            'attribute \'' +
+                                     str(attr) + '\'')
+            salary = attributes[Player.SALARY]
+            if salary < 0 or salary != int(salary):
+                raise ValueError('player \'' + player + '\' has a salary '
+                                                        'that is not a '
+                                                        'non-negative integer')
+
+        if budget < 0 or budget != int(budget):
+            raise ValueError('budget must be a non-negative integer')
+
+        self.players = players
+        self.positions = positions
+        self.budget = int(budget)
+        self.flex_positions = {} if flex_positions is None else flex_positions
+        self.utility_requirement = utility_requirement
+
+        # most players that can be taken from each position
+        self.position_maximum = position_capacity(positions, flex_positions,
+                                                  utility_requirement)
+
+        self.candidates = {position: [] for position in positions}
+        for player, attributes in players.items():
+            position = attributes[Player.POSITION]
+            if position in self.candidates:
+                self.candidates[position].append(player)
+
+        for position in positions:
+            self.candidates[position] = undominated_players(
+                players, self.candidates[position],
+                self.position_maximum[position])
+
+    def _position_table(self, position):
+        """
+        Run the dynamic program choosing players from one position
+
+        :param position: position to choose players from
+        :return: tuple of (points, take), where points[k][s] is the most points
+            from exactly k players with total salary s (-inf if impossible), and
+            take[i][k][s] is true if candidate i is taken in that selection
+            when only the first i + 1 candidates are considered
+        """
+        maximum = self.position_maximum[position]
+        points = np.full((maximum + 1, self.budget + 1), -np.inf)
+        points[0][0] = 0
+
+        take = []
+        for p in self.candidates[position]:
+            salary = int(self.players[p][Player.SALARY])
+            projection = self.players[p][Player.POINTS_PROJECTION]
+            taken = np.zeros(points.shape, dtype=bool)
+
+            if salary <= self.budget:
+                with_player = np.full(points.shape, -np.inf)
+                with_player[1:, salary:] = \
+                    points[:-1, :self.budget + 1 - salary] + projection
+                taken = with_player > points
+                points = np.where(taken, with_player, points)
+            take.append(taken)
+
+        return points, take
+
+    def _position_counts(self):
+        """
+        Enumerate the number of players to take from each position
+
+        :return: generator of dicts of position -> number of players
+        """
+        positions = list(self.positions)
+        position_to_flex = {}
+        for flex, (allowed, count) in self.flex_positions.items():
+            for p in allowed:
+                position_to_flex[p] = flex
+
+        extras = [range(self.position_maximum[p] - self.positions[p] + 1)
+                  for p in positions]
+        for extra in itertools.product(*extras):
+            if sum(extra) != self.utility_requirement + \
+                    sum(count for allowed, count in
+                        self.flex_positions.values()):
+                continue
+
+            # each flex slot must be filled by a player from its positions,
+            # and the remaining extra players fill the utility slots
+            flex_extra = {flex: 0 for flex in self.flex_positions}
+            for p, e in zip(positions, extra):
+                if p in position_to_flex:
+                    flex_extra[position_to_flex[p]] += e
+            if all(flex_extra[flex] >= count for flex, (allowed, count) in
+                   self.flex_positions.items()):
+                yield {p: self.positions[p] + e
+                       for p, e in zip(positions, extra)}
+
+    def optimize(self) -> dict:
+        """
+        Find the best lineup. Among lineups with the most points, the
+        cheapest one is returned.
+
+        :return: dictionary of the form {
+            DfsOptimizer.IP_STATUS_STR: pulp.LpStatusOptimal,
+            DfsOptimizer.LINEUP_SALARY_STR: cost of lineup,
+            DfsOptimizer.LINEUP_PLAYERS_STR: set of players to put in lineup,
+            DfsOptimizer.LINEUP_POINTS_STR: total points scored projection
+        }
+        :raises OptimizerException: if no lineup satisfies the constraints
+        """
+        tables = {p: self._position_table(p) for p in self.positions}
+        # most points and least salary for k players at each position,
+        # ignoring the budget, used to skip position counts
+        best_points = {p: np.max(points, axis=1) for p, (points, take) in
+                       tables.items()}
+        least_salary = {p: np.array([np.argmax(row > -np.inf)
+                                     if np.any(row > -np.inf) else np.inf
+                                     for row in points])
+                        for p, (points, take) in tables.items()}
+
+        best = None
+        for counts in self._position_counts():
+            bound = sum(best_points[p][k] for p, k in counts.items())
+            salary = sum(least_salary[p][k] for p, k in counts.items())
+            if bound == -np.inf or salary > self.budget or \
+                    (best is not None and bound < best[0]):
+                continue
+
+            lineup = self._combine(tables, counts)
+            if lineup is not None and \
+                    (best is None or lineup[0] > best[0] or
+                     (lineup[0] == best[0] and lineup[1] < best[1])):
+                best = lineup
+
+        if best is None:
+            raise OptimizerException('Model exited with status ' +
+                                     str(pulp.LpStatusInfeasible))
+
+        points, salary, players = best
+        return {DfsOptimizer.IP_STATUS: pulp.LpStatusOptimal,
+                DfsOptimizer.LINEUP_SALARY: salary,
+                DfsOptimizer.LINEUP_PLAYERS: players,
+                DfsOptimizer.LINEUP_POINTS: points}
+
+    def _combine(self, tables, counts):
+        """
+        Find the best lineup with the given number of players at each position
+
+        :param tables: dict of position -> result of _position_table
+        :param counts: dict of position -> number of players
+        :return: tuple of (points, salary, set of players), or None if no
+            lineup fits within the budget
+        """
+        positions = list(counts)
+        combined = tables[positions[0]][0][counts[positions[0]]]
+        # salary spent on each position for each total salary, in reverse
+        splits = []
+        for p in positions[1:]:
+            row = tables[p][0][counts[p]]
+            merged = np.full(self.budget + 1, -np.inf)
+            split = np.zeros(self.budget + 1, dtype=int)
+            for s in np.flatnonzero(row > -np.inf):
+                candidate = np.full(self.budget + 1, -np.inf)
+                candidate[s:] = combined[:self.budget + 1 - s] + row[s]
+                better = candidate > merged
+                merged[better] = candidate[better]
+                split[better] = s
+            combined = merged
+            splits.append(split)
+
+        if not np.any(combined > -np.inf):
+            return None
+
+        points = np.max(combined)
+        salary = int(np.flatnonzero(combined == points)[0])
+
+        spent = {}
+        remaining = salary
+        for p, split in zip(reversed(positions[1:]), reversed(splits)):
+            spent[p] = int(split[remaining])
+            remaining -= spent[p]
+        spent[positions[0]] = remaining
+
+        players = set()
+        for p in positions:
+            players.update(self._backtrack(p, tables[p][1], counts[p],
+                                           spent[p]))
+
+        return points, salary, players
+
+    def _backtrack(self, position, take, count, salary):
+        """
+        Recover the players chosen by the dynamic program for one position
+
+        :param position: position the players were chosen from
+        :param take: take tables from _position_table
+        :param count: number of players chosen
+        :param salary: total salary of the chosen players
+        :return: list of player ids
+        """
+        chosen = []
+        for i in reversed(range(len(take))):
+            if count == 0:
+                break
+            if take[i][count][salary]:
+                p = self.candidates[position][i]
+                chosen.append(p)
+                count -= 1
+                salary -= int(self.players[p][Player.SALARY])
+        return chosen
@@ -0,0 +1,62 @@
+class Lineup:
+    def __init__(self, status, player_ids, salary, points, positions,
+                 bound=None, gap=None):
+        """
+        Lineup found by DfsOptimizer.optimize_lineup
+
+        :param status: solve status of the model
+        :param player_ids: tuple of the ids of the players in the lineup, in
+            the order of the optimizer's players
+        :param salary: total salary of the lineup
+        :param points: total projected points of the lineup
+        :param positions: dict of position -> tuple of the ids of the players
+            of that position in the lineup
+        :param bound: best bound on the points of any lineup proven by the
+            solver, or None if the lineup was not found by an anytime solve
+        :param gap: relative gap between points and bound, or None
+        """
+        self.status = status
+        self.player_ids = player_ids
+        self.salary = salary
+        self.points = points
+        self.positions = positions
+        self.bound = bound
+        self.gap = gap
+
+    def to_result(self) -> dict:
+        """
+        Convert to a result as returned by DfsOptimizer.optimize
+
+        :return: dict with DfsOptimizer result keys
+        """
+        # imported here because DfsOptimizer imports this module
+        from fantasyopt.optimizer.dfs import DfsOptimizer
+
+        result = {DfsOptimizer.IP_STATUS: self.status,
+                  DfsOptimizer.LINEUP_SALARY: self.salary,
+                  DfsOptimizer.LINEUP_PLAYERS: set(self.player_ids),
+                  DfsOptimizer.LINEUP_POINTS: self.points}
+        if self.bound is not None:
+            result[DfsOptimizer.LINEUP_BOUND] = self.bound
+            result[DfsOptimizer.LINEUP_GAP] = self.gap
+        return result
+
+    def __iter__(self):
+        return iter(self.player_ids)
+
+    def __len__(self):
+        return len(self.player_ids)
+
+    def __contains__(self, player):
+        return player in self.player_ids
+
+    def __eq__(self, other):
+        if not isinstance(other, Lineup):
+            return NotImplemented
+        return (self.status, set(self.player_ids), self.salary,
+                self.points) == (other.status, set(other.player_ids),
+                                 other.salary, other.points)
+
+    def __repr__(self):
+        return 'Lineup(status={}, salary={}, points={}, positions={})'.format(
+            self.status, self.salary, self.points, self.positions)
@@ -0,0 +1,27 @@
+class Portfolio:
+    def __init__(self, lineups, counts):
+        """
+        Lineups found by DfsOptimizer.generate_portfolio
+
+        :param lineups: list of fantasyopt.optimizer.lineup.Lineup, in the
+            order they were found
+        :param counts: dict of player id -> number of lineups the player is
+            in, for every player in at least one lineup
+        """
+        self.lineups = lineups
+        self.counts = counts
+
+    @property
+    def exposures(self) -> dict:
+        """
+        :return: dict of player id -> fraction of the lineups the player is
+            in, for every player in at least one lineup
+        """
+        return {p: count / len(self.lineups)
+                for p, count in self.counts.items()}
+
+    def __iter__(self):
+        return iter(self.lineups)
+
+    def __len__(self):
+        return len(self.lineups)
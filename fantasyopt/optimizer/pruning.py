@@ -0,0 +1,123 @@
+import heapq
+
+from fantasyopt.player import Player
+
+
+def position_capacity(positions, flex_positions=None, utility_requirement=0):
+    """
+    Get the most players that a lineup can hold at each position
+
+    :param positions: dictionary of position -> requirement
+    :param flex_positions: dict of
+        flex position name -> (set of valid positions, number required)
+    :param utility_requirement: number of utility players required
+    :return: dict of position -> most players that can be in a lineup
+    """
+    capacity = {}
+    for position, requirement in positions.items():
+        capacity[position] = requirement + utility_requirement
+        if flex_positions is not None:
+            for flex, (allowed, count) in flex_positions.items():
+                if position in allowed:
+                    capacity[position] += count
+    return capacity
+
+
+def undominated_players(players, candidates, maximum, dominators=None):
+    """
+    Remove players that can never be in an optimal lineup because at least
+    'maximum' other players at the same position cost no more and project at
+    least as many points
+
+    :param players: dictionary of dictionaries representing players
+    :param candidates: list of player ids at one position
+    :param maximum: most players that can be taken from the position
+    :param dominators: set of player ids allowed to dominate other players,
+        or None if all candidates are
+    :return: list of player ids that are not dominated, in order of salary
+    """
+    ordered = sorted(candidates,
+                     key=lambda p: (players[p][Player.SALARY],
+                                    -players[p][Player.POINTS_PROJECTION]))
+
+    # points of the 'maximum' best dominators seen so far, all of which cost no
+    # more than the current player
+    best = []
+    undominated = []
+    for p in ordered:
+        points = players[p][Player.POINTS_PROJECTION]
+        if len(best) == maximum and best[0] >= points:
+            continue
+
+        undominated.append(p)
+        if dominators is not None and p not in dominators:
+            continue
+        if len(best) < maximum:
+            heapq.heappush(best, points)
+        elif maximum > 0:
+            heapq.heapreplace(best, points)
+
+    return undominated
+
+
+def prune_dominated_players(players, positions, flex_positions=None,
+                            utility_requirement=0, required_players=None,
+                            ignored_players=None, ignored_teams=None,
+                            avoided_opponents=None):
+    """
+    Remove players that can never be in an optimal lineup before building a
+    DfsOptimizer. A player is dominated if at least as many other players at
+    the same position as a lineup can hold at that position (including flex
+    and utility slots) cost no more and project at least as many points.
+
+    Players that will be passed to DfsOptimizer.require_player or
+    ignore_player, or that will be excluded by ignore_team or avoid_opponent,
+    are never removed, so those calls behave as without pruning. Excluded
+    players do not dominate other players. Pruning does not account for
+    DfsOptimizer.set_max_players_from_same_team, under which a pruned player
+    may have been part of the best lineup.
+
+    :param players: dictionary of dictionaries representing players
+    :param positions: dictionary of position -> requirement
+    :param flex_positions: dict of
+        flex position name -> (set of valid positions, number required)
+    :param utility_requirement: number of utility players required
+    :param required_players: names of players that will be required
+    :param ignored_players: names of players that will be ignored
+    :param ignored_teams: teams that will be ignored
+    :param avoided_opponents: opponents that will be avoided
+    :return: tuple of (dictionary of remaining players, number of players
+        removed)
+    """
+    required_players = set(required_players or [])
+    ignored_players = set(ignored_players or [])
+    ignored_teams = set(ignored_teams or [])
+    avoided_opponents = set(avoided_opponents or [])
+
+    capacity = position_capacity(positions, flex_positions,
+                                 utility_requirement)
+
+    kept = set()
+    dominators = set()
+    candidates = {position: [] for position in positions}
+    for player, attributes in players.items():
+        excluded = attributes[Player.NAME] in ignored_players or \
+            attributes[Player.TEAM] in ignored_teams or \
+            attributes[Player.OPPONENT] in avoided_opponents
+        if not excluded:
+            dominators.add(player)
+
+        position = attributes[Player.POSITION]
+        if excluded or attributes[Player.NAME] in required_players or \
+                position not in candidates:
+            kept.add(player)
+        if position in candidates:
+            candidates[position].append(player)
+
+    for position, ids in candidates.items():
+        kept.update(undominated_players(players, ids, capacity[position],
+                                        dominators))
+
+    remaining = {player: attributes for player, attributes in players.items()
+                 if player in kept}
+    return remaining, len(players) - len(remaining)
@@ -0,0 +1,114 @@
+import numpy as np
+
+from fantasyopt.optimizer.dfs import DfsOptimizer
+from fantasyopt.optimizer.exceptions import OptimizerException
+from fantasyopt.player import Player
+
+
+def simulate_projections(players, draws, std=None, relative_std=0.25,
+                         team_correlation=0.2, opponent_correlation=0.1,
+                         seed=None) -> np.ndarray:
+    """
+    Draw correlated fantasy point outcomes for every player. Each player's
+    outcome is normal around Player.POINTS_PROJECTION. Outcomes of players on
+    the same team share a team factor, and the team factors of opponents share
+    a game factor, giving the requested correlations.
+
+    :param players: dictionary of dictionaries representing players
+    :param draws: number of outcomes to draw for each player
+    :param std: dict of player id -> standard deviation of the player's
+        outcome. Players not in std use relative_std
+    :param relative_std: standard deviation as a fraction of the projection
+    :param team_correlation: correlation between outcomes of players on the
+        same team
+    :param opponent_correlation: correlation between outcomes of players on
+        opposing teams; its magnitude may not exceed team_correlation
+    :param seed: seed for the random number generator
+    :return: array of shape (draws, number of players), with columns in the
+        iteration order of players
+    :raises ValueError: if the correlations are not valid
+    """
+    if not 0 <= team_correlation <= 1 or \
+            abs(opponent_correlation) > team_correlation:
+        raise ValueError('team_correlation must be in [0, 1] and at least '
+                         'the magnitude of opponent_correlation')
+    std = {} if std is None else std
+    rng = np.random.RandomState(seed)
+
+    means = np.array([attributes[Player.POINTS_PROJECTION]
+                      for attributes in players.values()], dtype=float)
+    deviations = np.array([std.get(p, relative_std *
+                                   abs(attributes[Player.POINTS_PROJECTION]))
+                           for p, attributes in players.items()], dtype=float)
+
+    teams = {}
+    games = {}
+    team_index = []
+    game_index = []
+    for attributes in players.values():
+        team = attributes[Player.TEAM]
+        if team not in teams:
+            teams[team] = len(teams)
+            game = frozenset([team, attributes[Player.OPPONENT]])
+            if game not in games:
+                games[game] = len(games)
+            game_index.append(games[game])
+        team_index.append(teams[team])
+
+    # correlation of the team factors of opponents, where the second team of
+    # each game takes the sign of the correlation
+    game_weight = 0 if team_correlation == 0 else \
+        opponent_correlation / team_correlation
+    game_sign = np.ones(len(teams))
+    seen = set()
+    for t, g in enumerate(game_index):
+        if g in seen:
+            game_sign[t] = np.sign(game_weight)
+        seen.add(g)
+
+    team_factors = \
+        np.sqrt(1 - abs(game_weight)) * \
+        rng.standard_normal((draws, len(teams))) + \
+        np.sqrt(abs(game_weight)) * game_sign * \
+        rng.standard_normal((draws, len(games)))[:, game_index]
+    noise = np.sqrt(team_correlation) * team_factors[:, team_index] + \
+        np.sqrt(1 - team_correlation) * \
+        rng.standard_normal((draws, len(means)))
+
+    return means + deviations * noise
+
+
+def lineup_frequencies(optimizer, outcomes) -> dict:
+    """
+    Solve optimizer once for each row of outcomes, replacing only the
+    objective coefficients between solves, and count how often each player is
+    in the optimal lineup. The optimizer's projections are restored
+    afterwards.
+
+    :param optimizer: DfsOptimizer to solve
+    :param outcomes: array of shape (draws, number of players), with columns
+        in the iteration order of optimizer.players, such as the result of
+        simulate_projections
+    :return: dict of player id -> fraction of draws in which the player is in
+        the optimal lineup; draws without a feasible lineup count as draws
+        in which no player is chosen
+    :raises ValueError: if outcomes has no draws
+    """
+    if len(outcomes) == 0:
+        raise ValueError('outcomes must have at least one draw')
+
+    counts = {p: 0 for p in optimizer.players}
+    projections = optimizer._projections.copy()
+    try:
+        for outcome in outcomes:
+            optimizer.update_projections(outcome)
+            try:
+                result = optimizer.optimize()
+            except OptimizerException:
+                continue
+            for p in result[DfsOptimizer.LINEUP_PLAYERS]:
+                counts[p] += 1
+    finally:
+        optimizer.update_projections(projections)
+
+    return {p: count / len(outcomes) for p, count in counts.items()}
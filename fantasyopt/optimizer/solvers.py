@@ -0,0 +1,403 @@
+import importlib
+import os
+import re
+import tempfile
+import warnings
+from abc import ABC, abstractmethod
+
+import numpy as np
+import pulp
+
+# optional solver modules, imported on first use rather than with this module
+# because they are slow to import (ortools imports pandas)
+_OPTIONAL_MODULES = {
+    'highspy': 'highspy',
+    'cp_model': 'ortools.sat.python.cp_model'
+}
+
+
+def __getattr__(name):
+    if name not in _OPTIONAL_MODULES:
+        raise AttributeError('module \'' + __name__ + '\' has no attribute '
+                             '\'' + name + '\'')
+    try:
+        module = importlib.import_module(_OPTIONAL_MODULES[name])
+    except ImportError:
+        module = None
+    globals()[name] = module
+    return module
+
+
+def _optional(name):
+    """
+    Get an optional solver module, importing it on first use
+
+    :param name: key of _OPTIONAL_MODULES
+    :return: module, or None if it is not installed
+    """
+    return globals()[name] if name in globals() else __getattr__(name)
+
+
+# status of a solve stopped by its time limit with a lineup that is not proven
+# optimal. pulp has no such problem status, so its solution status for an
+# integer feasible solution is used.
+STATUS_FEASIBLE = pulp.LpSolutionIntegerFeasible
+
+
+class Solver(ABC):
+    """
+    Backend used by DfsOptimizer to solve its pulp model. After solve returns,
+    the model's status and the varValue of each of its variables are set as
+    if the model had been solved by pulp itself, and bound is the best bound
+    on the objective the solver proved, or None if it did not report one.
+    """
+    bound = None
+
+    @abstractmethod
+    def solve(self, model, time_limit=None, mip_gap=None,
+              warm_start=False) -> int:
+        """
+        Solve model. If the solve stops at time_limit with a feasible
+        solution that is not proven optimal, the status is STATUS_FEASIBLE
+        and the variables hold that solution.
+
+        :param model: pulp.LpProblem to solve
+        :type model: pulp.LpProblem
+        :param time_limit: seconds after which the solve stops, or None
+        :param mip_gap: relative gap between the solution and the bound at
+            which the solve stops as optimal, or None to prove optimality
+        :param warm_start: if true, start from the current varValue of the
+            model's variables, as pulp's warmStart does. Variables whose
+            varValue is None are left for the solver to complete, if it
+            supports partial starts. Solvers that do not support a starting
+            solution ignore it.
+        :return: pulp status of the solve (e.g. pulp.LpStatusOptimal)
+        """
+        pass
+
+
+class CbcSolver(Solver):
+    # line of the CBC log with the bound of a solve that stopped early
+    BOUND_PATTERN = re.compile(r'^(?:Upper|Lower) bound:\s*(\S+)$',
+                               re.MULTILINE)
+
+    def __init__(self, msg=False):
+        """
+        Solve with the CBC executable bundled with pulp. Each solve writes the
+        model to a file and runs CBC in a separate process.
+
+        :param msg: if true, show solver output
+        """
+        self.msg = msg
+
+    def solve(self, model, time_limit=None, mip_gap=None,
+              warm_start=False) -> int:
+        self.bound = None
+        if warm_start and any(var.varValue is None
+                              for var in model.variables()):
+            # pulp writes unset values as 0, so a partial start would be
+            # passed as an infeasible one
+            warm_start = False
+        if time_limit is None and mip_gap is None:
+            return model.solve(pulp.PULP_CBC_CMD(msg=self.msg,
+                                                 warmStart=warm_start))
+
+        # CBC only reports its bound in its log
+        with tempfile.TemporaryDirectory() as directory:
+            log_path = os.path.join(directory, 'cbc.log')
+            status = model.solve(pulp.PULP_CBC_CMD(
+                msg=self.msg, timeLimit=time_limit, gapRel=mip_gap,
+                warmStart=warm_start, logPath=log_path))
+            with open(log_path) as log:
+                bound = CbcSolver.BOUND_PATTERN.search(log.read())
+
+        if bound is not None:
+            self.bound = float(bound.group(1))
+        elif status == pulp.LpStatusOptimal:
+            # CBC only logs a bound that differs from the objective
+            self.bound = pulp.value(model.objective)
+        if status == pulp.LpStatusOptimal and \
+                model.sol_status == pulp.LpSolutionIntegerFeasible:
+            model.status = STATUS_FEASIBLE
+        return model.status
+
+
+class MatrixModel:
+    def __init__(self, model):
+        """
+        Row-wise (CSR) array representation of a pulp model
+
+        :param model: pulp.LpProblem to convert
+        :type model: pulp.LpProblem
+        """
+        self.variables = model.variables()
+        columns = {var.name: j for j, var in enumerate(self.variables)}
+
+        self.maximize = model.sense == pulp.LpMaximize
+        self.costs = np.zeros(len(self.variables))
+        for var, coefficient in model.objective.items():
+            self.costs[columns[var.name]] = coefficient
+
+        self.lower = np.array([-np.inf if var.lowBound is None
+                               else var.lowBound for var in self.variables],
+                              dtype=float)
+        self.upper = np.array([np.inf if var.upBound is None
+                               else var.upBound for var in self.variables],
+                              dtype=float)
+        self.integer = np.array([var.cat == pulp.LpInteger
+                                 for var in self.variables], dtype=bool)
+
+        starts = [0]
+        indices = []
+        values = []
+        row_lower = []
+        row_upper = []
+        for constraint in model.constraints.values():
+            for var, coefficient in constraint.items():
+                indices.append(columns[var.name])
+                values.append(coefficient)
+            starts.append(len(indices))
+
+            rhs = -constraint.constant
+            row_lower.append(-np.inf if constraint.sense == pulp.LpConstraintLE
+                             else rhs)
+            row_upper.append(np.inf if constraint.sense == pulp.LpConstraintGE
+                             else rhs)
+
+        self.starts = np.array(starts, dtype=np.int32)
+        self.indices = np.array(indices, dtype=np.int32)
+        self.values = np.array(values, dtype=float)
+        self.row_lower = np.array(row_lower, dtype=float)
+        self.row_upper = np.array(row_upper, dtype=float)
+
+    def rows(self):
+        """
+        Iterate over the rows of the constraint matrix
+
+        :return: generator of (column indices, coefficients, lower, upper)
+        """
+        for r in range(len(self.row_lower)):
+            start, end = self.starts[r], self.starts[r + 1]
+            yield self.indices[start:end], self.values[start:end], \
+                self.row_lower[r], self.row_upper[r]
+
+    def start(self):
+        """
+        Read the starting solution of a warm start from the pulp model
+
+        :return: array of the varValue of each variable, in self.variables
+            order, with NaN for variables without a value
+        """
+        return np.array([np.nan if var.varValue is None else var.varValue
+                         for var in self.variables], dtype=float)
+
+    def set_solution(self, model, values, status):
+        """
+        Write a solution back to the pulp model
+
+        :param model: pulp.LpProblem this MatrixModel was built from
+        :param values: value of each variable, in self.variables order
+        :param status: pulp status of the solve
+        :return: status
+        """
+        if values is not None:
+            # round integer variables so callers can compare values exactly
+            values = np.where(self.integer, np.round(values), values)
+            for var, value in zip(self.variables, values.tolist()):
+                var.varValue = value
+        model.status = status
+        return status
+
+
+class HighsSolver(Solver):
+    def __init__(self, presolve=False, msg=False):
+        """
+        Solve in-process with HiGHS through its Python bindings (highspy)
+
+        :param presolve: if true, run HiGHS presolve, which usually costs more
+            than it saves on lineup models
+        :param msg: if true, show solver output
+        :raises ImportError: if highspy is not installed
+        """
+        if _optional('highspy') is None:
+            raise ImportError('highspy is required to use HighsSolver')
+        self.presolve = presolve
+        self.msg = msg
+
+    def solve(self, model, time_limit=None, mip_gap=None,
+              warm_start=False) -> int:
+        highspy = _optional('highspy')
+        matrix = MatrixModel(model)
+
+        lp = highspy.HighsLp()
+        lp.num_col_ = len(matrix.variables)
+        lp.num_row_ = len(matrix.row_lower)
+        lp.col_cost_ = matrix.costs
+        lp.col_lower_ = matrix.lower
+        lp.col_upper_ = matrix.upper
+        lp.row_lower_ = matrix.row_lower
+        lp.row_upper_ = matrix.row_upper
+        lp.a_matrix_.format_ = highspy.MatrixFormat.kRowwise
+        lp.a_matrix_.start_ = matrix.starts
+        lp.a_matrix_.index_ = matrix.indices
+        lp.a_matrix_.value_ = matrix.values
+        lp.integrality_ = [highspy.HighsVarType.kInteger if integer else
+                           highspy.HighsVarType.kContinuous
+                           for integer in matrix.integer]
+        if matrix.maximize:
+            lp.sense_ = highspy.ObjSense.kMaximize
+
+        h = highspy.Highs()
+        h.setOptionValue('output_flag', self.msg)
+        h.setOptionValue('presolve', 'on' if self.presolve else 'off')
+        if time_limit is not None:
+            h.setOptionValue('time_limit', float(time_limit))
+        if mip_gap is not None:
+            h.setOptionValue('mip_rel_gap', float(mip_gap))
+        h.passModel(lp)
+        if warm_start:
+            start = matrix.start()
+            columns = np.flatnonzero(~np.isnan(start)).astype(np.int32)
+            # HiGHS completes a partial start by solving for the columns
+            # without a value
+            h.setSolution(len(columns), columns, start[columns])
+        h.run()
+
+        statuses = {
+            highspy.HighsModelStatus.kOptimal: pulp.LpStatusOptimal,
+            highspy.HighsModelStatus.kInfeasible: pulp.LpStatusInfeasible,
+            highspy.HighsModelStatus.kUnbounded: pulp.LpStatusUnbounded,
+            highspy.HighsModelStatus.kUnboundedOrInfeasible:
+                pulp.LpStatusInfeasible
+        }
+        status = statuses.get(h.getModelStatus(), pulp.LpStatusNotSolved)
+        info = h.getInfo()
+        if status == pulp.LpStatusNotSolved and \
+                h.getModelStatus() == highspy.HighsModelStatus.kTimeLimit and \
+                info.primal_solution_status == \
+                int(highspy.SolutionStatus.kSolutionStatusFeasible):
+            status = STATUS_FEASIBLE
+
+        self.bound = None
+        values = None
+        if status in (pulp.LpStatusOptimal, STATUS_FEASIBLE):
+            values = h.getSolution().col_value
+            self.bound = info.mip_dual_bound
+        return matrix.set_solution(model, values, status)
+
+
+class CpSatSolver(Solver):
+    def __init__(self, objective_scale=100, workers=1, msg=False):
+        """
+        Solve in-process with the OR-Tools CP-SAT solver. CP-SAT only accepts
+        integer coefficients, so objective coefficients are multiplied by
+        objective_scale and rounded, and constraint coefficients (e.g.
+        salaries) must already be integers.
+
+        :param objective_scale: multiplier applied to objective coefficients
+            (e.g. 100 keeps projections with two decimal places exact)
+        :param workers: number of search workers
+        :param msg: if true, show solver output
+        :raises ImportError: if ortools is not installed
+        """
+        if _optional('cp_model') is None:
+            raise ImportError('ortools is required to use CpSatSolver')
+        self.objective_scale = objective_scale
+        self.workers = workers
+        self.msg = msg
+
+    def solve(self, model, time_limit=None, mip_gap=None,
+              warm_start=False) -> int:
+        """
+        :raises ValueError: if a variable is not an integer or a constraint
+            has a non-integer coefficient
+        """
+        cp_model = _optional('cp_model')
+        matrix = MatrixModel(model)
+        if not matrix.integer.all():
+            raise ValueError('CpSatSolver only supports integer variables')
+
+        cp = cp_model.CpModel()
+        variables = [cp.NewIntVar(int(lower), int(upper), var.name)
+                     for var, lower, upper in zip(matrix.variables,
+                                                  matrix.lower, matrix.upper)]
+
+        for indices, values, lower, upper in matrix.rows():
+            if not np.all(np.mod(values, 1) == 0):
+                raise ValueError('CpSatSolver requires integer constraint '
+                                 'coefficients')
+            expression = sum(int(value) * variables[j]
+                             for j, value in zip(indices, values))
+            if lower == upper:
+                cp.Add(expression == int(lower))
+            else:
+                if lower > -np.inf:
+                    cp.Add(expression >= int(np.ceil(lower)))
+                if upper < np.inf:
+                    cp.Add(expression <= int(np.floor(upper)))
+
+        objective = sum(int(round(cost * self.objective_scale)) * var
+                        for var, cost in zip(variables, matrix.costs)
+                        if cost != 0)
+        if matrix.maximize:
+            cp.Maximize(objective)
+        else:
+            cp.Minimize(objective)
+        if warm_start:
+            start = matrix.start()
+            for j in np.flatnonzero(~np.isnan(start)).tolist():
+                cp.AddHint(variables[j], int(round(start[j])))
+
+        solver = cp_model.CpSolver()
+        solver.parameters.num_search_workers = self.workers
+        solver.parameters.log_search_progress = self.msg
+        if time_limit is not None:
+            solver.parameters.max_time_in_seconds = time_limit
+        if mip_gap is not None:
+            solver.parameters.relative_gap_limit = mip_gap
+        statuses = {
+            cp_model.OPTIMAL: pulp.LpStatusOptimal,
+            cp_model.FEASIBLE: STATUS_FEASIBLE,
+            cp_model.INFEASIBLE: pulp.LpStatusInfeasible,
+            cp_model.MODEL_INVALID: pulp.LpStatusUndefined
+        }
+        status = statuses.get(solver.Solve(cp), pulp.LpStatusNotSolved)
+
+        self.bound = None
+        values = None
+        if status in (pulp.LpStatusOptimal, STATUS_FEASIBLE):
+            values = [solver.Value(var) for var in variables]
+            self.bound = solver.BestObjectiveBound() / self.objective_scale
+        return matrix.set_solution(model, values, status)
+
+
+SOLVERS = {
+    'cbc': CbcSolver,
+    'highs': HighsSolver,
+    'cp-sat': CpSatSolver
+}
+
+
+def get_solver(solver=None) -> Solver:
+    """
+    Get a Solver instance. If the named solver's Python bindings are not
+    installed, CBC is used instead.
+
+    :param solver: Solver instance, name of a solver in SOLVERS, or None for
+        CBC
+    :return: Solver instance
+    :raises ValueError: if solver is not a Solver or a name in SOLVERS
+    """
+    if solver is None:
+        solver = 'cbc'
+
+    if isinstance(solver, Solver):
+        return solver
+    elif solver not in SOLVERS:
+        raise ValueError('Unknown solver ' + str(solver))
+
+    try:
+        return SOLVERS[solver]()
+    except ImportError as e:
+        warnings.warn(str(e) + '; falling back to CBC')
+        return CbcSolver()
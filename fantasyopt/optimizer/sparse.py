@@ -0,0 +1,223 @@
+import hashlib
+import json
+
+import numpy as np
+import pulp
+
+from fantasyopt.optimizer.dfs import DfsOptimizer
+from fantasyopt.optimizer.solvers import STATUS_FEASIBLE, Solver
+
+try:
+    import scipy.optimize
+    import scipy.sparse
+except ImportError:
+    scipy = None
+
+
+class SparseConstraint:
+    def __init__(self, indices, lower, upper, coefficients=None):
+        """
+        Row of a SparseModel: lower <= sum of coefficients * player variables
+        <= upper
+
+        :param indices: array of the indices of the players in the row
+        :param lower: lower bound of the row, or -np.inf
+        :param upper: upper bound of the row, or np.inf
+        :param coefficients: array of the coefficients of the players, or
+            None if every coefficient is 1. The array is not copied, so a row
+            built from a player column sees updates to it.
+        """
+        self.indices = indices
+        self.lower = lower
+        self.upper = upper
+        self.coefficients = coefficients
+
+    def values(self) -> np.ndarray:
+        """
+        :return: array of the coefficients, in the order of self.indices
+        """
+        if self.coefficients is None:
+            return np.ones(len(self.indices))
+        return self.coefficients
+
+
+class SparseModel:
+    def __init__(self, objective, names):
+        """
+        Model of SparseDfsOptimizer, maximizing objective over binary player
+        variables subject to named SparseConstraints
+
+        :param objective: array of the objective coefficient of each player.
+            The array is not copied.
+        :param names: list of the player ids, in the order of objective
+        """
+        self.objective = objective
+        self.names = names
+        self.constraints = {}
+        self.status = pulp.LpStatusNotSolved
+        self.solution = None
+
+    def matrix(self) -> tuple:
+        """
+        Assemble the constraints as one CSR matrix
+
+        :return: tuple of (scipy.sparse.csr_matrix, array of row lower
+            bounds, array of row upper bounds)
+        """
+        rows = list(self.constraints.values())
+        starts = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum([len(row.indices) for row in rows], out=starts[1:])
+        if rows:
+            indices = np.concatenate([row.indices for row in rows])
+            values = np.concatenate([row.values() for row in rows])
+        else:
+            indices = np.array([], dtype=int)
+            values = np.array([], dtype=float)
+
+        matrix = scipy.sparse.csr_matrix(
+            (values, indices, starts), shape=(len(rows), len(self.objective)))
+        return matrix, np.array([row.lower for row in rows], dtype=float), \
+            np.array([row.upper for row in rows], dtype=float)
+
+    def fingerprint(self, *extra) -> str:
+        """
+        Compute a canonical fingerprint of the model, independent of
+        constraint names and order, as SolutionCache.fingerprint does for
+        pulp models. The player ids are included, since a cached lineup is
+        stored by id.
+
+        :param extra: other values identifying the solve (e.g. the solver)
+        :return: hex digest
+        """
+        constraints = sorted(
+            json.dumps([float(row.lower), float(row.upper),
+                        sorted(zip(np.asarray(row.indices).tolist(),
+                                   row.values().tolist()))])
+            for row in self.constraints.values())
+
+        digest = hashlib.sha256()
+        digest.update(json.dumps(self.names).encode())
+        digest.update(self.objective.tobytes())
+        digest.update(json.dumps([repr(e) for e in extra]).encode())
+        for constraint in constraints:
+            digest.update(constraint.encode())
+        return digest.hexdigest()
+
+
+class MilpSolver(Solver):
+    def __init__(self, presolve=True, msg=False):
+        """
+        Solve a SparseModel in-process with scipy.optimize.milp, which uses
+        HiGHS
+
+        :param presolve: if true, run HiGHS presolve
+        :param msg: if true, show solver output
+        :raises ImportError: if scipy is not installed
+        """
+        if scipy is None:
+            raise ImportError('scipy is required to use MilpSolver')
+        self.presolve = presolve
+        self.msg = msg
+
+    def solve(self, model, time_limit=None, mip_gap=None,
+              warm_start=False) -> int:
+        """
+        Solve model, setting its status and solution. scipy's milp does not
+        accept a starting solution, so warm_start is ignored.
+
+        :param model: SparseModel to solve
+        :param time_limit: seconds after which the solve stops, or None
+        :param mip_gap: relative gap at which the solve stops as optimal, or
+            None
+        :param warm_start: ignored
+        :return: pulp status of the solve
+        """
+        options = {'disp': self.msg, 'presolve': self.presolve}
+        if time_limit is not None:
+            options['time_limit'] = time_limit
+        if mip_gap is not None:
+            options['mip_rel_gap'] = mip_gap
+
+        matrix, lower, upper = model.matrix()
+        constraints = [] if matrix.shape[0] == 0 else \
+            [scipy.optimize.LinearConstraint(matrix, lower, upper)]
+        size = len(model.objective)
+        result = scipy.optimize.milp(
+            -model.objective, integrality=np.ones(size),
+            bounds=scipy.optimize.Bounds(np.zeros(size), np.ones(size)),
+            constraints=constraints, options=options)
+
+        statuses = {
+            0: pulp.LpStatusOptimal,
+            2: pulp.LpStatusInfeasible,
+            3: pulp.LpStatusUnbounded
+        }
+        model.status = statuses.get(result.status, pulp.LpStatusNotSolved)
+        if result.status == 1 and result.x is not None:
+            # stopped by the time limit with a feasible solution
+            model.status = STATUS_FEASIBLE
+
+        self.bound = None
+        model.solution = None
+        if model.status in (pulp.LpStatusOptimal, STATUS_FEASIBLE):
+            model.solution = result.x
+            bound = result.get('mip_dual_bound')
+            # milp minimizes the negated objective
+            self.bound = None if bound is None else -bound
+        return model.status
+
+
+class SparseDfsOptimizer(DfsOptimizer):
+    def __init__(self, players, positions, budget, flex_positions=None,
+                 utility_requirement=0, solver=None, solution_cache=None,
+                 profiler=None):
+        """
+        DfsOptimizer whose model is held as arrays rather than pulp objects.
+        Each constraint is a row of player indices, and the rows are assembled
+        into one CSR matrix straight from the player columns when the model is
+        solved with scipy.optimize.milp. Every other method behaves as in
+        DfsOptimizer, but self.model is a SparseModel rather than a
+        pulp.LpProblem.
+
+        :param solver: MilpSolver, or None for the default MilpSolver
+        :raises ImportError: if scipy is not installed
+        :raises ValueError: if any player does not have all required
+            attributes or solver is not a MilpSolver
+
+        See DfsOptimizer for the other parameters.
+        """
+        if solver is None:
+            solver = MilpSolver()
+        elif not isinstance(solver, MilpSolver):
+            raise ValueError('SparseDfsOptimizer requires a MilpSolver')
+        super().__init__(players, positions, budget, flex_positions,
+                         utility_requirement, solver, solution_cache,
+                         profiler)
+
+    def _new_model(self) -> SparseModel:
+        return SparseModel(self._projections, self._player_ids)
+
+    def _budget_constraint(self, budget) -> SparseConstraint:
+        return SparseConstraint(np.arange(len(self._player_ids)), -np.inf,
+                                budget, self._salaries)
+
+    def _constraint(self, constraint_name, indices, sense, rhs) \
+            -> SparseConstraint:
+        lower = -np.inf if sense == pulp.LpConstraintLE else rhs
+        upper = np.inf if sense == pulp.LpConstraintGE else rhs
+        return SparseConstraint(np.asarray(indices, dtype=int), lower, upper)
+
+    def _set_coefficients(self, expression, indices, values):
+        # the objective and the budget constraint hold the arrays updated by
+        # _update_coefficients, so there is nothing else to update
+        pass
+
+    def _set_start(self, indices, partial=False):
+        # MilpSolver ignores warm starts
+        pass
+
+    def _solution(self) -> np.ndarray:
+        return self.model.solution
+
+    def fingerprint(self) -> str:
+        return self.model.fingerprint(type(self.solver).__name__)
@@ -0,0 +1,208 @@
+from collections.abc import Mapping
+
+import numpy as np
+
+from fantasyopt.player import Player
+
+
+class PlayerPool(Mapping):
+    REQUIRED_ATTRIBUTES = [Player.NAME, Player.POINTS_PROJECTION,
+                           Player.OPPONENT, Player.GAME_TIME, Player.SALARY,
+                           Player.INJURY_STATUS, Player.TEAM, Player.POSITION]
+    CATEGORICAL_ATTRIBUTES = [Player.TEAM, Player.OPPONENT, Player.POSITION,
+                              Player.INJURY_STATUS]
+    NUMERIC_ATTRIBUTES = [Player.POINTS_PROJECTION, Player.SALARY]
+
+    def __init__(self, ids, columns):
+        """
+        Columnar player pool. Every attribute is stored as one NumPy array,
+        and the attributes in PlayerPool.CATEGORICAL_ATTRIBUTES are stored as
+        integer codes into an array of categories.
+
+        A PlayerPool is also a read-only mapping of player id -> dict of
+        attributes, so it can be used wherever a player dict from
+        PlayerLoader.get_player_dict is expected.
+
+        :param ids: sequence of player ids
+        :param columns: dict of attribute -> sequence of values, in the order
+            of ids. A categorical attribute may instead be given as a tuple of
+            (integer codes, categories)
+        :raises ValueError: if a required attribute is missing or a column does
+            not have one value per player
+        """
+        self.ids = list(ids)
+        self._index = {p: i for i, p in enumerate(self.ids)}
+
+        for attr in PlayerPool.REQUIRED_ATTRIBUTES:
+            if attr not in columns:
+                raise ValueError('player pool is missing required attribute '
+                                 '\'' + str(attr) + '\'')
+
+        self._columns = {}
+        self._codes = {}
+        self._categories = {}
+        for attr, values in columns.items():
+            if attr in PlayerPool.CATEGORICAL_ATTRIBUTES:
+                if isinstance(values, tuple):
+                    codes, categories = values
+                    codes = np.asarray(codes, dtype=np.int32)
+                    categories = np.asarray(categories, dtype=object)
+                else:
+                    codes, categories = PlayerPool._factorize(values)
+                self._codes[attr] = codes
+                self._categories[attr] = categories
+                length = len(codes)
+            elif attr in PlayerPool.NUMERIC_ATTRIBUTES:
+                values = np.asarray(values)
+                if values.dtype.kind not in 'iuf':
+                    values = values.astype(float)
+                self._columns[attr] = values
+                length = len(values)
+            else:
+                self._columns[attr] = PlayerPool._object_array(values)
+                length = len(self._columns[attr])
+
+            if length != len(self.ids):
+                raise ValueError('attribute \'' + str(attr) + '\' has ' +
+                                 str(length) + ' values for ' +
+                                 str(len(self.ids)) + ' players')
+
+        self._attributes = list(columns)
+
+    @staticmethod
+    def _object_array(values):
+        """
+        Build a one dimensional object array without NumPy unpacking values
+
+        :param values: sequence of values
+        :return: NumPy array of dtype object
+        """
+        array = np.empty(len(values), dtype=object)
+        array[:] = list(values)
+        return array
+
+    @staticmethod
+    def _factorize(values):
+        """
+        Encode values as integer codes
+
+        :param values: sequence of hashable values
+        :return: tuple of (array of codes, array of categories), where
+            categories are in order of first appearance
+        """
+        categories = {}
+        codes = np.fromiter((categories.setdefault(v, len(categories))
+                             for v in values), dtype=np.int32,
+                            count=len(values))
+        return codes, PlayerPool._object_array(list(categories))
+
+    @classmethod
+    def from_dict(cls, players):
+        """
+        Build a PlayerPool from a dict of player id -> dict of attributes, as
+        returned by PlayerLoader.get_player_dict
+
+        :param players: dictionary of dictionaries representing players
+        :return: PlayerPool
+        :raises ValueError: if any player does not have all required attributes
+        """
+        attributes = []
+        for player, player_attributes in players.items():
+            for attr in PlayerPool.REQUIRED_ATTRIBUTES:
+                if attr not in player_attributes:
+                    raise ValueError('player \'' + str(player) +
+                                     '\' is missing required attribute \'' +
+                                     str(attr) + '\'')
+            for attr in player_attributes:
+                if attr not in attributes:
+                    attributes.append(attr)
+
+        columns = {attr: [player_attributes.get(attr) for player_attributes
+                          in players.values()] for attr in attributes}
+        if len(players) == 0:
+            columns = {attr: [] for attr in PlayerPool.REQUIRED_ATTRIBUTES}
+        return cls(players.keys(), columns)
+
+    @classmethod
+    def from_dataframe(cls, df):
+        """
+        Build a PlayerPool from a DataFrame indexed by player id, as loaded by
+        PlayerLoader.import_csv
+
+        :param df: DataFrame of players
+        :type df: pd.DataFrame
+        :return: PlayerPool
+        :raises ValueError: if a required attribute is missing
+        """
+        columns = {}
+        for attr in df.columns:
+            if attr in PlayerPool.CATEGORICAL_ATTRIBUTES:
+                categorical = df[attr].astype('category').cat
+                columns[attr] = (categorical.codes.values,
+                                 categorical.categories.values)
+            elif attr in PlayerPool.NUMERIC_ATTRIBUTES:
+                columns[attr] = df[attr].values
+            else:
+                columns[attr] = df[attr].tolist()
+        return cls(df.index.tolist(), columns)
+
+    def column(self, attribute) -> np.ndarray:
+        """
+        Get the values of an attribute for every player
+
+        :param attribute: attribute (e.g. Player.SALARY)
+        :return: array of values, in the order of self.ids
+        """
+        if attribute in self._codes:
+            return self._categories[attribute][self._codes[attribute]]
+        return self._columns[attribute]
+
+    def groups(self, attribute) -> dict:
+        """
+        Group players by the value of one of their attributes
+
+        :param attribute: attribute to group by (e.g. Player.POSITION)
+        :return: dict of attribute value -> array of player indices, in the
+            order of self.ids
+        """
+        if attribute in self._codes:
+            codes = self._codes[attribute]
+            categories = self._categories[attribute]
+        else:
+            codes, categories = PlayerPool._factorize(self._columns[attribute])
+
+        order = np.argsort(codes, kind='stable')
+        counts = np.bincount(codes, minlength=len(categories))
+        return {category: indices for category, indices in
+                zip(categories.tolist(),
+                    np.split(order, np.cumsum(counts)[:-1]))
+                if len(indices) > 0}
+
+    def to_dict(self) -> dict:
+        """
+        Convert to a dict of player id -> dict of attributes
+
+        :return: dict of players
+        """
+        return {p: self[p] for p in self.ids}
+
+    def __getitem__(self, player):
+        i = self._index[player]
+        attributes = {}
+        for attr in self._attributes:
+            if attr in self._codes:
+                value = self._categories[attr][self._codes[attr][i]]
+            else:
+                value = self._columns[attr][i]
+            attributes[attr] = value.item() if isinstance(value, np.generic) \
+                else value
+        return attributes
+
+    def __iter__(self):
+        return iter(self.ids)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, player):
+        return player in self._index
@@ -0,0 +1,168 @@
+import json
+import logging
+import os
+import time
+from contextlib import contextmanager
+
+
+class Profiler:
+    # keys of every event passed to sinks
+    COMPONENT = 'component'
+    PHASE = 'phase'
+    SECONDS = 'seconds'
+    # key of the exception type name if a phase raised
+    ERROR = 'error'
+
+    def __init__(self, sinks=None):
+        """
+        Record the wall time of phases of DfsOptimizer and PlayerLoader and
+        pass each as an event to every sink. An event is a dict with the
+        component (e.g. 'DfsOptimizer'), the phase (e.g. 'solve'), the wall
+        time in seconds and phase details such as model size or solve status.
+
+        :param sinks: list of callables taking an event, such as LoggingSink,
+            JsonLinesSink or PrometheusSink
+        """
+        self.sinks = list(sinks or [])
+
+    @contextmanager
+    def phase(self, component, name, **details):
+        """
+        Time a phase. The block may add details to the yielded dict, which
+        are included in the event.
+
+        :param component: name of the component (e.g. 'DfsOptimizer')
+        :param name: name of the phase (e.g. 'solve')
+        :param details: initial details of the phase
+        :return: context manager yielding the dict of details
+        """
+        start = time.perf_counter()
+        try:
+            yield details
+        except Exception as e:
+            details[Profiler.ERROR] = type(e).__name__
+            raise
+        finally:
+            event = {Profiler.COMPONENT: component, Profiler.PHASE: name,
+                     Profiler.SECONDS: time.perf_counter() - start}
+            event.update(details)
+            self.emit(event)
+
+    def emit(self, event):
+        """
+        Pass an event to every sink
+
+        :param event: dict describing the phase
+        :return: None
+        """
+        for sink in self.sinks:
+            sink(event)
+
+
+class _NullProfiler(Profiler):
+    @contextmanager
+    def phase(self, component, name, **details):
+        yield details
+
+
+# profiler used when none is given, which records nothing
+NULL_PROFILER = _NullProfiler()
+
+
+class LoggingSink:
+    def __init__(self, logger=None, level=logging.INFO):
+        """
+        Log each event as one line
+
+        :param logger: logging.Logger; defaults to the 'fantasyopt' logger
+        :param level: logging level of the events
+        """
+        self.logger = logging.getLogger('fantasyopt') if logger is None \
+            else logger
+        self.level = level
+
+    def __call__(self, event):
+        details = ' '.join(key + '=' + str(value)
+                           for key, value in sorted(event.items())
+                           if key not in (Profiler.COMPONENT, Profiler.PHASE,
+                                          Profiler.SECONDS))
+        self.logger.log(self.level, '%s.%s took %.6fs %s',
+                        event[Profiler.COMPONENT], event[Profiler.PHASE],
+                        event[Profiler.SECONDS], details)
+
+
+class JsonLinesSink:
+    def __init__(self, file_name):
+        """
+        Append each event to a file as one JSON object per line
+
+        :param file_name: /path/to/events.jsonl
+        """
+        self.file_name = file_name
+
+    def __call__(self, event):
+        with open(self.file_name, 'a') as outfile:
+            outfile.write(json.dumps(event, sort_keys=True, default=str) +
+                          '\n')
+
+
+class PrometheusSink:
+    def __init__(self, file_name, prefix='fantasyopt'):
+        """
+        Keep totals of the events and write them to a file in the Prometheus
+        text format after each event, for a node exporter textfile collector.
+        The totals are the time spent and number of calls of each phase, the
+        number of solves with each status, and the size of the model of the
+        last event that reported one.
+
+        :param file_name: /path/to/fantasyopt.prom
+        :param prefix: prefix of the metric names
+        """
+        self.file_name = file_name
+        self.prefix = prefix
+        self.seconds = {}
+        self.counts = {}
+        self.statuses = {}
+        self.model_size = {}
+
+    def __call__(self, event):
+        key = (event[Profiler.COMPONENT], event[Profiler.PHASE])
+        self.seconds[key] = self.seconds.get(key, 0) + event[Profiler.SECONDS]
+        self.counts[key] = self.counts.get(key, 0) + 1
+        if 'status' in event:
+            status = str(event['status'])
+            self.statuses[status] = self.statuses.get(status, 0) + 1
+        for size in ['players', 'variables', 'constraints']:
+            if size in event:
+                self.model_size[size] = event[size]
+        self.write()
+
+    def write(self):
+        """
+        Write the totals to self.file_name, replacing it atomically
+
+        :return: None
+        """
+        lines = []
+        for name, kind, values in [
+                ('phase_seconds_total', 'counter', self.seconds),
+                ('phase_calls_total', 'counter', self.counts)]:
+            lines.append('# TYPE {}_{} {}'.format(self.prefix, name, kind))
+            for (component, phase), value in sorted(values.items()):
+                lines.append('{}_{}{{component="{}",phase="{}"}} {}'.format(
+                    self.prefix, name, component, phase, value))
+
+        lines.append('# TYPE {}_solve_status_total counter'.format(
+            self.prefix))
+        for status, value in sorted(self.statuses.items()):
+            lines.append('{}_solve_status_total{{status="{}"}} {}'.format(
+                self.prefix, status, value))
+
+        for size, value in sorted(self.model_size.items()):
+            lines.append('# TYPE {}_model_{} gauge'.format(self.prefix, size))
+            lines.append('{}_model_{} {}'.format(self.prefix, size, value))
+
+        staging = self.file_name + '.' + str(os.getpid()) + '.tmp'
+        with open(staging, 'w') as outfile:
+            outfile.write('\n'.join(lines) + '\n')
+        os.replace(staging, self.file_name)
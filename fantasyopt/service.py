@@ -0,0 +1,245 @@
+"""
+Long-running optimization service
+
+Requests and responses are JSON objects, one per line, over TCP or a Unix
+socket. Each worker process keeps a DfsOptimizer for every slate it has
+solved, so repeat requests on a slate only apply their constraints and solve.
+
+Usage: python -m fantasyopt.service [--host HOST] [--port PORT]
+                                    [--unix PATH] [--workers N]
+"""
+import argparse
+import asyncio
+import json
+from concurrent.futures import ProcessPoolExecutor
+
+
+class Request:
+    """
+    Keys of a service request
+    """
+    # one of the actions below
+    ACTION = 'action'
+    # name of the slate the request applies to
+    SLATE = 'slate'
+    # for LOAD, the slate definition, a dict with fantasyopt.slate.SlateSpec
+    # keys
+    DEFINITION = 'definition'
+    # for OPTIMIZE, the constraint deltas, a dict with
+    # fantasyopt.optimizer.batch.LineupSpec keys
+    SPEC = 'spec'
+
+    # load the players of a slate and build its model
+    LOAD = 'load'
+    # solve the lineup of a slate under the constraint deltas
+    OPTIMIZE = 'optimize'
+    # forget a slate, so it can no longer be optimized. Worker processes keep
+    # the model they built for it until they exit, so its memory is not
+    # released.
+    UNLOAD = 'unload'
+    # list the loaded slates
+    SLATES = 'slates'
+
+
+# The modules that load players and solve lineups import pandas, numpy and
+# pulp, so they are only imported in worker processes, keeping the startup
+# of the server itself fast.
+
+# optimizers built in each worker process, keyed by slate name, with the
+# definition each was built from
+_optimizers = {}
+_cache = None
+
+
+class OptimizationService:
+    def __init__(self, workers=None, cache_directory=None):
+        """
+        Keep slate definitions and solve lineups in a pool of worker processes
+
+        :param workers: number of worker processes; if None, the number of
+            CPUs is used
+        :param cache_directory: directory of the fantasyopt.loader.cache
+            DataFrameCache used to load players, or None for the default
+        """
+        self.slates = {}
+        self.executor = ProcessPoolExecutor(max_workers=workers,
+                                            initializer=_init_worker,
+                                            initargs=(cache_directory,))
+
+    async def handle(self, request) -> dict:
+        """
+        Handle one request
+
+        :param request: dict with Request keys
+        :return: JSON-serializable response; if the request fails for any
+            reason, a dict with the error message under 'error'
+        """
+        try:
+            if not isinstance(request, dict):
+                raise ValueError('request must be a JSON object')
+            action = request.get(Request.ACTION)
+            if action == Request.SLATES:
+                return {'slates': sorted(self.slates)}
+
+            slate = request[Request.SLATE]
+            if action == Request.LOAD:
+                definition = request[Request.DEFINITION]
+                players = await self._run(_load, slate, definition)
+                self.slates[slate] = definition
+                return {'slate': slate, 'players': players}
+            elif action == Request.UNLOAD:
+                self.slates.pop(slate, None)
+                return {'slate': slate}
+            elif action == Request.OPTIMIZE:
+                if slate not in self.slates:
+                    raise ValueError('slate ' + str(slate) + ' is not loaded')
+                return await self._run(_optimize, slate, self.slates[slate],
+                                       request.get(Request.SPEC, {}))
+            raise ValueError('unknown action ' + str(action))
+        except Exception as e:
+            # a bad request must not drop the connection
+            return {'error': type(e).__name__ + ': ' + str(e)}
+
+    async def _run(self, function, *args):
+        """
+        Run a function in the worker pool without blocking the event loop
+
+        :param function: function to run
+        :param args: arguments to function
+        :return: result of function
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor, function, *args)
+
+    async def serve_connection(self, reader, writer):
+        """
+        Answer the requests of one connection, each on its own line, until
+        the client closes it. Requests on one connection are handled in
+        order; separate connections are handled concurrently.
+
+        :param reader: asyncio.StreamReader
+        :param writer: asyncio.StreamWriter
+        :return: None
+        """
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                except ValueError as e:
+                    response = {'error': 'invalid JSON: ' + str(e)}
+                else:
+                    response = await self.handle(request)
+                writer.write(json.dumps(response).encode() + b'\n')
+                await writer.drain()
+        finally:
+            writer.close()
+
+    def close(self):
+        """
+        Shut down the worker pool
+
+        :return: None
+        """
+        self.executor.shutdown()
+
+
+def _init_worker(cache_directory):
+    """
+    Create the DataFrameCache used to load players in a worker process
+
+    :param cache_directory: directory of the DataFrameCache, or None for the
+        default
+    :return: None
+    """
+    from fantasyopt.loader.cache import DataFrameCache
+
+    global _cache
+    _cache = DataFrameCache(cache_directory)
+
+
+def _optimizer(slate, definition):
+    """
+    Get this worker's optimizer for a slate, building it if the worker has not
+    seen the slate or its definition changed
+
+    :param slate: name of the slate
+    :param definition: dict with fantasyopt.slate.SlateSpec keys
+    :return: DfsOptimizer
+    """
+    from fantasyopt.slate import build_optimizer
+
+    if slate not in _optimizers or _optimizers[slate][0] != definition:
+        _optimizers[slate] = (definition, build_optimizer(definition, _cache))
+    return _optimizers[slate][1]
+
+
+def _load(slate, definition) -> int:
+    """
+    Build the optimizer for a slate
+
+    :param slate: name of the slate
+    :param definition: dict with fantasyopt.slate.SlateSpec keys
+    :return: number of players in the slate
+    """
+    return len(_optimizer(slate, definition).players)
+
+
+def _optimize(slate, definition, spec) -> dict:
+    """
+    Solve the lineup of a slate under the constraint deltas of spec
+
+    :param slate: name of the slate
+    :param definition: dict with fantasyopt.slate.SlateSpec keys
+    :param spec: dict with fantasyopt.optimizer.batch.LineupSpec keys
+    :return: JSON-serializable result
+    """
+    from fantasyopt.optimizer.batch import solve_spec
+    from fantasyopt.slate import result_to_json
+
+    optimizer = _optimizer(slate, definition)
+    return result_to_json(optimizer.players, solve_spec(optimizer, spec))
+
+
+async def serve(service, host='127.0.0.1', port=8765, path=None):
+    """
+    Run the service until cancelled
+
+    :param service: OptimizationService
+    :param host: host to listen on
+    :param port: port to listen on
+    :param path: path of a Unix socket to listen on instead of host and port
+    :return: None
+    """
+    if path is not None:
+        server = await asyncio.start_unix_server(service.serve_connection,
+                                                 path)
+    else:
+        server = await asyncio.start_server(service.serve_connection, host,
+                                            port)
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Serve lineups as JSON')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', help='path of a Unix socket to listen on')
+    parser.add_argument('--workers', type=int)
+    parser.add_argument('--cache-directory')
+    args = parser.parse_args(argv)
+
+    service = OptimizationService(args.workers, args.cache_directory)
+    try:
+        asyncio.run(serve(service, args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+from fantasyopt import SITE_DEFAULTS
+from fantasyopt.leagues import League
+from fantasyopt.loader.yahoo.nba import NbaLoader
+from fantasyopt.loader.yahoo.nfl import NflLoader
+from fantasyopt.optimizer.dfs import DfsOptimizer
+from fantasyopt.sites import Site
+
+LOADERS = {
+    (Site.YAHOO, League.NFL): NflLoader,
+    (Site.YAHOO, League.NBA): NbaLoader
+}
+
+
+class SlateSpec:
+    """
+    Keys of a slate definition passed to load_slate and build_optimizer.
+    CSV and LEAGUE are required.
+    """
+    # /path/to/file.csv of players
+    CSV = 'csv'
+    # league name (e.g. 'NFL')
+    LEAGUE = 'league'
+    # site name (e.g. 'Yahoo'); defaults to Yahoo
+    SITE = 'site'
+    # list of [column, value] pairs of players to drop; defaults to the site's
+    # ignore conditions for the league
+    IGNORE_CONDITIONS = 'ignore_conditions'
+    # solver passed to DfsOptimizer
+    SOLVER = 'solver'
+
+
+def roster(site, league) -> tuple:
+    """
+    Get the roster configuration of a league on a site
+
+    :param site: Site
+    :param league: League
+    :return: tuple of (positions, budget, flex positions, utility requirement)
+        as passed to DfsOptimizer
+    :raises ValueError: if the site or league is not supported
+    """
+    if site not in SITE_DEFAULTS or \
+            not hasattr(SITE_DEFAULTS[site], league.value + '_POSITIONS'):
+        raise ValueError('Unsupported league ' + league.value + ' for site ' +
+                         site.value)
+    defaults = SITE_DEFAULTS[site]
+    return (getattr(defaults, league.value + '_POSITIONS'),
+            getattr(defaults, league.value + '_BUDGET'),
+            getattr(defaults, league.value + '_FLEX_POSITIONS'),
+            getattr(defaults, league.value + '_UTILITY_POSITIONS'))
+
+
+def load_slate(slate, cache=None):
+    """
+    Load the players of a slate
+
+    :param slate: dict with SlateSpec keys
+    :param cache: fantasyopt.loader.cache.DataFrameCache used by the loader,
+        or None
+    :return: loader of the players (e.g. NflLoader instance)
+    :raises ValueError: if a required key is missing or the site or league is
+        not supported
+    """
+    site, league = site_and_league(slate)
+    if (site, league) not in LOADERS:
+        raise ValueError('Unsupported site for loading: ' + site.value)
+
+    ignore_conditions = slate.get(SlateSpec.IGNORE_CONDITIONS)
+    if ignore_conditions is not None:
+        ignore_conditions = [tuple(c) for c in ignore_conditions]
+    return LOADERS[(site, league)].load_players(slate[SlateSpec.CSV],
+                                                ignore_conditions,
+                                                cache=cache)
+
+
+def build_optimizer(slate, cache=None) -> DfsOptimizer:
+    """
+    Load the players of a slate and build a DfsOptimizer with the roster of
+    its league
+
+    :param slate: dict with SlateSpec keys
+    :param cache: fantasyopt.loader.cache.DataFrameCache used by the loader,
+        or None
+    :return: DfsOptimizer
+    :raises ValueError: if a required key is missing or the site or league is
+        not supported
+    """
+    site, league = site_and_league(slate)
+    positions, budget, flex_positions, utility_requirement = \
+        roster(site, league)
+    return DfsOptimizer(load_slate(slate, cache).get_player_pool(),
+                        positions, budget, flex_positions,
+                        utility_requirement, slate.get(SlateSpec.SOLVER))
+
+
+def result_to_json(players, result) -> dict:
+    """
+    Convert a result of DfsOptimizer.optimize to JSON-serializable values
+
+    :param players: players the result was solved from
+    :param result: result of DfsOptimizer.optimize
+    :return: dict of the result, with players as a sorted list and the lineup
+        organized by position under 'lineup'
+    """
+    json_result = dict(result)
+    json_result[DfsOptimizer.LINEUP_PLAYERS] = \
+        sorted(result[DfsOptimizer.LINEUP_PLAYERS])
+    json_result['lineup'] = DfsOptimizer.organize_lineup(players, result)
+    return json_result
+
+
+def site_and_league(slate) -> tuple:
+    """
+    Get the site and league of a slate
+
+    :param slate: dict with SlateSpec keys
+    :return: tuple of (Site, League) of slate
+    :raises ValueError: if a required key is missing or the site or league is
+        unknown
+    """
+    for key in [SlateSpec.CSV, SlateSpec.LEAGUE]:
+        if key not in slate:
+            raise ValueError('slate is missing required key \'' + key + '\'')
+    return Site(slate.get(SlateSpec.SITE, Site.YAHOO.value)), \
+        League(str(slate[SlateSpec.LEAGUE]).upper())
@@ -0,0 +1,23 @@
+import argparse
+
+
+def optimize_job(job_file, output_file, workers=None):
+    # imported after arguments are parsed so --help and usage errors are fast
+    from fantasyopt.jobs import read_job, run_job, write_results
+    from fantasyopt.loader.cache import DataFrameCache
+
+    results = run_job(read_job(job_file), workers, DataFrameCache())
+    write_results(output_file, results)
+    print('Wrote ' + str(len(results)) + ' lineups to ' + output_file)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Solve every lineup of a YAML or JSON job file')
+    parser.add_argument('job', help='/path/to/job.yaml or /path/to/job.json')
+    parser.add_argument('output', help='/path/to/output.json')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='number of worker processes per slate')
+    args = parser.parse_args()
+
+    optimize_job(args.job, args.output, args.workers)
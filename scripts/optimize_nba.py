@@ -2,7 +2,9 @@ import sys
 
 from fantasyopt import *
 import fantasyopt.loader.yahoo as yh
+from fantasyopt.loader.cache import DataFrameCache
 from fantasyopt.optimizer.dfs import DfsOptimizer
+from fantasyopt.optimizer.pruning import prune_dominated_players
 
 
 def optimize_lineup(site, csv_location):
@@ -12,8 +14,14 @@ def optimize_lineup(site, csv_location):
     ignore_conditions.update(
         SITE_DEFAULTS[site].NBA_PLAYER_IGNORE_CONDITIONS)
 
-    optimizer = DfsOptimizer(load_players(site, csv_location,
-                                          ignore_conditions).get_player_dict(),
+    players, removed = prune_dominated_players(
+        load_players(site, csv_location, ignore_conditions).get_player_dict(),
+        SITE_DEFAULTS[site].NBA_POSITIONS,
+        SITE_DEFAULTS[site].NBA_FLEX_POSITIONS,
+        SITE_DEFAULTS[site].NBA_UTILITY_POSITIONS)
+    print('Removed ' + str(removed) + ' dominated players')
+
+    optimizer = DfsOptimizer(players,
                              SITE_DEFAULTS[site].NBA_POSITIONS,
                              SITE_DEFAULTS[site].NBA_BUDGET,
                              SITE_DEFAULTS[site].NBA_FLEX_POSITIONS,
@@ -29,7 +37,9 @@ def load_players(site, csv_location, ignore_conditions):
     if site not in loaders:
         raise ValueError('Unsupported site for loading: ' + site)
 
-    return loaders[site].load_players(csv_location, ignore_conditions)
+    # repeat runs on the same slate read the cleaned players from the cache
+    return loaders[site].load_players(csv_location, ignore_conditions,
+                                      cache=DataFrameCache())
 
 
 if __name__ == '__main__':
@@ -2,7 +2,9 @@ import sys
 
 from fantasyopt import *
 import fantasyopt.loader.yahoo as yh
+from fantasyopt.loader.cache import DataFrameCache
 from fantasyopt.optimizer.dfs import DfsOptimizer
+from fantasyopt.optimizer.pruning import prune_dominated_players
 
 
 def optimize_lineup(site, csv_location):
@@ -12,50 +14,63 @@ def optimize_lineup(site, csv_location):
     ignore_conditions.update(
         SITE_DEFAULTS[site].NFL_PLAYER_IGNORE_CONDITIONS)
 
-    optimizer = DfsOptimizer(load_players(site, csv_location,
-                                          ignore_conditions).get_player_dict(),
+    required = split_input(input('Enter players to require [First Last].\n\t'
+                                 'If multiple players,'
+                                 ' use a comma-separated list\n\t'
+                                 '(e.g. Patrick Mahomes,Saquon Barkley): '))
+    ignored = split_input(input('Enter players to ignore [First Last].\n\t'
+                                'If multiple players,'
+                                ' use a comma-separated list\n\t'
+                                '(e.g. Nathan Peterman,Steven Ridley): '))
+    avoided = split_input(input('Enter opponents to avoid.\n\tIf multiple '
+                                'teams, use a comma-separated list\n\t'
+                                '(e.g. NYG,LAR): '))
+    ignored_teams = split_input(input('Enter teams to ignore.\n\tIf multiple '
+                                      'teams, use a comma-separated list\n\t'
+                                      '(e.g. TB,MIA): '))
+    maximum = input('Enter the maximum allowed number of players '
+                    'allowed from a team.\n\t'
+                    'If no preference, enter nothing: ')
+
+    players = load_players(site, csv_location,
+                           ignore_conditions).get_player_dict()
+    # pruning does not account for a maximum number of players per team
+    if maximum == '':
+        players, removed = prune_dominated_players(
+            players, SITE_DEFAULTS[site].NFL_POSITIONS,
+            SITE_DEFAULTS[site].NFL_FLEX_POSITIONS,
+            SITE_DEFAULTS[site].NFL_UTILITY_POSITIONS, required, ignored,
+            ignored_teams, avoided)
+        print('Removed ' + str(removed) + ' dominated players')
+
+    optimizer = DfsOptimizer(players,
                              SITE_DEFAULTS[site].NFL_POSITIONS,
                              SITE_DEFAULTS[site].NFL_BUDGET,
                              SITE_DEFAULTS[site].NFL_FLEX_POSITIONS,
                              SITE_DEFAULTS[site].NFL_UTILITY_POSITIONS)
 
-    players = input('Enter players to require [First Last].\n\t'
-                    'If multiple players,'
-                    ' use a comma-separated list\n\t'
-                    '(e.g. Patrick Mahomes,Saquon Barkley): ')
-    if players != '':
-        for p in players.split(','):
-            optimizer.require_player(p)
-
-    players = input('Enter players to ignore [First Last].\n\t'
-                    'If multiple players,'
-                    ' use a comma-separated list\n\t'
-                    '(e.g. Nathan Peterman,Steven Ridley): ')
-    if players != '':
-        for p in players.split(','):
-            optimizer.ignore_player(p)
-
-    teams = input('Enter opponents to avoid.\n\tIf multiple teams,'
-                  ' use a comma-separated list\n\t(e.g. NYG,LAR): ')
-    if teams != '':
-        for t in teams.split(','):
-            optimizer.avoid_opponent(t)
-
-    teams = input('Enter teams to ignore.\n\tIf multiple teams,'
-                  ' use a comma-separated list\n\t(e.g. TB,MIA): ')
-    if teams != '':
-        for t in teams.split(','):
-            optimizer.ignore_team(t)
-
-    maximum = input('Enter the maximum allowed number of players '
-                    'allowed from a team.\n\t'
-                    'If no preference, enter nothing: ')
+    optimizer.require_players(required)
+    optimizer.ignore_players(ignored)
+    optimizer.avoid_opponents(avoided)
+    optimizer.ignore_teams(ignored_teams)
     if maximum != '':
         optimizer.set_max_players_from_same_team(int(maximum))
 
     optimizer.generate_lineup()
 
 
+def split_input(line):
+    """
+    Split comma-separated input
+
+    :param line: input line
+    :return: list of comma-separated values, empty if line is empty
+    """
+    if line == '':
+        return []
+    return line.split(',')
+
+
 def load_players(site, csv_location, ignore_conditions):
     loaders = {
         Site.YAHOO: yh.nfl.NflLoader
@@ -64,7 +79,9 @@ def load_players(site, csv_location, ignore_conditions):
     if site not in loaders:
         raise ValueError('Unsupported site for loading: ' + site)
 
-    return loaders[site].load_players(csv_location, ignore_conditions)
+    # repeat runs on the same slate read the cleaned players from the cache
+    return loaders[site].load_players(csv_location, ignore_conditions,
+                                      cache=DataFrameCache())
 
 
 if __name__ == '__main__':
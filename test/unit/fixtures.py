@@ -0,0 +1,158 @@
+from fantasyopt.optimizer.dfs import DfsOptimizer
+from fantasyopt.player import Player
+
+
+class OptimizerFixture:
+    """
+    Nine-player pool and roster shared by the optimizer tests. Each instance
+    has its own copies, so tests may modify them.
+    """
+    POS_ONLY = 'positions_only'
+    W_FLEX = 'with_flex'
+    W_UTILITY = 'with_utility'
+    W_FLEX_W_UTILITY = 'with_flex_with_utility'
+
+    def __init__(self):
+        self.players = {
+            'p1': {
+                Player.NAME: 'player_1',
+                Player.POINTS_PROJECTION: 25,
+                Player.POSITION: 'position_1',
+                Player.SALARY: 3,
+                Player.TEAM: 'team_1',
+                Player.OPPONENT: 'team_4',
+                Player.INJURY_STATUS: 'I',
+                Player.GAME_TIME: '1'
+            },
+            'p2': {
+                Player.NAME: 'player_2',
+                Player.POINTS_PROJECTION: 30,
+                Player.POSITION: 'position_1',
+                Player.SALARY: 15,
+                Player.TEAM: 'team_2',
+                Player.OPPONENT: 'team_3',
+                Player.INJURY_STATUS: 'H',
+                Player.GAME_TIME: '2'
+            },
+            'p3': {
+                Player.NAME: 'player_3',
+                Player.POINTS_PROJECTION: 4,
+                Player.POSITION: 'position_2',
+                Player.SALARY: 5,
+                Player.TEAM: 'team_3',
+                Player.OPPONENT: 'team_2',
+                Player.INJURY_STATUS: 'G',
+                Player.GAME_TIME: '2'
+            },
+            'p4': {
+                Player.NAME: 'player_4',
+                Player.POINTS_PROJECTION: 2,
+                Player.POSITION: 'position_2',
+                Player.SALARY: 2,
+                Player.TEAM: 'team_4',
+                Player.OPPONENT: 'team_1',
+                Player.INJURY_STATUS: 'F',
+                Player.GAME_TIME: '1'
+            },
+            'p5': {
+                Player.NAME: 'player_5',
+                Player.POINTS_PROJECTION: 30,
+                Player.POSITION: 'position_3',
+                Player.SALARY: 9,
+                Player.TEAM: 'team_1',
+                Player.OPPONENT: 'team_4',
+                Player.INJURY_STATUS: 'E',
+                Player.GAME_TIME: '1'
+            },
+            'p6': {
+                Player.NAME: 'player_6',
+                Player.POINTS_PROJECTION: 1,
+                Player.POSITION: 'position_3',
+                Player.SALARY: 8,
+                Player.TEAM: 'team_2',
+                Player.OPPONENT: 'team_3',
+                Player.INJURY_STATUS: 'D',
+                Player.GAME_TIME: '2'
+            },
+            'p7': {
+                Player.NAME: 'player_7',
+                Player.POINTS_PROJECTION: 25,
+                Player.POSITION: 'position_4',
+                Player.SALARY: 1,
+                Player.TEAM: 'team_3',
+                Player.OPPONENT: 'team_2',
+                Player.INJURY_STATUS: 'C',
+                Player.GAME_TIME: '2'
+            },
+            'p8': {
+                Player.NAME: 'player_8',
+                Player.POINTS_PROJECTION: 25,
+                Player.POSITION: 'position_4',
+                Player.SALARY: 2,
+                Player.TEAM: 'team_4',
+                Player.OPPONENT: 'team_1',
+                Player.INJURY_STATUS: 'B',
+                Player.GAME_TIME: '1'
+            },
+            'p9': {
+                Player.NAME: 'player_9',
+                Player.POINTS_PROJECTION: 3,
+                Player.POSITION: 'position_5',
+                Player.SALARY: 5,
+                Player.TEAM: 'team_1',
+                Player.OPPONENT: 'team_4',
+                Player.INJURY_STATUS: 'A',
+                Player.GAME_TIME: '1'
+            }
+        }
+
+        self.positions = {
+            'position_1': 1,
+            'position_2': 1,
+            'position_3': 1,
+            'position_4': 1,
+            'position_5': 1
+        }
+
+        self.budget = 35
+
+        self.flex_positions = {
+            '1_2': ({'position_1', 'position_2'}, 1),
+            '3_4': ({'position_3', 'position_4'}, 1),
+        }
+
+        self.utility_requirement = 1
+
+        self._optimizers = None
+
+    def make_optimizers(self, cls=DfsOptimizer, **kwargs) -> dict:
+        """
+        Build an optimizer for each roster variant of the fixture
+
+        :param cls: optimizer class, taking DfsOptimizer's arguments
+        :param kwargs: other keyword arguments to cls (e.g. solver)
+        :return: dict of variant name -> optimizer
+        """
+        return {
+            self.POS_ONLY: cls(self.players, self.positions, self.budget,
+                               **kwargs),
+            self.W_FLEX: cls(self.players, self.positions, self.budget,
+                             flex_positions=self.flex_positions, **kwargs),
+            self.W_UTILITY: cls(self.players, self.positions, self.budget,
+                                utility_requirement=self.utility_requirement,
+                                **kwargs),
+            self.W_FLEX_W_UTILITY: cls(self.players, self.positions,
+                                       self.budget,
+                                       flex_positions=self.flex_positions,
+                                       utility_requirement=
+                                       self.utility_requirement, **kwargs)
+        }
+
+    @property
+    def optimizers(self) -> dict:
+        """
+        :return: DfsOptimizer of each roster variant, built on first use
+        """
+        if self._optimizers is None:
+            self._optimizers = self.make_optimizers()
+        return self._optimizers
@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 from unittest.mock import mock_open, patch
 
@@ -147,3 +149,84 @@ class TestPlayerLoader(unittest.TestCase):
                                   PlayerLoader.import_csv, 'test.csv', 'Id',
                                   {'FPPG': np.float, 'Salary': np.int}, None,
                                   None, None)
+
+    @patch.multiple(PlayerLoader, __abstractmethods__=set())
+    def test_import_with_column_functions(self):
+        with patch('os.path.isfile') as mock_isfile:
+            mock_isfile.return_value = True
+            with patch('builtins.open',
+                       mock_open(read_data='Id,First Name,Last Name,Position,'
+                                           'Team,Opponent,Game,Time,Salary,'
+                                           'FPPG,Injury Status,Starting\n'
+                                           'nfl.p.27540,Odell,Beckham Jr.,WR,'
+                                           'NYG,IND,NYG@IND,1:00PM EST,26,16.0,'
+                                           'Q,No\n'
+                                           'nfl.p.30972,Saquon,Barkley,RB,NYG,'
+                                           'IND,NYG@IND,1:00PM EST,36,21.6,\" '
+                                           '\",No\n'
+                                           'nfl.p.6760,Eli,Manning,QB,NYG,IND,'
+                                           'NYG@IND,1:00PM EST,25,15.0,'
+                                           'O,No')):
+                ignore_conditions = [(Player.INJURY_STATUS, 'O'),
+                                     (Player.INJURY_STATUS, 'Q')]
+
+                def make_name(df):
+                    return df['First Name'] + ' ' + df['Last Name']
+
+                player_loader = PlayerLoader(
+                    PlayerLoader.import_csv('test.csv', 'Id',
+                                            {'Salary': int,
+                                             'Injury Status': 'category'},
+                                            {'Injury Status':
+                                             Player.INJURY_STATUS},
+                                            ignore_conditions,
+                                            use_columns=['Id', 'First Name',
+                                                         'Last Name', 'Salary',
+                                                         'Injury Status'],
+                                            column_functions=[
+                                                (Player.NAME, make_name)])
+                )
+
+        correct = {
+            "nfl.p.30972": {
+                "First Name": "Saquon",
+                "Last Name": "Barkley",
+                "Salary": 36,
+                Player.INJURY_STATUS: " ",
+                Player.NAME: "Saquon Barkley"
+            }
+        }
+        self.assertDictEqual(correct, player_loader.get_player_dict())
+
+    def test_iter_csv(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, 'slates.csv')
+            with open(file_name, 'w') as outfile:
+                outfile.write('Id,Slate,Name,Team,Injury Status\n'
+                              '1,a,A,NYG,O\n'
+                              '2,a,B,IND," "\n'
+                              '3,a,C,NYG," "\n'
+                              '4,b,D,DAL," "\n'
+                              '5,b,E,NYG," "\n'
+                              '6,c,F,PHI," "\n')
+
+            slates = list(PlayerLoader.iter_csv(
+                file_name, 'Slate', 2, 'Id', {'Team': 'category'},
+                {'Injury Status': Player.INJURY_STATUS},
+                [(Player.INJURY_STATUS, 'O')]))
+
+        self.assertEqual(['a', 'b', 'c'], [slate for slate, df in slates])
+        self.assertEqual([['2', '3'], ['4', '5'], ['6']],
+                         [df.index.tolist() for slate, df in slates])
+        self.assertEqual(['IND', 'NYG'], slates[0][1]['Team'].tolist())
+        for slate, df in slates:
+            self.assertEqual('category', df['Team'].dtype.name)
+
+    def test_iter_csv_not_contiguous(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, 'slates.csv')
+            with open(file_name, 'w') as outfile:
+                outfile.write('Id,Slate\n1,a\n2,b\n3,a\n')
+
+            with self.assertRaises(ValueError):
+                list(PlayerLoader.iter_csv(file_name, 'Slate', 1, 'Id'))
@@ -0,0 +1,92 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import pandas as pd
+
+from fantasyopt.loader.cache import DataFrameCache
+from fantasyopt.loader.yahoo.nfl import NflLoader
+from fantasyopt.player import Player
+
+CSV = 'Id,First Name,Last Name,Position,Team,Opponent,Game,Time,Salary,' \
+      'FPPG,Injury Status,Starting\n' \
+      'nfl.p.27540,Odell,Beckham Jr.,WR,NYG,IND,NYG@IND,1:00PM EST,26,16.0,' \
+      'Q,No\n' \
+      'nfl.p.30972,Saquon,Barkley,RB,NYG,IND,NYG@IND,1:00PM EST,36,21.6,' \
+      '" ",No\n' \
+      'nfl.p.6767,Kyle,Lauletta,QB,NYG,IND,NYG@IND,1:00PM EST,25,15.0,O,No\n'
+
+
+class TestDataFrameCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = DataFrameCache(os.path.join(self.directory.name,
+                                                 'cache'))
+        self.csv = os.path.join(self.directory.name, 'players.csv')
+        with open(self.csv, 'w') as outfile:
+            outfile.write(CSV)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_round_trip(self):
+        df = NflLoader.load_players(self.csv).df
+        self.assertTrue(self.cache.put('key', df))
+
+        cached = self.cache.get('key')
+        pd.testing.assert_frame_equal(df, cached)
+        self.assertEqual('category', cached[Player.TEAM].dtype.name)
+        self.assertDictEqual(df.to_dict('index'), cached.to_dict('index'))
+
+    def test_get_missing_key(self):
+        self.assertIsNone(self.cache.get('missing'))
+
+    def test_put_unsupported_column(self):
+        df = pd.DataFrame({'a': [1, 'b']})
+        self.assertFalse(self.cache.put('key', df))
+        self.assertIsNone(self.cache.get('key'))
+        self.assertEqual(0, self.cache.size())
+
+    def test_key_depends_on_contents_and_options(self):
+        key = DataFrameCache.key(self.csv, [('a', 'O')], {'x': int})
+        self.assertEqual(key, DataFrameCache.key(self.csv, [('a', 'O')],
+                                                 {'x': int}))
+        self.assertEqual(DataFrameCache.key(self.csv, {('a', 'O'), ('a', 'D')}),
+                         DataFrameCache.key(self.csv, {('a', 'D'), ('a', 'O')}))
+        self.assertNotEqual(key, DataFrameCache.key(self.csv, [('a', 'D')],
+                                                    {'x': int}))
+
+        with open(self.csv, 'a') as outfile:
+            outfile.write('nfl.p.1,A,B,QB,NYG,IND,NYG@IND,1:00PM EST,25,1.0,'
+                          '" ",No\n')
+        self.assertNotEqual(key, DataFrameCache.key(self.csv, [('a', 'O')],
+                                                    {'x': int}))
+
+    def test_evict_least_recently_used(self):
+        df = NflLoader.load_players(self.csv).df
+        self.cache.put('first', df)
+        size = self.cache.size()
+        self.cache.put('second', df)
+
+        os.utime(os.path.join(self.cache.directory, 'first',
+                              DataFrameCache.META_FILE), (0, 0))
+        os.utime(os.path.join(self.cache.directory, 'second',
+                              DataFrameCache.META_FILE), (1, 1))
+        self.cache.get('first')
+
+        self.cache.max_bytes = size
+        self.cache.evict()
+        self.assertIsNotNone(self.cache.get('first'))
+        self.assertIsNone(self.cache.get('second'))
+
+    def test_load_players_uses_cache(self):
+        df = NflLoader.load_players(self.csv, cache=self.cache).df
+        with patch('pandas.read_csv') as mock_read_csv:
+            cached = NflLoader.load_players(self.csv, cache=self.cache).df
+            mock_read_csv.assert_not_called()
+        pd.testing.assert_frame_equal(df, cached)
+
+        NflLoader.load_players(self.csv, {(Player.INJURY_STATUS, 'O')},
+                               cache=self.cache)
+        self.assertEqual(2, len(os.listdir(self.cache.directory)))
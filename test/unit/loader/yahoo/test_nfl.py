@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 from unittest.mock import mock_open, patch
 
@@ -134,3 +136,26 @@ class TestNflLoader(unittest.TestCase):
             }
         }
         self.assertDictEqual(correct, player_loader.get_player_dict())
+
+    def test_load_slates(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, 'slates.csv')
+            with open(file_name, 'w') as outfile:
+                outfile.write('Id,First Name,Last Name,Position,Team,Opponent,'
+                              'Game,Time,Salary,FPPG,Injury Status,Starting,'
+                              'Slate Id\n'
+                              'nfl.p.27540,Odell,Beckham Jr.,WR,NYG,IND,'
+                              'NYG@IND,1:00PM EST,26,16.0,Q,No,1\n'
+                              'nfl.p.6767,Kyle,Lauletta,QB,NYG,IND,NYG@IND,'
+                              '1:00PM EST,25,15.0,O,No,1\n'
+                              'nfl.p.30972,Saquon,Barkley,RB,NYG,IND,NYG@IND,'
+                              '1:00PM EST,36,21.6," ",No,2\n')
+
+            slates = list(NflLoader.load_slates(file_name, 'Slate Id',
+                                                chunk_size=1))
+
+        self.assertEqual([1, 2], [slate for slate, loader in slates])
+        self.assertEqual({'nfl.p.27540'}, set(slates[0][1].get_player_dict()))
+        player = slates[1][1].get_player_dict()['nfl.p.30972']
+        self.assertEqual('Saquon Barkley', player[Player.NAME])
+        self.assertEqual(2, player['Slate Id'])
@@ -0,0 +1,118 @@
+import unittest
+
+import pulp
+
+from test.unit.fixtures import OptimizerFixture
+from fantasyopt.optimizer.batch import LineupSpec, optimize_many, \
+    solve_spec
+from fantasyopt.optimizer.dfs import DfsOptimizer
+from fantasyopt.player import Player
+
+
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        self.fixture = OptimizerFixture()
+
+        self.specs = [
+            {},
+            {LineupSpec.REQUIRE_PLAYERS: ['player_6']},
+            {LineupSpec.IGNORE_PLAYERS: ['player_2', 'player_5']},
+            {LineupSpec.IGNORE_TEAMS: ['team_2']},
+            {LineupSpec.AVOID_OPPONENTS: ['team_3']},
+            {LineupSpec.MAX_PLAYERS_FROM_SAME_TEAM: 2},
+            {LineupSpec.PROJECTIONS: {'p6': 100}},
+            {}
+        ]
+
+    def expected(self, spec):
+        f = self.fixture
+        players = {p: dict(attributes) for p, attributes in f.players.items()}
+        for p, points in spec.get(LineupSpec.PROJECTIONS, {}).items():
+            players[p][Player.POINTS_PROJECTION] = points
+
+        optimizer = DfsOptimizer(players, f.positions, f.budget,
+                                 f.flex_positions)
+        optimizer.require_players(spec.get(LineupSpec.REQUIRE_PLAYERS, []))
+        optimizer.ignore_players(spec.get(LineupSpec.IGNORE_PLAYERS, []))
+        optimizer.ignore_teams(spec.get(LineupSpec.IGNORE_TEAMS, []))
+        optimizer.avoid_opponents(spec.get(LineupSpec.AVOID_OPPONENTS, []))
+        if LineupSpec.MAX_PLAYERS_FROM_SAME_TEAM in spec:
+            optimizer.set_max_players_from_same_team(
+                spec[LineupSpec.MAX_PLAYERS_FROM_SAME_TEAM])
+        return optimizer.optimize()
+
+    def test_optimize_many(self):
+        f = self.fixture
+        expected = [self.expected(spec) for spec in self.specs]
+        for workers in [1, 2]:
+            results = optimize_many(self.specs, f.players, f.positions,
+                                    f.budget, f.flex_positions,
+                                    workers=workers)
+            self.assertEqual(len(self.specs), len(results))
+            for spec, correct, result in zip(self.specs, expected, results):
+                self.assertDictEqual(correct, result,
+                                     msg=str(workers) + ' failed for ' +
+                                         str(spec))
+
+    def test_optimize_many_infeasible(self):
+        f = self.fixture
+        results = optimize_many([{LineupSpec.IGNORE_PLAYERS: ['player_9']},
+                                 {}], f.players, f.positions, f.budget,
+                                workers=1)
+        self.assertEqual(pulp.LpStatusInfeasible,
+                         results[0][DfsOptimizer.IP_STATUS])
+        self.assertSetEqual(set(), results[0][DfsOptimizer.LINEUP_PLAYERS])
+        self.assertEqual(pulp.LpStatusOptimal,
+                         results[1][DfsOptimizer.IP_STATUS])
+
+    def test_optimize_many_time_limit(self):
+        f = self.fixture
+        results = optimize_many([{LineupSpec.TIME_LIMIT: 60}, {}], f.players,
+                                f.positions, f.budget, workers=1)
+        self.assertEqual(results[1][DfsOptimizer.LINEUP_POINTS],
+                         results[0][DfsOptimizer.LINEUP_BOUND])
+        self.assertEqual(0, results[0][DfsOptimizer.LINEUP_GAP])
+        self.assertNotIn(DfsOptimizer.LINEUP_BOUND, results[1])
+
+    def test_optimize_many_initial_lineup(self):
+        f = self.fixture
+        results = optimize_many(
+            [{}, {LineupSpec.INITIAL_LINEUP: ['p1', 'p3', 'p5', 'p7', 'p9']}],
+            f.players, f.positions, f.budget, workers=1)
+        self.assertDictEqual(results[0], results[1])
+        self.assertRaises(ValueError, optimize_many,
+                          [{LineupSpec.INITIAL_LINEUP: ['p10']}], f.players,
+                          f.positions, f.budget, workers=1)
+
+    def test_optimize_many_nonexistent_player(self):
+        f = self.fixture
+        self.assertRaises(RuntimeError, optimize_many,
+                          [{LineupSpec.REQUIRE_PLAYERS: ['player_10']}],
+                          f.players, f.positions, f.budget, workers=1)
+
+    def test_solve_spec_restores_optimizer(self):
+        f = self.fixture
+        optimizer = DfsOptimizer(f.players, f.positions, f.budget,
+                                 f.flex_positions)
+        optimizer.set_max_players_from_same_team(2)
+        optimizer.ignore_players(['player_5'])
+        optimizer.update_projections({'p3': 50})
+        constraints = dict(optimizer.model.constraints)
+        best = optimizer.optimize()
+
+        solve_spec(optimizer, {LineupSpec.MAX_PLAYERS_FROM_SAME_TEAM: 3,
+                               LineupSpec.PROJECTIONS: {'p3': 0, 'p6': 100},
+                               LineupSpec.IGNORE_PLAYERS: ['player_5',
+                                                           'player_2']})
+        # pulp constraints compare as expressions, so compare identities
+        self.assertSetEqual(set(constraints),
+                            set(optimizer.model.constraints))
+        for name, constraint in constraints.items():
+            self.assertIs(constraint, optimizer.model.constraints[name],
+                          msg=name)
+        self.assertDictEqual(best, optimizer.optimize())
+        self.assertIn('p3', best[DfsOptimizer.LINEUP_PLAYERS])
+
+
+if __name__ == '__main__':
+    unittest.main()
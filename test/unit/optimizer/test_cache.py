@@ -0,0 +1,90 @@
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from test.unit.fixtures import OptimizerFixture
+from fantasyopt.optimizer.cache import SolutionCache
+from fantasyopt.optimizer.dfs import DfsOptimizer
+
+
+class TestSolutionCache(unittest.TestCase):
+    def setUp(self):
+        self.fixture = OptimizerFixture()
+
+    def optimizer(self, solution_cache):
+        f = self.fixture
+        return DfsOptimizer(f.players, f.positions, f.budget,
+                            f.flex_positions, f.utility_requirement,
+                            solution_cache=solution_cache)
+
+    def test_fingerprint_is_canonical(self):
+        first = self.optimizer(None)
+        second = self.optimizer(None)
+        self.assertEqual(first.fingerprint(), second.fingerprint())
+
+        first.ignore_player('player_2')
+        first.avoid_opponent('team_3')
+        self.assertNotEqual(first.fingerprint(), second.fingerprint())
+        second.avoid_opponent('team_3')
+        second.ignore_player('player_2')
+        self.assertEqual(first.fingerprint(), second.fingerprint())
+
+        second.update_projections({'p1': 26})
+        self.assertNotEqual(first.fingerprint(), second.fingerprint())
+        second.update_projections({'p1': 25})
+        self.assertEqual(first.fingerprint(), second.fingerprint())
+
+        second.update_salaries({'p1': 4})
+        self.assertNotEqual(first.fingerprint(), second.fingerprint())
+
+    def test_optimize_uses_cache(self):
+        cache = SolutionCache()
+        result = self.optimizer(cache).optimize()
+        self.assertEqual(1, len(cache))
+
+        optimizer = self.optimizer(cache)
+        with patch.object(optimizer.solver, 'solve') as mock_solve:
+            cached = optimizer.optimize()
+            mock_solve.assert_not_called()
+        self.assertDictEqual(result, cached)
+
+        cached[DfsOptimizer.LINEUP_PLAYERS].clear()
+        self.assertDictEqual(result, optimizer.optimize())
+
+        optimizer.update_projections({'p6': 100})
+        self.assertNotEqual(result, optimizer.optimize())
+        self.assertEqual(2, len(cache))
+
+    def test_optimize_caches_only_optimal(self):
+        cache = SolutionCache()
+        optimizer = self.optimizer(cache)
+        optimizer.optimize(mip_gap=0.1)
+        self.assertEqual(0, len(cache))
+
+        result = optimizer.optimize(time_limit=60)
+        self.assertEqual(1, len(cache))
+        with patch.object(optimizer.solver, 'solve') as mock_solve:
+            self.assertDictEqual(result, optimizer.optimize(time_limit=60))
+            mock_solve.assert_not_called()
+
+    def test_lru_eviction(self):
+        cache = SolutionCache(max_size=2)
+        cache.put('a', {'players': {'p1'}})
+        cache.put('b', {'players': {'p2'}})
+        cache.get('a')
+        cache.put('c', {'players': {'p3'}})
+        self.assertEqual(2, len(cache))
+        self.assertIsNone(cache.get('b'))
+        self.assertDictEqual({'players': {'p1'}}, cache.get('a'))
+
+    def test_disk_store(self):
+        with tempfile.TemporaryDirectory() as directory:
+            result = self.optimizer(SolutionCache(directory=directory)) \
+                .optimize()
+
+            cache = SolutionCache(directory=directory)
+            optimizer = self.optimizer(cache)
+            with patch.object(optimizer.solver, 'solve') as mock_solve:
+                self.assertDictEqual(result, optimizer.optimize())
+                mock_solve.assert_not_called()
+            self.assertEqual(1, len(cache))
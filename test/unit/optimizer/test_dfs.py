@@ -1,147 +1,34 @@
+import datetime
 import unittest
 from copy import deepcopy
+from unittest.mock import patch
 
 import pulp
 
+from benchmarks.pools import NFL_TEAMS, make_players
+from test.unit.fixtures import OptimizerFixture
+from fantasyopt import SITE_DEFAULTS, Site
 from fantasyopt.optimizer.dfs import DfsOptimizer
 from fantasyopt.optimizer.exceptions import OptimizerException
+from fantasyopt.optimizer.solvers import STATUS_FEASIBLE
 from fantasyopt.player import Player
+from fantasyopt.pool import PlayerPool
 
 
 class TestDfsOptimizer(unittest.TestCase):
-    POS_ONLY = 'positions_only'
-    W_FLEX = 'with_flex'
-    W_UTILITY = 'with_utility'
-    W_FLEX_W_UTILITY = 'with_flex_with_utility'
+    POS_ONLY = OptimizerFixture.POS_ONLY
+    W_FLEX = OptimizerFixture.W_FLEX
+    W_UTILITY = OptimizerFixture.W_UTILITY
+    W_FLEX_W_UTILITY = OptimizerFixture.W_FLEX_W_UTILITY
 
     def setUp(self):
-        self.players = {
-            'p1': {
-                Player.NAME: 'player_1',
-                Player.POINTS_PROJECTION: 25,
-                Player.POSITION: 'position_1',
-                Player.SALARY: 3,
-                Player.TEAM: 'team_1',
-                Player.OPPONENT: 'team_4',
-                Player.INJURY_STATUS: 'I',
-                Player.GAME_TIME: '1'
-            },
-            'p2': {
-                Player.NAME: 'player_2',
-                Player.POINTS_PROJECTION: 30,
-                Player.POSITION: 'position_1',
-                Player.SALARY: 15,
-                Player.TEAM: 'team_2',
-                Player.OPPONENT: 'team_3',
-                Player.INJURY_STATUS: 'H',
-                Player.GAME_TIME: '2'
-            },
-            'p3': {
-                Player.NAME: 'player_3',
-                Player.POINTS_PROJECTION: 4,
-                Player.POSITION: 'position_2',
-                Player.SALARY: 5,
-                Player.TEAM: 'team_3',
-                Player.OPPONENT: 'team_2',
-                Player.INJURY_STATUS: 'G',
-                Player.GAME_TIME: '2'
-            },
-            'p4': {
-                Player.NAME: 'player_4',
-                Player.POINTS_PROJECTION: 2,
-                Player.POSITION: 'position_2',
-                Player.SALARY: 2,
-                Player.TEAM: 'team_4',
-                Player.OPPONENT: 'team_1',
-                Player.INJURY_STATUS: 'F',
-                Player.GAME_TIME: '1'
-            },
-            'p5': {
-                Player.NAME: 'player_5',
-                Player.POINTS_PROJECTION: 30,
-                Player.POSITION: 'position_3',
-                Player.SALARY: 9,
-                Player.TEAM: 'team_1',
-                Player.OPPONENT: 'team_4',
-                Player.INJURY_STATUS: 'E',
-                Player.GAME_TIME: '1'
-            },
-            'p6': {
-                Player.NAME: 'player_6',
-                Player.POINTS_PROJECTION: 1,
-                Player.POSITION: 'position_3',
-                Player.SALARY: 8,
-                Player.TEAM: 'team_2',
-                Player.OPPONENT: 'team_3',
-                Player.INJURY_STATUS: 'D',
-                Player.GAME_TIME: '2'
-            },
-            'p7': {
-                Player.NAME: 'player_7',
-                Player.POINTS_PROJECTION: 25,
-                Player.POSITION: 'position_4',
-                Player.SALARY: 1,
-                Player.TEAM: 'team_3',
-                Player.OPPONENT: 'team_2',
-                Player.INJURY_STATUS: 'C',
-                Player.GAME_TIME: '2'
-            },
-            'p8': {
-                Player.NAME: 'player_8',
-                Player.POINTS_PROJECTION: 25,
-                Player.POSITION: 'position_4',
-                Player.SALARY: 2,
-                Player.TEAM: 'team_4',
-                Player.OPPONENT: 'team_1',
-                Player.INJURY_STATUS: 'B',
-                Player.GAME_TIME: '1'
-            },
-            'p9': {
-                Player.NAME: 'player_9',
-                Player.POINTS_PROJECTION: 3,
-                Player.POSITION: 'position_5',
-                Player.SALARY: 5,
-                Player.TEAM: 'team_1',
-                Player.OPPONENT: 'team_4',
-                Player.INJURY_STATUS: 'A',
-                Player.GAME_TIME: '1'
-            }
-        }
-
-        self.positions = {
-            'position_1': 1,
-            'position_2': 1,
-            'position_3': 1,
-            'position_4': 1,
-            'position_5': 1
-        }
-
-        self.budget = 35
-
-        self.flex_positions = {
-            '1_2': ({'position_1', 'position_2'}, 1),
-            '3_4': ({'position_3', 'position_4'}, 1),
-        }
-
-        self.utility_requirement = 1
-
-        self.optimizers = {
-            self.POS_ONLY: DfsOptimizer(self.players,
-                                        self.positions,
-                                        self.budget),
-            self.W_FLEX: DfsOptimizer(self.players, self.positions,
-                                      self.budget,
-                                      flex_positions=self.flex_positions),
-            self.W_UTILITY: DfsOptimizer(self.players, self.positions,
-                                         self.budget, utility_requirement=
-                                         self.utility_requirement),
-            self.W_FLEX_W_UTILITY: DfsOptimizer(self.players, self.positions,
-                                                self.budget,
-                                                flex_positions=
-                                                self.flex_positions,
-                                                utility_requirement=
-                                                self.utility_requirement),
-        }
+        fixture = OptimizerFixture()
+        self.players = fixture.players
+        self.positions = fixture.positions
+        self.budget = fixture.budget
+        self.flex_positions = fixture.flex_positions
+        self.utility_requirement = fixture.utility_requirement
+        self.optimizers = fixture.optimizers
 
     def test_player_missing_attributes_exception(self):
         for flex, util in [(None, 0), (None, self.utility_requirement),
@@ -400,6 +287,20 @@ class TestDfsOptimizer(unittest.TestCase):
 
         self.assertDictEqual(correct, result)
 
+    def test_optimize_player_pool(self):
+        pool = PlayerPool.from_dict(self.players)
+        for flex, util, key in [(None, 0, self.POS_ONLY),
+                                (self.flex_positions, 0, self.W_FLEX),
+                                (None, self.utility_requirement,
+                                 self.W_UTILITY),
+                                (self.flex_positions, self.utility_requirement,
+                                 self.W_FLEX_W_UTILITY)]:
+            optimizer = DfsOptimizer(pool, self.positions, self.budget,
+                                     flex, util)
+            self.assertIs(pool, optimizer.players)
+            self.assertDictEqual(self.optimizers[key].optimize(),
+                                 optimizer.optimize())
+
     def test_optimize_flex_and_utility(self):
         result = self.optimizers[self.W_FLEX_W_UTILITY].optimize()
 
@@ -416,6 +317,98 @@ class TestDfsOptimizer(unittest.TestCase):
 
         self.assertDictEqual(correct, result)
 
+    def test_optimize_lineup(self):
+        for name, optimizer in self.optimizers.items():
+            result = optimizer.optimize()
+            lineup = optimizer.optimize_lineup()
+            self.assertDictEqual(result, lineup.to_result(),
+                                 msg=name + ' failed')
+            self.assertSetEqual(result[DfsOptimizer.LINEUP_PLAYERS],
+                                set(lineup), msg=name + ' failed')
+
+            positions = {}
+            for p in lineup:
+                positions.setdefault(self.players[p][Player.POSITION],
+                                     set()).add(p)
+            self.assertDictEqual(positions,
+                                 {pos: set(players) for pos, players in
+                                  lineup.positions.items()},
+                                 msg=name + ' failed')
+
+    def test_optimize_solution_tolerance(self):
+        optimizer = self.optimizers[self.POS_ONLY]
+        lineup = {'p9', 'p7', 'p3', 'p2', 'p5'}
+        solve = optimizer.solver.solve
+
+        def inexact_solve(model):
+            solve(model)
+            for var in model.variables():
+                var.varValue = 1 - 1e-7 if var.varValue > 0.5 else 1e-9
+
+        optimizer.solver.solve = inexact_solve
+        result = optimizer.optimize()
+        self.assertSetEqual(lineup, result[DfsOptimizer.LINEUP_PLAYERS])
+        self.assertEqual(35, result[DfsOptimizer.LINEUP_SALARY])
+        self.assertEqual(92, result[DfsOptimizer.LINEUP_POINTS])
+
+    def test_optimize_anytime(self):
+        optimizer = self.optimizers[self.POS_ONLY]
+        result = optimizer.optimize(time_limit=60)
+        self.assertEqual(pulp.LpStatusOptimal,
+                         result[DfsOptimizer.IP_STATUS])
+        self.assertEqual(92, result[DfsOptimizer.LINEUP_BOUND])
+        self.assertEqual(0, result[DfsOptimizer.LINEUP_GAP])
+        self.assertNotIn(DfsOptimizer.LINEUP_BOUND, optimizer.optimize())
+
+        solve = optimizer.solver.solve
+
+        def stopped_solve(model, **kwargs):
+            # stop with the optimal lineup as if it were not proven optimal
+            solve(model, **kwargs)
+            model.status = STATUS_FEASIBLE
+            optimizer.solver.bound = 115
+
+        optimizer.solver.solve = stopped_solve
+        result = optimizer.optimize(time_limit=1, mip_gap=0.01)
+        self.assertEqual(STATUS_FEASIBLE, result[DfsOptimizer.IP_STATUS])
+        self.assertSetEqual({'p9', 'p7', 'p3', 'p2', 'p5'},
+                            result[DfsOptimizer.LINEUP_PLAYERS])
+        self.assertEqual(115, result[DfsOptimizer.LINEUP_BOUND])
+        self.assertAlmostEqual(0.25, result[DfsOptimizer.LINEUP_GAP])
+
+        self.assertRaises(OptimizerException, optimizer.optimize)
+
+    def test_optimize_initial_lineup(self):
+        optimizer = self.optimizers[self.POS_ONLY]
+        lineup = {'p9', 'p7', 'p3', 'p2', 'p5'}
+        solve = optimizer.solver.solve
+        starts = []
+
+        def recording_solve(model, **kwargs):
+            starts.append((kwargs.get('warm_start', False),
+                           {var.name: var.varValue
+                            for var in model.variables()}))
+            return solve(model, **kwargs)
+
+        optimizer.solver.solve = recording_solve
+        for initial_lineup in [lineup, {'p1', 'p4', 'p6', 'p7', 'p9'},
+                               {'p1', 'p2', 'p3', 'p4', 'p5', 'p6'}]:
+            result = optimizer.optimize(initial_lineup=initial_lineup)
+            self.assertSetEqual(lineup, result[DfsOptimizer.LINEUP_PLAYERS])
+            warm_start, values = starts[-1]
+            self.assertTrue(warm_start)
+            self.assertDictEqual({p: 1 if p in initial_lineup else 0
+                                  for p in self.players}, values)
+
+        optimizer.optimize(initial_lineup=['p1', 'p2'], partial_start=True)
+        self.assertDictEqual({p: 1 if p in {'p1', 'p2'} else None
+                              for p in self.players}, starts[-1][1])
+
+        optimizer.optimize()
+        self.assertFalse(starts[-1][0])
+        self.assertRaises(ValueError, optimizer.optimize,
+                          initial_lineup=['p10'])
+
     def test_infeasible_result(self):
         optimizer = DfsOptimizer({'p1': self.players['p1']},
                                  self.positions, 10)
@@ -666,5 +659,429 @@ class TestDfsOptimizer(unittest.TestCase):
                 self.test_all_constraints_are_valid()
 
 
+    def test_generate_lineups(self):
+        for name, optimizer in self.optimizers.items():
+            best = optimizer.optimize()
+            lineups = list(optimizer.generate_lineups(3))
+            # the budget only allows a single lineup with flex and utility
+            self.assertLessEqual(1, len(lineups), msg=name + ' failed')
+            self.assertGreaterEqual(3, len(lineups), msg=name + ' failed')
+            if name == self.POS_ONLY:
+                self.assertEqual(3, len(lineups), msg=name + ' failed')
+
+            players = []
+            points = []
+            for lineup in lineups:
+                players.append({p[Player.NAME] for pos in lineup
+                                for p in lineup[pos]})
+                points.append(sum(p[Player.POINTS_PROJECTION]
+                                  for pos in lineup for p in lineup[pos]))
+
+            self.assertSetEqual({self.players[p][Player.NAME] for p in
+                                 best[DfsOptimizer.LINEUP_PLAYERS]},
+                                players[0], msg=name + ' failed')
+            self.assertEqual(best[DfsOptimizer.LINEUP_POINTS], points[0],
+                             msg=name + ' failed')
+            self.assertListEqual(sorted(points, reverse=True), points,
+                                 msg=name + ' failed')
+            for i in range(len(players)):
+                for j in range(i + 1, len(players)):
+                    self.assertNotEqual(players[i], players[j],
+                                        msg=name + ' failed')
+
+    def test_generate_portfolio(self):
+        optimizer = self.optimizers[self.POS_ONLY]
+        constraints = dict(optimizer.model.constraints)
+        lineups = [{p[Player.NAME] for pos in lineup for p in lineup[pos]}
+                   for lineup in optimizer.generate_lineups(3)]
+        for name in list(optimizer.model.constraints):
+            if name not in constraints:
+                del optimizer.model.constraints[name]
+
+        portfolio = optimizer.generate_portfolio(3)
+        self.assertEqual(3, len(portfolio))
+        self.assertListEqual(
+            [{self.players[p][Player.NAME] for p in lineup} for lineup in
+             portfolio],
+            lineups)
+        self.assertDictEqual(constraints, optimizer.model.constraints)
+
+        counts = {}
+        for lineup in portfolio:
+            for p in lineup:
+                counts[p] = counts.get(p, 0) + 1
+        self.assertDictEqual(counts, portfolio.counts)
+        self.assertDictEqual({p: c / 3 for p, c in counts.items()},
+                             portfolio.exposures)
+
+    def test_generate_portfolio_exposure(self):
+        optimizer = self.optimizers[self.POS_ONLY]
+        # p2 and p5 are in the best lineup
+        portfolio = optimizer.generate_portfolio(
+            3, max_exposure={'p2': 0.34}, min_exposure={'p6': 2 / 3})
+        self.assertEqual(3, len(portfolio))
+        self.assertEqual(1, portfolio.counts['p2'])
+        self.assertAlmostEqual(2 / 3, portfolio.exposures['p6'])
+        self.assertIn('p5', portfolio.lineups[0])
+        self.assertNotIn('p6', portfolio.lineups[0])
+
+        portfolio = optimizer.generate_portfolio(4, max_exposure=0.5)
+        self.assertLessEqual(1, len(portfolio))
+        for count in portfolio.counts.values():
+            self.assertLessEqual(count, 2)
+
+    def test_generate_portfolio_time_limit(self):
+        portfolio = self.optimizers[self.POS_ONLY].generate_portfolio(
+            3, time_limit=0)
+        self.assertEqual(0, len(portfolio))
+        self.assertDictEqual({}, portfolio.exposures)
+
+        # each solve takes one second of a fake clock, so the limit is
+        # reached after the fifth lineup
+        yahoo = SITE_DEFAULTS[Site.YAHOO]
+        optimizer = DfsOptimizer(
+            make_players(120, list(yahoo.NFL_POSITIONS), NFL_TEAMS),
+            yahoo.NFL_POSITIONS, yahoo.NFL_BUDGET, yahoo.NFL_FLEX_POSITIONS,
+            yahoo.NFL_UTILITY_POSITIONS)
+        clock = [0]
+        limits = []
+        solve = optimizer.solver.solve
+
+        def slow_solve(model, **kwargs):
+            limits.append(kwargs.get('time_limit'))
+            clock[0] += 1
+            return solve(model, **kwargs)
+
+        optimizer.solver.solve = slow_solve
+        with patch('fantasyopt.optimizer.dfs.time') as mock_time:
+            mock_time.perf_counter.side_effect = lambda: clock[0]
+            portfolio = optimizer.generate_portfolio(10, max_exposure=0.4,
+                                                     time_limit=4.5)
+        self.assertEqual(5, clock[0])
+        self.assertListEqual([4.5, 3.5, 2.5, 1.5, 0.5], limits)
+        self.assertEqual(5, len(portfolio))
+        for exposure in portfolio.exposures.values():
+            self.assertLessEqual(exposure, 0.4)
+
+        # a portfolio cut short before every exposure is within the limit
+        # is emptied
+        clock[0] = 0
+        with patch('fantasyopt.optimizer.dfs.time') as mock_time:
+            mock_time.perf_counter.side_effect = lambda: clock[0]
+            portfolio = optimizer.generate_portfolio(10, max_exposure=0.4,
+                                                     time_limit=1.5)
+        self.assertEqual(0, len(portfolio))
+        self.assertDictEqual({}, portfolio.counts)
+
+    def test_generate_portfolio_invalid(self):
+        optimizer = self.optimizers[self.POS_ONLY]
+        for kwargs in [{'max_exposure': 1.5}, {'max_exposure': {'p1': -1}},
+                       {'min_exposure': {'p10': 0.5}},
+                       {'max_exposure': {'p1': 0.2},
+                        'min_exposure': {'p1': 0.5}},
+                       {'min_unique_players': 0}]:
+            self.assertRaises(ValueError, optimizer.generate_portfolio, 3,
+                              **kwargs)
+
+    def test_generate_lineups_min_unique_players(self):
+        optimizer = self.optimizers[self.POS_ONLY]
+        lineups = [{p[Player.NAME] for pos in lineup for p in lineup[pos]}
+                   for lineup in optimizer.generate_lineups(
+                3, min_unique_players=2)]
+        self.assertEqual(3, len(lineups))
+        for i in range(len(lineups)):
+            for j in range(i + 1, len(lineups)):
+                self.assertGreaterEqual(len(lineups[i] - lineups[j]), 2)
+
+    def test_generate_lineups_exhausted(self):
+        optimizer = DfsOptimizer({p: self.players[p] for p in ['p1', 'p2']},
+                                 {'position_1': 1}, self.budget)
+        lineups = list(optimizer.generate_lineups(5))
+        self.assertEqual(2, len(lineups))
+
+        self.assertRaises(OptimizerException, list,
+                          optimizer.generate_lineups(1))
+
+    def test_generate_lineups_invalid_min_unique_players(self):
+        for name, optimizer in self.optimizers.items():
+            self.assertRaises(ValueError, list,
+                              optimizer.generate_lineups(2, 0))
+
+    def test_ignore_players(self):
+        for name, optimizer in self.optimizers.items():
+            optimizer.ignore_players(['player_1', ('player_2', 'position_1',
+                                                   None)])
+            model = optimizer.model
+            for player, constraint_name in [
+                ('p1', DfsOptimizer.IGNORE_PLAYER_PREFIX + 'player_1'),
+                ('p2', DfsOptimizer.IGNORE_PLAYER_PREFIX + 'player_2' +
+                 'position_1')
+            ]:
+                self.assertIn(constraint_name, model.constraints,
+                              msg=name + ' failed for ' + player)
+                constraint = model.constraints[constraint_name]
+                self.assertEqual(pulp.LpConstraintEQ, constraint.sense,
+                                 msg=name + ' failed for ' + player)
+                self.assertEqual(0, -constraint.constant,
+                                 msg=name + ' failed for ' + player)
+                self.assertSetEqual({player}, {var.name for var, coefficient
+                                               in constraint.items()},
+                                    msg=name + ' failed for ' + player)
+                del model.constraints[constraint_name]
+            self.test_all_constraints_are_valid()
+
+    def test_ignore_players_nonexistent(self):
+        for name, optimizer in self.optimizers.items():
+            self.assertRaises(RuntimeError, optimizer.ignore_players,
+                              ['player_1', 'player_10'])
+            self.test_all_constraints_are_valid()
+
+    def test_require_players(self):
+        for name, optimizer in self.optimizers.items():
+            optimizer.require_players([('player_1', None, 'team_1'),
+                                       'player_9'])
+            model = optimizer.model
+            for player, constraint_name in [
+                ('p1', DfsOptimizer.REQUIRE_PLAYER_PREFIX + 'player_1' +
+                 'team_1'),
+                ('p9', DfsOptimizer.REQUIRE_PLAYER_PREFIX + 'player_9')
+            ]:
+                self.assertIn(constraint_name, model.constraints,
+                              msg=name + ' failed for ' + player)
+                constraint = model.constraints[constraint_name]
+                self.assertEqual(pulp.LpConstraintEQ, constraint.sense,
+                                 msg=name + ' failed for ' + player)
+                self.assertEqual(1, -constraint.constant,
+                                 msg=name + ' failed for ' + player)
+                self.assertSetEqual({player}, {var.name for var, coefficient
+                                               in constraint.items()},
+                                    msg=name + ' failed for ' + player)
+                del model.constraints[constraint_name]
+            self.test_all_constraints_are_valid()
+
+    def test_require_players_nonexistent(self):
+        for name, optimizer in self.optimizers.items():
+            self.assertRaises(RuntimeError, optimizer.require_players,
+                              ['player_1', ('player_1', 'position_5', None)])
+            self.test_all_constraints_are_valid()
+
+    def test_ignore_teams_and_avoid_opponents(self):
+        for name, optimizer in self.optimizers.items():
+            teams = ['team_1', 'team_2']
+            for bulk, prefix, attr in [
+                (optimizer.ignore_teams, DfsOptimizer.IGNORE_PLAYER_PREFIX,
+                 Player.TEAM),
+                (optimizer.avoid_opponents,
+                 DfsOptimizer.AVOID_OPPONENT_PREFIX, Player.OPPONENT)
+            ]:
+                bulk(teams)
+                model = optimizer.model
+                for team in teams:
+                    constraint_name = prefix + team
+                    self.assertIn(constraint_name, model.constraints,
+                                  msg=name + ' failed for ' + team)
+                    constraint = model.constraints[constraint_name]
+                    self.assertEqual(pulp.LpConstraintEQ, constraint.sense,
+                                     msg=name + ' failed for ' + team)
+                    self.assertEqual(0, -constraint.constant,
+                                     msg=name + ' failed for ' + team)
+                    self.assertSetEqual(
+                        {i for i, p in self.players.items()
+                         if p[attr] == team},
+                        {var.name for var, coefficient in constraint.items()},
+                        msg=name + ' failed for ' + team)
+                    del model.constraints[constraint_name]
+                self.test_all_constraints_are_valid()
+
+                self.assertRaises(RuntimeError, bulk, ['team_1', 'team_5'])
+                self.test_all_constraints_are_valid()
+
+    def test_update_projections(self):
+        for name, optimizer in self.optimizers.items():
+            projections = {p: i for i, p in enumerate(self.players)}
+            optimizer.update_projections(list(projections.values()))
+            for var, coefficient in optimizer.model.objective.items():
+                self.assertEqual(projections[var.name], coefficient,
+                                 msg=name + ' failed')
+
+            optimizer.update_projections({'p1': 100, 'p2': -1})
+            projections.update({'p1': 100, 'p2': -1})
+            for var, coefficient in optimizer.model.objective.items():
+                self.assertEqual(projections[var.name], coefficient,
+                                 msg=name + ' failed')
+
+            result = optimizer.optimize()
+            self.assertIn('p1', result[DfsOptimizer.LINEUP_PLAYERS],
+                          msg=name + ' failed')
+            self.assertNotIn('p2', result[DfsOptimizer.LINEUP_PLAYERS],
+                             msg=name + ' failed')
+            self.assertEqual(
+                sum(projections[p] for p in
+                    result[DfsOptimizer.LINEUP_PLAYERS]),
+                result[DfsOptimizer.LINEUP_POINTS], msg=name + ' failed')
+
+            self.assertDictEqual(self.players, optimizer.players,
+                                 msg=name + ' failed')
+
+    def test_update_projections_invalid(self):
+        for name, optimizer in self.optimizers.items():
+            self.assertRaises(ValueError, optimizer.update_projections,
+                              {'p10': 1})
+            self.assertRaises(ValueError, optimizer.update_projections,
+                              [1, 2])
+
+    def test_update_salaries(self):
+        for name, optimizer in self.optimizers.items():
+            salaries = {p: self.players[p][Player.SALARY] for p in
+                        self.players}
+            salaries.update({'p2': 100, 'p7': 0})
+            optimizer.update_salaries({'p2': 100, 'p7': 0})
+            constraint = optimizer.model.constraints[
+                DfsOptimizer.LINEUP_SALARY]
+            for var, coefficient in constraint.items():
+                self.assertEqual(salaries[var.name], coefficient,
+                                 msg=name + ' failed')
+            self.assertEqual(self.budget, -constraint.constant,
+                             msg=name + ' failed')
+
+            result = optimizer.optimize()
+            self.assertNotIn('p2', result[DfsOptimizer.LINEUP_PLAYERS],
+                             msg=name + ' failed')
+            self.assertEqual(
+                sum(salaries[p] for p in result[DfsOptimizer.LINEUP_PLAYERS]),
+                result[DfsOptimizer.LINEUP_SALARY], msg=name + ' failed')
+
+            optimizer.update_salaries([1] * len(self.players))
+            for var, coefficient in constraint.items():
+                self.assertEqual(1, coefficient, msg=name + ' failed')
+
+            self.assertRaises(ValueError, optimizer.update_salaries,
+                              {'p10': 1})
+            self.assertRaises(ValueError, optimizer.update_salaries, [1])
+            self.assertDictEqual(self.players, optimizer.players,
+                                 msg=name + ' failed')
+
+    def test_late_swap(self):
+        for name, optimizer in self.optimizers.items():
+            lineup = optimizer.optimize()[DfsOptimizer.LINEUP_PLAYERS]
+            constraints = dict(optimizer.model.constraints)
+
+            # no game has started, so the lineup is re-optimized freely
+            self.assertSetEqual(lineup, optimizer.late_swap(
+                {'p1', 'p6'}, 0)[DfsOptimizer.LINEUP_PLAYERS],
+                msg=name + ' failed')
+            self.assertDictEqual(constraints, optimizer.model.constraints,
+                                 msg=name + ' failed')
+
+        # games at time 1 have started, so p1 and p9 are kept and p4, p5 and
+        # p8 are excluded; p2 and p5 would be chosen otherwise
+        optimizer = self.optimizers[self.POS_ONLY]
+        result = optimizer.late_swap({'p1', 'p4', 'p6', 'p7', 'p9'}, 1)
+        self.assertSetEqual({'p1', 'p4', 'p6', 'p7', 'p9'},
+                            result[DfsOptimizer.LINEUP_PLAYERS])
+
+        # p4 is not in this lineup, so p3 fills position_2
+        result = optimizer.late_swap({'p1', 'p6', 'p7', 'p9'}, 1)
+        self.assertSetEqual({'p1', 'p3', 'p6', 'p7', 'p9'},
+                            result[DfsOptimizer.LINEUP_PLAYERS])
+        self.assertEqual(22, result[DfsOptimizer.LINEUP_SALARY])
+        self.assertEqual(58, result[DfsOptimizer.LINEUP_POINTS])
+
+    def test_warm_started_paths(self):
+        optimizer = self.optimizers[self.POS_ONLY]
+        solve = optimizer.solver.solve
+        starts = []
+
+        def recording_solve(model, **kwargs):
+            if kwargs.get('warm_start', False):
+                starts.append({var.name for var in model.variables()
+                               if var.varValue == 1})
+            else:
+                starts.append(None)
+            return solve(model, **kwargs)
+
+        optimizer.solver.solve = recording_solve
+        lineups = [{p[Player.NAME] for pos in lineup for p in lineup[pos]}
+                   for lineup in optimizer.generate_lineups(3, 2)]
+        self.assertEqual(3, len(lineups))
+        # each solve after the first starts from the previous lineup without
+        # its two lowest projected players
+        self.assertIsNone(starts[0])
+        self.assertSetEqual({'p2', 'p5', 'p7'}, starts[1])
+        self.assertEqual(3, len(starts[2]))
+
+        del starts[:]
+        optimizer.late_swap({'p1', 'p4', 'p6', 'p7', 'p9'}, 1)
+        self.assertListEqual([{'p1', 'p4', 'p6', 'p7', 'p9'}], starts)
+
+        del starts[:]
+        optimizer = self.optimizers[self.W_FLEX]
+        optimizer.solver.solve = recording_solve
+        portfolio = optimizer.generate_portfolio(2)
+        self.assertEqual(2, len(portfolio))
+        self.assertIsNone(starts[0])
+        self.assertSetEqual(set(portfolio.lineups[0].player_ids) - {'p4'},
+                            starts[1])
+
+    def test_late_swap_weekdays(self):
+        for p, game_time in [('p1', 'Thu 8:20PM EST'), ('p9', 'Thu 8:20PM EST'),
+                             ('p4', 'Sun 1:00PM EST'), ('p5', 'Sun 1:00PM EST'),
+                             ('p8', 'Sun 1:00PM EST')]:
+            self.players[p][Player.GAME_TIME] = game_time
+        for p in ['p2', 'p3', 'p6', 'p7']:
+            self.players[p][Player.GAME_TIME] = 'Mon 8:15PM EST'
+        optimizer = DfsOptimizer(self.players, self.positions, self.budget)
+
+        # on Sunday evening, the Thursday and Sunday games have started
+        result = optimizer.late_swap({'p1', 'p6', 'p7', 'p9'},
+                                     datetime.datetime(2020, 9, 13, 18),
+                                     datetime.date(2020, 9, 10))
+        self.assertSetEqual({'p1', 'p3', 'p6', 'p7', 'p9'},
+                            result[DfsOptimizer.LINEUP_PLAYERS])
+        self.assertRaises(ValueError, optimizer.late_swap,
+                          {'p1', 'p6', 'p7', 'p9'},
+                          datetime.datetime(2020, 9, 13, 18))
+
+    def test_late_swap_invalid(self):
+        optimizer = self.optimizers[self.POS_ONLY]
+        self.assertRaises(ValueError, optimizer.late_swap, {'p10'}, 1)
+        self.assertRaises(ValueError, optimizer.late_swap, {'p1'},
+                          datetime.datetime(2020, 1, 1))
+
+        # p1 and p2 are the only players at position_1
+        self.assertRaises(OptimizerException, optimizer.late_swap,
+                          {'p1', 'p2'}, 2)
+
+    def test_parse_game_time(self):
+        # a Thursday to Monday slate, late swapped on Sunday
+        now = datetime.datetime(2020, 9, 13, 12, 30)
+        thursday = datetime.date(2020, 9, 10)
+        self.assertEqual(datetime.datetime(2020, 9, 10, 13),
+                         DfsOptimizer.parse_game_time('1:00PM EST', now,
+                                                      thursday))
+        self.assertEqual(datetime.datetime(2020, 9, 10, 20, 20),
+                         DfsOptimizer.parse_game_time('Thu 8:20PM EST', now,
+                                                      thursday))
+        self.assertEqual(datetime.datetime(2020, 9, 13, 0, 5),
+                         DfsOptimizer.parse_game_time('Sun 12:05am', now,
+                                                      thursday))
+        self.assertEqual(datetime.datetime(2020, 9, 14, 20, 15),
+                         DfsOptimizer.parse_game_time(
+                             'Monday 8:15PM EST', now,
+                             datetime.datetime(2020, 9, 10, 20, 20)))
+        self.assertRaises(ValueError, DfsOptimizer.parse_game_time,
+                          'Thu 8:20PM EST', now)
+        self.assertRaises(ValueError, DfsOptimizer.parse_game_time,
+                          '1:00PM EST', now)
+        self.assertEqual(datetime.datetime(2020, 9, 14, 20, 15),
+                         DfsOptimizer.parse_game_time('2020-09-14T20:15',
+                                                      now))
+        self.assertEqual(now, DfsOptimizer.parse_game_time(now, now))
+        self.assertEqual(2, DfsOptimizer.parse_game_time('2', 1))
+        self.assertRaises(ValueError, DfsOptimizer.parse_game_time, 'TBD', now)
+        self.assertRaises(ValueError, DfsOptimizer.parse_game_time,
+                          '1:00PM EST', 1)
+
+
 if __name__ == '__main__':
     unittest.main()
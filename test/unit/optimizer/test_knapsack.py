@@ -0,0 +1,89 @@
+import unittest
+
+from benchmarks.pools import NBA_TEAMS, NFL_TEAMS, make_players
+from test.unit.fixtures import OptimizerFixture
+from fantasyopt import SITE_DEFAULTS, Site
+from fantasyopt.optimizer.dfs import DfsOptimizer
+from fantasyopt.optimizer.exceptions import OptimizerException
+from fantasyopt.optimizer.knapsack import KnapsackOptimizer
+from fantasyopt.player import Player
+
+
+class TestKnapsackOptimizer(unittest.TestCase):
+    def setUp(self):
+        self.fixture = OptimizerFixture()
+        self.optimizers = self.fixture.make_optimizers(KnapsackOptimizer)
+
+    def test_player_missing_attributes_exception(self):
+        f = self.fixture
+        for attr in [Player.NAME, Player.POINTS_PROJECTION, Player.SALARY,
+                     Player.POSITION]:
+            players = {'p1': dict(f.players['p1'])}
+            del players['p1'][attr]
+            self.assertRaises(ValueError, KnapsackOptimizer, players,
+                              f.positions, f.budget)
+
+    def test_non_integer_salary_exception(self):
+        f = self.fixture
+        players = {'p1': dict(f.players['p1'])}
+        players['p1'][Player.SALARY] = 1.5
+        self.assertRaises(ValueError, KnapsackOptimizer, players, f.positions,
+                          f.budget)
+        self.assertRaises(ValueError, KnapsackOptimizer, f.players,
+                          f.positions, 10.5)
+
+    def test_candidates_undominated(self):
+        # p8 costs more than p7 for the same projection
+        self.assertListEqual(
+            ['p7'], self.optimizers[self.fixture.POS_ONLY].candidates[
+                'position_4'])
+        self.assertCountEqual(
+            ['p7', 'p8'], self.optimizers[self.fixture.W_FLEX].candidates[
+                'position_4'])
+
+    def test_optimize_equivalent_to_ip(self):
+        for name, optimizer in self.optimizers.items():
+            self.assertDictEqual(self.fixture.optimizers[name].optimize(),
+                                 optimizer.optimize(), msg=name + ' failed')
+
+    def test_optimize_equivalent_to_ip_yahoo(self):
+        yahoo = SITE_DEFAULTS[Site.YAHOO]
+        for positions, budget, flex, utility, teams in [
+            (yahoo.NFL_POSITIONS, yahoo.NFL_BUDGET, yahoo.NFL_FLEX_POSITIONS,
+             yahoo.NFL_UTILITY_POSITIONS, NFL_TEAMS),
+            (yahoo.NBA_POSITIONS, yahoo.NBA_BUDGET, yahoo.NBA_FLEX_POSITIONS,
+             yahoo.NBA_UTILITY_POSITIONS, NBA_TEAMS)
+        ]:
+            for seed in range(3):
+                players = make_players(60, list(positions), teams, seed)
+                expected = DfsOptimizer(players, positions, budget, flex,
+                                        utility).optimize()
+                result = KnapsackOptimizer(players, positions, budget, flex,
+                                           utility).optimize()
+
+                msg = str(list(positions)) + ' failed for ' + str(seed)
+                self.assertAlmostEqual(expected[DfsOptimizer.LINEUP_POINTS],
+                                       result[DfsOptimizer.LINEUP_POINTS],
+                                       msg=msg)
+                self.assertEqual(
+                    len(expected[DfsOptimizer.LINEUP_PLAYERS]),
+                    len(result[DfsOptimizer.LINEUP_PLAYERS]), msg=msg)
+                self.assertLessEqual(result[DfsOptimizer.LINEUP_SALARY],
+                                     budget, msg=msg)
+                self.assertEqual(
+                    result[DfsOptimizer.LINEUP_SALARY],
+                    sum(players[p][Player.SALARY] for p in
+                        result[DfsOptimizer.LINEUP_PLAYERS]), msg=msg)
+
+    def test_infeasible_result(self):
+        f = self.fixture
+        optimizer = KnapsackOptimizer({'p1': f.players['p1']}, f.positions,
+                                      10)
+        self.assertRaises(OptimizerException, optimizer.optimize)
+
+        optimizer = KnapsackOptimizer(f.players, f.positions, 5)
+        self.assertRaises(OptimizerException, optimizer.optimize)
+
+
+if __name__ == '__main__':
+    unittest.main()
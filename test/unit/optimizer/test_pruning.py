@@ -0,0 +1,102 @@
+import unittest
+
+from benchmarks.pools import NBA_TEAMS, NFL_TEAMS, make_players
+from test.unit.fixtures import OptimizerFixture
+from fantasyopt import SITE_DEFAULTS, Site
+from fantasyopt.optimizer.dfs import DfsOptimizer
+from fantasyopt.optimizer.pruning import position_capacity, \
+    prune_dominated_players, undominated_players
+from fantasyopt.player import Player
+
+
+class TestPruning(unittest.TestCase):
+    def setUp(self):
+        self.fixture = OptimizerFixture()
+
+    def test_position_capacity(self):
+        f = self.fixture
+        self.assertDictEqual(f.positions, position_capacity(f.positions))
+        self.assertDictEqual({'position_1': 2, 'position_2': 2,
+                              'position_3': 2, 'position_4': 2,
+                              'position_5': 1},
+                             position_capacity(f.positions, f.flex_positions))
+        self.assertDictEqual({'position_1': 3, 'position_2': 3,
+                              'position_3': 3, 'position_4': 3,
+                              'position_5': 2},
+                             position_capacity(f.positions, f.flex_positions,
+                                               1))
+
+    def test_undominated_players(self):
+        players = {
+            'cheap': {Player.SALARY: 1, Player.POINTS_PROJECTION: 10},
+            'same': {Player.SALARY: 1, Player.POINTS_PROJECTION: 10},
+            'worse': {Player.SALARY: 2, Player.POINTS_PROJECTION: 5},
+            'better': {Player.SALARY: 3, Player.POINTS_PROJECTION: 20}
+        }
+        self.assertCountEqual(['cheap', 'better'],
+                              undominated_players(players, list(players), 1))
+        self.assertCountEqual(['cheap', 'same', 'better'],
+                              undominated_players(players, list(players), 2))
+        self.assertCountEqual(list(players),
+                              undominated_players(players, list(players), 3))
+        self.assertCountEqual(list(players),
+                              undominated_players(players, list(players), 1,
+                                                  {'better'}))
+
+    def test_prune_dominated_players(self):
+        f = self.fixture
+        players, removed = prune_dominated_players(f.players, f.positions)
+        # p8 costs more than p7 for the same points
+        self.assertEqual(1, removed)
+        self.assertCountEqual(['p1', 'p2', 'p3', 'p4', 'p5', 'p6', 'p7',
+                               'p9'], players)
+
+        players, removed = prune_dominated_players(f.players, f.positions,
+                                                   f.flex_positions, 1)
+        self.assertEqual(0, removed)
+        self.assertDictEqual(f.players, players)
+
+    def test_prune_required_and_ignored_players(self):
+        f = self.fixture
+        for kwargs in [{'required_players': ['player_8']},
+                       {'ignored_players': ['player_8']},
+                       {'ignored_players': ['player_7']},
+                       {'ignored_teams': ['team_3']},
+                       {'avoided_opponents': ['team_2']}]:
+            players, removed = prune_dominated_players(f.players, f.positions,
+                                                       **kwargs)
+            self.assertEqual(0, removed, msg=str(kwargs))
+            self.assertDictEqual(f.players, players, msg=str(kwargs))
+
+        players, removed = prune_dominated_players(
+            f.players, f.positions, ignored_players=['player_1'])
+        self.assertEqual(1, removed)
+        self.assertNotIn('p8', players)
+
+    def test_prune_preserves_optimum(self):
+        yahoo = SITE_DEFAULTS[Site.YAHOO]
+        for positions, budget, flex, utility, teams in [
+            (yahoo.NFL_POSITIONS, yahoo.NFL_BUDGET, yahoo.NFL_FLEX_POSITIONS,
+             yahoo.NFL_UTILITY_POSITIONS, NFL_TEAMS),
+            (yahoo.NBA_POSITIONS, yahoo.NBA_BUDGET, yahoo.NBA_FLEX_POSITIONS,
+             yahoo.NBA_UTILITY_POSITIONS, NBA_TEAMS)
+        ]:
+            for seed in range(3):
+                players = make_players(200, list(positions), teams, seed)
+                pruned, removed = prune_dominated_players(players, positions,
+                                                          flex, utility)
+                msg = str(list(positions)) + ' failed for ' + str(seed)
+                self.assertEqual(len(players) - len(pruned), removed, msg=msg)
+                self.assertGreater(removed, 0, msg=msg)
+
+                expected = DfsOptimizer(players, positions, budget, flex,
+                                        utility).optimize()
+                result = DfsOptimizer(pruned, positions, budget, flex,
+                                      utility).optimize()
+                self.assertAlmostEqual(expected[DfsOptimizer.LINEUP_POINTS],
+                                       result[DfsOptimizer.LINEUP_POINTS],
+                                       msg=msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import unittest
+
+import numpy as np
+
+from test.unit.fixtures import OptimizerFixture
+from fantasyopt.optimizer.dfs import DfsOptimizer
+from fantasyopt.optimizer.simulation import lineup_frequencies, \
+    simulate_projections
+from fantasyopt.player import Player
+
+
+class TestSimulation(unittest.TestCase):
+    def setUp(self):
+        self.fixture = OptimizerFixture()
+        self.players = self.fixture.players
+        self.projections = np.array([p[Player.POINTS_PROJECTION] for p in
+                                     self.players.values()], dtype=float)
+
+    def test_simulate_projections_shape_and_mean(self):
+        outcomes = simulate_projections(self.players, 20000, seed=0)
+        self.assertEqual((20000, len(self.players)), outcomes.shape)
+        np.testing.assert_allclose(self.projections, outcomes.mean(axis=0),
+                                   atol=0.2)
+        np.testing.assert_allclose(0.25 * self.projections,
+                                   outcomes.std(axis=0), rtol=0.05)
+
+    def test_simulate_projections_std(self):
+        outcomes = simulate_projections(self.players, 20000, std={'p1': 10},
+                                        relative_std=0, seed=0)
+        deviations = outcomes.std(axis=0)
+        self.assertAlmostEqual(10, deviations[0], delta=0.3)
+        np.testing.assert_array_equal(np.zeros(len(self.players) - 1),
+                                      deviations[1:])
+
+    def test_simulate_projections_correlation(self):
+        outcomes = simulate_projections(self.players, 50000,
+                                        team_correlation=0.4,
+                                        opponent_correlation=-0.2, seed=0)
+        correlation = np.corrcoef(outcomes.T)
+        ids = list(self.players)
+        for i, p in enumerate(ids):
+            for j, q in enumerate(ids):
+                if i == j:
+                    continue
+                expected = 0
+                if self.players[p][Player.TEAM] == self.players[q][Player.TEAM]:
+                    expected = 0.4
+                elif self.players[p][Player.OPPONENT] == \
+                        self.players[q][Player.TEAM]:
+                    expected = -0.2
+                self.assertAlmostEqual(expected, correlation[i][j],
+                                       delta=0.03, msg=p + ', ' + q)
+
+    def test_simulate_projections_seed(self):
+        np.testing.assert_array_equal(
+            simulate_projections(self.players, 10, seed=3),
+            simulate_projections(self.players, 10, seed=3))
+
+    def test_simulate_projections_invalid_correlation(self):
+        for team, opponent in [(-0.1, 0), (1.1, 0), (0.1, 0.2), (0.1, -0.2)]:
+            self.assertRaises(ValueError, simulate_projections, self.players,
+                              10, team_correlation=team,
+                              opponent_correlation=opponent)
+
+    def test_lineup_frequencies(self):
+        optimizer = self.fixture.optimizers[self.fixture.W_FLEX]
+        best = optimizer.optimize()
+        outcomes = np.array([self.projections, self.projections])
+        outcomes[1][list(self.players).index('p6')] = 100
+
+        frequencies = lineup_frequencies(optimizer, outcomes)
+        self.assertEqual(1, frequencies['p9'])
+        self.assertEqual(0.5, frequencies['p6'])
+        self.assertAlmostEqual(
+            len(best[DfsOptimizer.LINEUP_PLAYERS]),
+            sum(frequencies.values()))
+
+        # projections are restored
+        self.assertDictEqual(best, optimizer.optimize())
+
+        self.assertRaises(ValueError, lineup_frequencies, optimizer,
+                          np.empty((0, len(self.players))))
+
+    def test_lineup_frequencies_keeps_updated_projections(self):
+        optimizer = self.fixture.optimizers[self.fixture.W_FLEX]
+        optimizer.update_projections({'p6': 100})
+        best = optimizer.optimize()
+        self.assertIn('p6', best[DfsOptimizer.LINEUP_PLAYERS])
+
+        lineup_frequencies(optimizer, np.array([self.projections]))
+        self.assertDictEqual(best, optimizer.optimize())
+
+
+if __name__ == '__main__':
+    unittest.main()
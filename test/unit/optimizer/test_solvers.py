@@ -0,0 +1,141 @@
+import unittest
+import warnings
+from unittest.mock import patch
+
+import numpy as np
+import pulp
+
+from test.unit.fixtures import OptimizerFixture
+from fantasyopt.optimizer import solvers
+from fantasyopt.optimizer.dfs import DfsOptimizer
+from fantasyopt.optimizer.exceptions import OptimizerException
+from fantasyopt.optimizer.solvers import CbcSolver, CpSatSolver, \
+    HighsSolver, MatrixModel, get_solver
+from fantasyopt.player import Player
+
+
+class TestSolvers(unittest.TestCase):
+    def setUp(self):
+        self.fixture = OptimizerFixture()
+
+        self.solvers = ['cbc']
+        if solvers.highspy is not None:
+            self.solvers.append('highs')
+        if solvers.cp_model is not None:
+            self.solvers.append('cp-sat')
+
+    def make_optimizers(self, solver):
+        return self.fixture.make_optimizers(solver=solver)
+
+    def test_get_solver(self):
+        self.assertIsInstance(get_solver(), CbcSolver)
+        self.assertIsInstance(get_solver('cbc'), CbcSolver)
+
+        solver = CbcSolver(msg=True)
+        self.assertIs(solver, get_solver(solver))
+
+        self.assertRaises(ValueError, get_solver, 'not_a_solver')
+
+    def test_get_solver_fallback(self):
+        with patch.object(solvers, 'highspy', None), \
+                patch.object(solvers, 'cp_model', None):
+            for name in ['highs', 'cp-sat']:
+                with warnings.catch_warnings(record=True) as caught:
+                    warnings.simplefilter('always')
+                    self.assertIsInstance(get_solver(name), CbcSolver)
+                    self.assertEqual(1, len(caught))
+
+            self.assertRaises(ImportError, HighsSolver)
+            self.assertRaises(ImportError, CpSatSolver)
+
+    def test_matrix_model(self):
+        model = self.fixture.optimizers[self.fixture.W_FLEX].model
+        matrix = MatrixModel(model)
+
+        self.assertTrue(matrix.maximize)
+        self.assertEqual(len(self.fixture.players), len(matrix.variables))
+        self.assertEqual(len(model.constraints), len(matrix.row_lower))
+        self.assertTrue(matrix.integer.all())
+
+        for var, cost in zip(matrix.variables, matrix.costs):
+            self.assertEqual(
+                self.fixture.players[var.name][
+                    Player.POINTS_PROJECTION], cost)
+
+        for (name, constraint), (indices, values, lower, upper) in \
+                zip(model.constraints.items(), matrix.rows()):
+            self.assertEqual(len(constraint), len(indices), msg=name)
+            if constraint.sense == pulp.LpConstraintLE:
+                self.assertEqual(-np.inf, lower, msg=name)
+                self.assertEqual(-constraint.constant, upper, msg=name)
+            elif constraint.sense == pulp.LpConstraintGE:
+                self.assertEqual(-constraint.constant, lower, msg=name)
+                self.assertEqual(np.inf, upper, msg=name)
+            else:
+                self.assertEqual(-constraint.constant, lower, msg=name)
+                self.assertEqual(-constraint.constant, upper, msg=name)
+
+    def test_solvers_agree(self):
+        expected = {name: optimizer.optimize() for name, optimizer in
+                    self.make_optimizers('cbc').items()}
+
+        for solver in self.solvers:
+            for name, optimizer in self.make_optimizers(solver).items():
+                result = optimizer.optimize()
+                msg = solver + ' failed for ' + name
+                self.assertEqual(pulp.LpStatusOptimal,
+                                 result[DfsOptimizer.IP_STATUS], msg=msg)
+                self.assertAlmostEqual(
+                    expected[name][DfsOptimizer.LINEUP_POINTS],
+                    result[DfsOptimizer.LINEUP_POINTS], msg=msg)
+                self.assertEqual(
+                    len(expected[name][DfsOptimizer.LINEUP_PLAYERS]),
+                    len(result[DfsOptimizer.LINEUP_PLAYERS]), msg=msg)
+                self.assertLessEqual(result[DfsOptimizer.LINEUP_SALARY],
+                                     self.fixture.budget, msg=msg)
+
+    def test_solvers_anytime(self):
+        for solver in self.solvers:
+            for name, optimizer in self.make_optimizers(solver).items():
+                result = optimizer.optimize(time_limit=60, mip_gap=0)
+                msg = solver + ' failed for ' + name
+                self.assertEqual(pulp.LpStatusOptimal,
+                                 result[DfsOptimizer.IP_STATUS], msg=msg)
+                self.assertAlmostEqual(result[DfsOptimizer.LINEUP_POINTS],
+                                       result[DfsOptimizer.LINEUP_BOUND],
+                                       msg=msg)
+                self.assertAlmostEqual(0, result[DfsOptimizer.LINEUP_GAP],
+                                       msg=msg)
+
+    def test_solvers_warm_start(self):
+        expected = {name: optimizer.optimize() for name, optimizer in
+                    self.make_optimizers('cbc').items()}
+
+        for solver in self.solvers:
+            for name, optimizer in self.make_optimizers(solver).items():
+                best = expected[name][DfsOptimizer.LINEUP_PLAYERS]
+                # the best lineup, a lineup over budget and part of a lineup
+                for initial_lineup, partial_start in [
+                        (best, False), (self.fixture.players, False),
+                        (sorted(best)[:2], True)]:
+                    result = optimizer.optimize(initial_lineup=initial_lineup,
+                                                partial_start=partial_start)
+                    msg = solver + ' failed for ' + name
+                    self.assertEqual(pulp.LpStatusOptimal,
+                                     result[DfsOptimizer.IP_STATUS], msg=msg)
+                    self.assertAlmostEqual(
+                        expected[name][DfsOptimizer.LINEUP_POINTS],
+                        result[DfsOptimizer.LINEUP_POINTS], msg=msg)
+
+    def test_solvers_infeasible(self):
+        f = self.fixture
+        for solver in self.solvers:
+            optimizer = DfsOptimizer({'p1': f.players['p1']}, f.positions, 10,
+                                     solver=solver)
+            self.assertRaises(OptimizerException, optimizer.optimize)
+            self.assertRaises(OptimizerException, optimizer.optimize,
+                              time_limit=60)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,178 @@
+import unittest
+
+import numpy as np
+import pulp
+
+from test.unit.fixtures import OptimizerFixture
+from fantasyopt.optimizer import sparse
+from fantasyopt.optimizer.cache import SolutionCache
+from fantasyopt.optimizer.dfs import DfsOptimizer
+from fantasyopt.optimizer.exceptions import OptimizerException
+from fantasyopt.optimizer.solvers import CbcSolver
+from fantasyopt.optimizer.sparse import MilpSolver, SparseDfsOptimizer
+
+
+@unittest.skipIf(sparse.scipy is None, 'scipy is not installed')
+class TestSparseDfsOptimizer(unittest.TestCase):
+    def setUp(self):
+        self.fixture = OptimizerFixture()
+
+    def assert_agree(self, change):
+        """
+        Apply change to pulp and sparse optimizers and compare their results
+
+        :param change: function taking an optimizer
+        """
+        expected = self.fixture.make_optimizers(DfsOptimizer)
+        actual = self.fixture.make_optimizers(SparseDfsOptimizer)
+        for name in expected:
+            change(expected[name])
+            change(actual[name])
+            self.assertEqual(len(expected[name].model.constraints),
+                             len(actual[name].model.constraints), msg=name)
+            try:
+                result = expected[name].optimize()
+            except OptimizerException:
+                self.assertRaises(OptimizerException, actual[name].optimize)
+                continue
+            # lineups with equal points may differ between solvers
+            self.assert_equivalent(result, actual[name].optimize(), name)
+
+    def assert_equivalent(self, expected, actual, msg=None):
+        self.assertEqual(expected[DfsOptimizer.IP_STATUS],
+                         actual[DfsOptimizer.IP_STATUS], msg=msg)
+        self.assertAlmostEqual(expected[DfsOptimizer.LINEUP_POINTS],
+                               actual[DfsOptimizer.LINEUP_POINTS], msg=msg)
+        self.assertEqual(len(expected[DfsOptimizer.LINEUP_PLAYERS]),
+                         len(actual[DfsOptimizer.LINEUP_PLAYERS]), msg=msg)
+        self.assertLessEqual(actual[DfsOptimizer.LINEUP_SALARY],
+                             self.fixture.budget, msg=msg)
+
+    def test_optimize(self):
+        self.assert_agree(lambda o: None)
+
+    def test_constraints(self):
+        self.assert_agree(lambda o: o.ignore_player('player_2'))
+        self.assert_agree(lambda o: o.require_player('player_6'))
+        self.assert_agree(lambda o: o.ignore_team('team_3'))
+        self.assert_agree(lambda o: o.avoid_opponent('team_1'))
+        self.assert_agree(lambda o: o.set_max_players_from_same_team(2))
+
+    def test_update_coefficients(self):
+        self.assert_agree(lambda o: o.update_projections({'p6': 100}))
+        self.assert_agree(lambda o: o.update_projections(range(9)))
+        self.assert_agree(lambda o: o.update_salaries({'p2': 100, 'p7': 0}))
+
+    def test_generate_lineups(self):
+        f = self.fixture
+        expected = DfsOptimizer(f.players, f.positions, f.budget)
+        actual = SparseDfsOptimizer(f.players, f.positions, f.budget)
+        for lineup in expected.generate_lineups(3):
+            self.assertDictEqual(lineup, next(actual.generate_lineups(1)))
+
+        actual = SparseDfsOptimizer(f.players, f.positions, f.budget)
+        portfolio = actual.generate_portfolio(3, max_exposure={'p2': 0.34})
+        self.assertEqual(3, len(portfolio))
+        self.assertEqual(1, portfolio.counts['p2'])
+        self.assertSetEqual(
+            {'p1', 'p3', 'p6', 'p7', 'p9'},
+            actual.late_swap({'p1', 'p6', 'p7', 'p9'}, 1)[
+                DfsOptimizer.LINEUP_PLAYERS])
+
+    def test_matrix(self):
+        optimizer = self.fixture.make_optimizers(SparseDfsOptimizer)[
+            self.fixture.W_FLEX]
+        optimizer.update_salaries({'p1': 7})
+        matrix, lower, upper = optimizer.model.matrix()
+        self.assertEqual((len(optimizer.model.constraints),
+                          len(self.fixture.players)), matrix.shape)
+
+        rows = list(optimizer.model.constraints)
+        budget = matrix.getrow(rows.index(DfsOptimizer.LINEUP_SALARY))
+        self.assertEqual(7, budget[0, 0])
+        self.assertEqual(self.fixture.budget,
+                         upper[rows.index(DfsOptimizer.LINEUP_SALARY)])
+        self.assertTrue(np.all(np.isinf(lower[rows.index(
+            DfsOptimizer.LINEUP_SALARY)])))
+
+    def test_fingerprint(self):
+        first = self.fixture.make_optimizers(SparseDfsOptimizer)[
+            self.fixture.POS_ONLY]
+        second = self.fixture.make_optimizers(SparseDfsOptimizer)[
+            self.fixture.POS_ONLY]
+        self.assertEqual(first.fingerprint(), second.fingerprint())
+
+        first.ignore_players(['player_2', 'player_6'])
+        self.assertNotEqual(first.fingerprint(), second.fingerprint())
+        second.ignore_player('player_6')
+        second.ignore_player('player_2')
+        self.assertEqual(first.fingerprint(), second.fingerprint())
+
+        first.update_projections({'p3': 5})
+        second = SparseDfsOptimizer(
+            self.fixture.players, self.fixture.positions, self.fixture.budget,
+            solution_cache=SolutionCache())
+        second.ignore_players(['player_6', 'player_2'])
+        second.update_projections({'p3': 5})
+        self.assertEqual(first.fingerprint(), second.fingerprint())
+
+        second.optimize()
+        self.assertEqual(1, len(second.solution_cache))
+        self.assertDictEqual(second.optimize(), first.optimize())
+
+    def test_fingerprint_player_ids(self):
+        f = self.fixture
+        cache = SolutionCache()
+        first = SparseDfsOptimizer(f.players, f.positions, f.budget,
+                                   solution_cache=cache)
+        renamed = {'q' + p[1:]: attributes
+                   for p, attributes in f.players.items()}
+        second = SparseDfsOptimizer(renamed, f.positions, f.budget,
+                                    solution_cache=cache)
+        self.assertNotEqual(first.fingerprint(), second.fingerprint())
+
+        first.optimize()
+        result = second.optimize()
+        self.assertEqual(2, len(cache))
+        self.assertTrue(all(p.startswith('q') for p in
+                            result[DfsOptimizer.LINEUP_PLAYERS]))
+
+    def test_anytime(self):
+        expected = self.fixture.make_optimizers(DfsOptimizer)
+        actual = self.fixture.make_optimizers(SparseDfsOptimizer)
+        for name in expected:
+            result = actual[name].optimize(time_limit=60, mip_gap=0)
+            self.assert_equivalent(expected[name].optimize(), result, name)
+            self.assertAlmostEqual(result[DfsOptimizer.LINEUP_POINTS],
+                                   result[DfsOptimizer.LINEUP_BOUND],
+                                   msg=name)
+            self.assertAlmostEqual(0, result[DfsOptimizer.LINEUP_GAP],
+                                   msg=name)
+
+    def test_initial_lineup(self):
+        # MilpSolver ignores starting solutions
+        optimizers = self.fixture.make_optimizers(SparseDfsOptimizer)
+        for name, optimizer in optimizers.items():
+            result = optimizer.optimize()
+            self.assertDictEqual(result, optimizer.optimize(
+                initial_lineup=result[DfsOptimizer.LINEUP_PLAYERS]), msg=name)
+
+    def test_infeasible(self):
+        f = self.fixture
+        optimizer = SparseDfsOptimizer({'p1': f.players['p1']}, f.positions,
+                                       10)
+        self.assertRaises(OptimizerException, optimizer.optimize)
+        self.assertEqual(pulp.LpStatusInfeasible, optimizer.model.status)
+
+    def test_invalid_solver(self):
+        f = self.fixture
+        self.assertRaises(ValueError, SparseDfsOptimizer, f.players,
+                          f.positions, f.budget, solver=CbcSolver())
+        self.assertIsInstance(
+            SparseDfsOptimizer(f.players, f.positions, f.budget,
+                               solver=MilpSolver(presolve=False)).solver,
+            MilpSolver)
+
+
+if __name__ == '__main__':
+    unittest.main()
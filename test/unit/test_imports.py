@@ -0,0 +1,34 @@
+import json
+import subprocess
+import sys
+import unittest
+
+
+class TestImports(unittest.TestCase):
+    def imported(self, module, candidates):
+        code = 'import json, sys, {}; print(json.dumps([m for m in {!r} ' \
+               'if m in sys.modules]))'.format(module, candidates)
+        process = subprocess.run([sys.executable, '-c', code],
+                                 capture_output=True, text=True, check=True)
+        return json.loads(process.stdout)
+
+    def test_light_modules(self):
+        heavy = ['numpy', 'pandas', 'pulp']
+        for module in ['fantasyopt', 'fantasyopt.loader.yahoo',
+                       'fantasyopt.service']:
+            self.assertEqual([], self.imported(module, heavy), module)
+
+    def test_optional_solvers_not_imported(self):
+        self.assertEqual([], self.imported('fantasyopt.optimizer.dfs',
+                                           ['highspy', 'ortools', 'pandas']))
+
+    def test_lazy_attributes(self):
+        import fantasyopt
+        import fantasyopt.loader.yahoo as yh
+        from fantasyopt.sites import Site, Yahoo
+
+        self.assertIs(Yahoo, fantasyopt.SITE_DEFAULTS[Site.YAHOO])
+        self.assertIs(Site, fantasyopt.Site)
+        self.assertEqual('NflLoader', yh.nfl.NflLoader.__name__)
+        self.assertRaises(AttributeError, getattr, fantasyopt, 'missing')
+        self.assertRaises(AttributeError, getattr, yh, 'missing')
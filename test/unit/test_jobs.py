@@ -0,0 +1,58 @@
+import json
+import os
+import tempfile
+import unittest
+
+from fantasyopt.jobs import Job, read_job, run_job, write_results
+from fantasyopt.optimizer.batch import LineupSpec
+from fantasyopt.optimizer.dfs import DfsOptimizer
+from fantasyopt.slate import SlateSpec
+from test.unit.test_service import write_players
+
+
+class TestJobs(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.csv = os.path.join(self.directory.name, 'players.csv')
+        write_players(self.csv)
+        self.job = {
+            Job.SLATES: {
+                'week1': {SlateSpec.CSV: self.csv, SlateSpec.LEAGUE: 'NFL'}
+            },
+            Job.LINEUPS: [
+                {Job.SLATE: 'week1', Job.NAME: 'best'},
+                {Job.SLATE: 'week1',
+                 LineupSpec.IGNORE_PLAYERS: ['First Last1']},
+                {Job.SLATE: 'week1', LineupSpec.IGNORE_TEAMS: ['NYG']}
+            ]
+        }
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_run_job(self):
+        results = run_job(self.job, workers=1)
+
+        self.assertEqual(['best', 1, 2], [r[Job.NAME] for r in results])
+        self.assertIn('nfl.p.1', results[0][DfsOptimizer.LINEUP_PLAYERS])
+        self.assertNotIn('nfl.p.1', results[1][DfsOptimizer.LINEUP_PLAYERS])
+        self.assertEqual(9, len(results[1][DfsOptimizer.LINEUP_PLAYERS]))
+        # IND has only one running back, so no lineup avoids NYG
+        self.assertEqual([], results[2][DfsOptimizer.LINEUP_PLAYERS])
+        self.assertIsNone(results[2][DfsOptimizer.LINEUP_POINTS])
+
+    def test_unknown_slate(self):
+        self.job[Job.LINEUPS].append({Job.SLATE: 'week2'})
+        self.assertRaises(ValueError, run_job, self.job, 1)
+
+    def test_read_and_write(self):
+        output = os.path.join(self.directory.name, 'output.json')
+        for name in ['job.json', 'job.yaml']:
+            job_file = os.path.join(self.directory.name, name)
+            with open(job_file, 'w') as outfile:
+                json.dump(self.job, outfile)
+            self.assertDictEqual(self.job, read_job(job_file))
+
+        write_results(output, run_job(self.job, workers=1))
+        with open(output) as infile:
+            self.assertEqual(3, len(json.load(infile)))
@@ -0,0 +1,57 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from test.unit.fixtures import OptimizerFixture
+from fantasyopt.player import Player
+from fantasyopt.pool import PlayerPool
+
+
+class TestPlayerPool(unittest.TestCase):
+    def setUp(self):
+        self.fixture = OptimizerFixture()
+        self.players = self.fixture.players
+        self.pool = PlayerPool.from_dict(self.players)
+
+    def test_from_dict_round_trip(self):
+        self.assertEqual(list(self.players), self.pool.ids)
+        self.assertEqual(len(self.players), len(self.pool))
+        self.assertDictEqual(self.players, self.pool.to_dict())
+        self.assertDictEqual(self.players['p3'], self.pool['p3'])
+        self.assertTrue('p3' in self.pool)
+        self.assertFalse('p10' in self.pool)
+
+    def test_from_dict_missing_attribute(self):
+        del self.players['p2'][Player.SALARY]
+        self.assertRaises(ValueError, PlayerPool.from_dict, self.players)
+
+    def test_column_length_mismatch(self):
+        columns = {attr: [self.players[p][attr] for p in self.players]
+                   for attr in PlayerPool.REQUIRED_ATTRIBUTES}
+        columns[Player.SALARY] = columns[Player.SALARY][:-1]
+        self.assertRaises(ValueError, PlayerPool, list(self.players),
+                          columns)
+
+    def test_categorical_codes(self):
+        teams = self.pool.column(Player.TEAM)
+        self.assertEqual([self.players[p][Player.TEAM] for p in self.players],
+                         teams.tolist())
+        self.assertEqual(np.int32, self.pool._codes[Player.TEAM].dtype)
+        self.assertEqual('i', self.pool.column(Player.SALARY).dtype.kind)
+
+    def test_groups(self):
+        for attr in [Player.POSITION, Player.TEAM, Player.NAME]:
+            correct = {}
+            for i, attributes in enumerate(self.players.values()):
+                correct.setdefault(attributes[attr], []).append(i)
+            groups = self.pool.groups(attr)
+            self.assertEqual(set(correct), set(groups))
+            for value, indices in groups.items():
+                self.assertEqual(correct[value], indices.tolist())
+
+    def test_from_dataframe(self):
+        df = pd.DataFrame.from_dict(self.players, orient='index')
+        df[Player.TEAM] = df[Player.TEAM].astype('category')
+        pool = PlayerPool.from_dataframe(df)
+        self.assertDictEqual(self.players, pool.to_dict())
@@ -0,0 +1,126 @@
+import json
+import logging
+import os
+import tempfile
+import unittest
+
+from test.unit.fixtures import OptimizerFixture
+from fantasyopt.loader.yahoo.nfl import NflLoader
+from fantasyopt.optimizer.cache import SolutionCache
+from fantasyopt.optimizer.dfs import DfsOptimizer
+from fantasyopt.profiling import JsonLinesSink, LoggingSink, Profiler, \
+    PrometheusSink
+from test.unit.test_service import write_players
+
+
+class TestProfiler(unittest.TestCase):
+    def setUp(self):
+        self.fixture = OptimizerFixture()
+        self.events = []
+        self.profiler = Profiler([self.events.append])
+
+    def optimizer(self, solution_cache=None):
+        f = self.fixture
+        return DfsOptimizer(f.players, f.positions, f.budget,
+                            f.flex_positions, f.utility_requirement,
+                            solution_cache=solution_cache,
+                            profiler=self.profiler)
+
+    def phases(self):
+        return [(event[Profiler.COMPONENT], event[Profiler.PHASE])
+                for event in self.events]
+
+    def test_optimizer_phases(self):
+        optimizer = self.optimizer()
+        self.assertListEqual([('DfsOptimizer', 'convert'),
+                              ('DfsOptimizer', 'build')], self.phases())
+        build = self.events[1]
+        self.assertEqual(len(self.fixture.players), self.events[0]['players'])
+        self.assertEqual(len(self.fixture.players), build['variables'])
+        self.assertEqual(len(optimizer.model.constraints),
+                         build['constraints'])
+
+        del self.events[:]
+        optimizer.ignore_player('player_2')
+        optimizer.optimize()
+        self.assertListEqual([('DfsOptimizer', 'ignore_players'),
+                              ('DfsOptimizer', 'solve'),
+                              ('DfsOptimizer', 'extract')], self.phases())
+        solve = self.events[1]
+        self.assertEqual('Optimal', solve['status'])
+        self.assertEqual(len(optimizer.model.constraints),
+                         solve['constraints'])
+        self.assertEqual('CbcSolver', solve['solver'])
+        for event in self.events:
+            self.assertGreaterEqual(event[Profiler.SECONDS], 0)
+
+    def test_cache_lookup(self):
+        cache = SolutionCache()
+        self.optimizer(cache).optimize()
+        del self.events[:]
+
+        self.optimizer(cache).optimize()
+        self.assertEqual(('DfsOptimizer', 'cache_lookup'), self.phases()[-1])
+        self.assertTrue(self.events[-1]['hit'])
+
+    def test_error(self):
+        with self.assertRaises(KeyError):
+            with self.profiler.phase('component', 'phase', size=1):
+                raise KeyError('key')
+        self.assertEqual(1, len(self.events))
+        self.assertEqual('KeyError', self.events[0][Profiler.ERROR])
+        self.assertEqual(1, self.events[0]['size'])
+
+    def test_loader_phases(self):
+        with tempfile.TemporaryDirectory() as directory:
+            csv = os.path.join(directory, 'players.csv')
+            write_players(csv)
+            loader = NflLoader.load_players(csv, profiler=self.profiler)
+            loader.get_player_pool()
+
+        self.assertListEqual([('PlayerLoader', 'read'),
+                              ('PlayerLoader', 'clean'),
+                              ('PlayerLoader', 'to_pool')], self.phases())
+        self.assertEqual(13, self.events[0]['rows'])
+        self.assertEqual(13, self.events[2]['players'])
+
+    def test_logging_sink(self):
+        self.profiler.sinks = [LoggingSink()]
+        with self.assertLogs('fantasyopt', logging.INFO) as logs:
+            self.optimizer()
+        self.assertEqual(2, len(logs.output))
+        self.assertIn('DfsOptimizer.build took', logs.output[1])
+        self.assertIn('variables=' + str(len(self.fixture.players)),
+                      logs.output[1])
+
+    def test_json_lines_sink(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, 'events.jsonl')
+            self.profiler.sinks = [JsonLinesSink(file_name)]
+            self.optimizer().optimize()
+            with open(file_name) as infile:
+                events = [json.loads(line) for line in infile]
+
+        self.assertListEqual(['convert', 'build', 'solve', 'extract'],
+                             [event[Profiler.PHASE] for event in events])
+        self.assertEqual('Optimal', events[2]['status'])
+
+    def test_prometheus_sink(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, 'fantasyopt.prom')
+            self.profiler.sinks = [PrometheusSink(file_name)]
+            optimizer = self.optimizer()
+            optimizer.optimize()
+            optimizer.optimize()
+            with open(file_name) as infile:
+                lines = infile.read().splitlines()
+            self.assertListEqual([file_name], [
+                os.path.join(directory, f) for f in os.listdir(directory)])
+
+        self.assertIn('fantasyopt_phase_calls_total{component="DfsOptimizer",'
+                      'phase="solve"} 2', lines)
+        self.assertIn('fantasyopt_solve_status_total{status="Optimal"} 2',
+                      lines)
+        self.assertIn('fantasyopt_model_variables ' +
+                      str(len(self.fixture.players)), lines)
+        self.assertIn('# TYPE fantasyopt_phase_seconds_total counter', lines)
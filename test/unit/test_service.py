@@ -0,0 +1,123 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+
+from fantasyopt.optimizer.batch import LineupSpec
+from fantasyopt.optimizer.dfs import DfsOptimizer
+from fantasyopt.service import OptimizationService, Request
+from fantasyopt.slate import SlateSpec
+
+PLAYERS = [
+    ('1', 'QB', 'NYG', 'IND', 30, 20.0),
+    ('2', 'QB', 'IND', 'NYG', 25, 18.0),
+    ('3', 'RB', 'NYG', 'IND', 20, 15.0),
+    ('4', 'RB', 'IND', 'NYG', 20, 14.0),
+    ('5', 'RB', 'NYG', 'IND', 15, 10.0),
+    ('6', 'WR', 'IND', 'NYG', 20, 13.0),
+    ('7', 'WR', 'NYG', 'IND', 18, 12.0),
+    ('8', 'WR', 'IND', 'NYG', 15, 9.0),
+    ('9', 'WR', 'NYG', 'IND', 12, 8.0),
+    ('10', 'TE', 'IND', 'NYG', 15, 9.0),
+    ('11', 'TE', 'NYG', 'IND', 10, 6.0),
+    ('12', 'DEF', 'IND', 'NYG', 10, 7.0),
+    ('13', 'DEF', 'NYG', 'IND', 12, 8.0)
+]
+
+
+def write_players(file_name):
+    with open(file_name, 'w') as outfile:
+        outfile.write('Id,First Name,Last Name,Position,Team,Opponent,Game,'
+                      'Time,Salary,FPPG,Injury Status,Starting\n')
+        for i, position, team, opponent, salary, points in PLAYERS:
+            outfile.write('nfl.p.{},First,Last{},{},{},{},NYG@IND,'
+                          '1:00PM EST,{},{}," ",No\n'.format(
+                              i, i, position, team, opponent, salary,
+                              points))
+
+
+class TestOptimizationService(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.csv = os.path.join(self.directory.name, 'players.csv')
+        write_players(self.csv)
+        self.service = OptimizationService(
+            1, os.path.join(self.directory.name, 'cache'))
+        self.definition = {SlateSpec.CSV: self.csv, SlateSpec.LEAGUE: 'NFL'}
+
+    def tearDown(self):
+        self.service.close()
+        self.directory.cleanup()
+
+    def test_handle(self):
+        async def run():
+            loaded = await self.service.handle({
+                Request.ACTION: Request.LOAD, Request.SLATE: 'week1',
+                Request.DEFINITION: self.definition})
+            best = await self.service.handle({
+                Request.ACTION: Request.OPTIMIZE, Request.SLATE: 'week1'})
+            without = await self.service.handle({
+                Request.ACTION: Request.OPTIMIZE, Request.SLATE: 'week1',
+                Request.SPEC: {LineupSpec.IGNORE_PLAYERS: ['First Last1']}})
+            again = await self.service.handle({
+                Request.ACTION: Request.OPTIMIZE, Request.SLATE: 'week1'})
+            slates = await self.service.handle({
+                Request.ACTION: Request.SLATES})
+            return loaded, best, without, again, slates
+
+        loaded, best, without, again, slates = asyncio.run(run())
+        self.assertDictEqual({'slate': 'week1', 'players': len(PLAYERS)},
+                             loaded)
+        self.assertEqual(9, len(best[DfsOptimizer.LINEUP_PLAYERS]))
+        self.assertIn('nfl.p.1', best[DfsOptimizer.LINEUP_PLAYERS])
+        self.assertNotIn('nfl.p.1', without[DfsOptimizer.LINEUP_PLAYERS])
+        self.assertDictEqual(best, again)
+        self.assertEqual(1, len(best['lineup']['QB']))
+        self.assertDictEqual({'slates': ['week1']}, slates)
+
+    def test_handle_errors(self):
+        async def run():
+            return [await self.service.handle(request) for request in [
+                {Request.ACTION: Request.OPTIMIZE, Request.SLATE: 'missing'},
+                {Request.ACTION: Request.LOAD, Request.SLATE: 'bad',
+                 Request.DEFINITION: {SlateSpec.LEAGUE: 'NFL'}},
+                {Request.ACTION: 'unknown', Request.SLATE: 'week1'},
+                [1],
+                {Request.ACTION: Request.LOAD, Request.SLATE: 'week1',
+                 Request.DEFINITION: self.definition},
+                {Request.ACTION: Request.OPTIMIZE, Request.SLATE: 'week1',
+                 Request.SPEC: {LineupSpec.MAX_PLAYERS_FROM_SAME_TEAM: '2'}}
+            ]]
+
+        responses = asyncio.run(run())
+        self.assertNotIn('error', responses[4])
+        for response in responses[:4] + responses[5:]:
+            self.assertIn('error', response)
+
+    def test_serve_connection(self):
+        async def run():
+            server = await asyncio.start_server(
+                self.service.serve_connection, '127.0.0.1', 0)
+            port = server.sockets[0].getsockname()[1]
+            async with server:
+                reader, writer = await asyncio.open_connection('127.0.0.1',
+                                                               port)
+                writer.write(json.dumps({
+                    Request.ACTION: Request.LOAD, Request.SLATE: 'week1',
+                    Request.DEFINITION: self.definition}).encode() + b'\n')
+                writer.write(b'not json\n')
+                writer.write(json.dumps({
+                    Request.ACTION: Request.OPTIMIZE,
+                    Request.SLATE: 'week1'}).encode() + b'\n')
+                await writer.drain()
+                responses = [json.loads(await reader.readline())
+                             for i in range(3)]
+                writer.close()
+                await writer.wait_closed()
+            return responses
+
+        loaded, invalid, best = asyncio.run(run())
+        self.assertEqual(len(PLAYERS), loaded['players'])
+        self.assertIn('error', invalid)
+        self.assertEqual(9, len(best[DfsOptimizer.LINEUP_PLAYERS]))
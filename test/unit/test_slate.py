@@ -0,0 +1,24 @@
+import unittest
+
+from fantasyopt import SITE_DEFAULTS, League, Site
+from fantasyopt.slate import SlateSpec, build_optimizer, roster
+
+
+class TestSlate(unittest.TestCase):
+    def test_roster(self):
+        yahoo = SITE_DEFAULTS[Site.YAHOO]
+        self.assertEqual((yahoo.NBA_POSITIONS, yahoo.NBA_BUDGET,
+                          yahoo.NBA_FLEX_POSITIONS,
+                          yahoo.NBA_UTILITY_POSITIONS),
+                         roster(Site.YAHOO, League.NBA))
+        self.assertRaises(ValueError, roster, Site.YAHOO, League.MLB)
+
+    def test_build_optimizer_invalid(self):
+        self.assertRaises(ValueError, build_optimizer,
+                          {SlateSpec.LEAGUE: 'NFL'})
+        self.assertRaises(ValueError, build_optimizer,
+                          {SlateSpec.CSV: 'players.csv',
+                           SlateSpec.LEAGUE: 'XFL'})
+        self.assertRaises(ValueError, build_optimizer,
+                          {SlateSpec.CSV: 'players.csv',
+                           SlateSpec.LEAGUE: 'NFL', SlateSpec.SITE: 'Other'})